@@ -14,16 +14,124 @@ Estructura del proyecto:
 - TP5: Eventos estocásticos
 
 Uso: python main.py
+     python main.py --render DIRECTORIO [--formato png svg] [--workers N]
+     python main.py --tiempo-inicio
+     python main.py listar
+     python main.py run TP [ESCENARIO] [--dist D] [--n N] [--semilla S] [--motor M]
+                    [--muestreo M] [--workers N] [--out DIRECTORIO] [--formato png svg]
+                    [--guardar DIRECTORIO]
+
+Los TPs (y matplotlib) se importan recién al elegir una opción, así que el
+menú aparece enseguida.
 """
 
+import time
+
+_INICIO = time.perf_counter()
+
+import argparse
+import importlib
 import sys
 import os
-import numpy as np
-import matplotlib.pyplot as plt
-from typing import Dict, List, Callable
+from typing import Dict, List, Callable, Optional
+
+from utils.render import renderizar_en_paralelo, FORMATOS
+
+
+class FuncionPerezosa:
+    """
+    Referencia a una función de un TP que importa su módulo recién al llamarla.
+
+    Así el menú arranca sin importar los TPs (ni matplotlib, que cargan al
+    graficar). Se puede enviar a otro proceso, como necesita --render.
+    """
+
+    def __init__(self, modulo: str, nombre: str, **argumentos):
+        self.modulo = modulo
+        self.nombre = nombre
+        self.argumentos = argumentos
+
+    def __call__(self):
+        funcion = getattr(importlib.import_module(self.modulo), self.nombre)
+        return funcion(**self.argumentos)
+
+    def __repr__(self) -> str:
+        return f"FuncionPerezosa({self.modulo}.{self.nombre})"
+
+
+def _tp(modulo: str, nombre: str, **argumentos) -> FuncionPerezosa:
+    """Función perezosa del módulo tps.<modulo>."""
+    return FuncionPerezosa(f"tps.{modulo}", nombre, **argumentos)
 
-# Importar módulos del proyecto
-from tps import tp1_diseño, tp2_perdidas, tp2_hielo, tp3_graficos, tp4_familias, tp5_estocasticos
+
+# Funciones de gráficos que se pueden generar sin pantalla (--render). Las de
+# Monte Carlo usan un solo proceso: el paralelismo ya está entre gráficos.
+TAREAS_GRAFICOS = {
+    'tp1': _tp('tp1_diseño', 'ejecutar_tp1'),
+    'tp2_perdidas': _tp('tp2_perdidas', 'ejecutar_tp2'),
+    'tp2_hielo': _tp('tp2_hielo', 'ejecutar_tp2_hielo'),
+    'tp3_sin_perdidas': _tp('tp3_graficos', 'grafico_sin_perdidas'),
+    'tp3_con_perdidas': _tp('tp3_graficos', 'grafico_con_perdidas'),
+    'tp3_comparacion': _tp('tp3_graficos', 'comparacion_completa'),
+    'tp4a_resistencias': _tp('tp4_familias', 'ejecutar_tp4_resistencias'),
+    'tp4b_temperaturas_iniciales': _tp('tp4_familias', 'ejecutar_tp4_temperaturas_iniciales'),
+    'tp4c_temperaturas_ambiente': _tp('tp4_familias', 'ejecutar_tp4_temperaturas_ambiente'),
+    'tp4d_tensiones': _tp('tp4_familias', 'ejecutar_tp4_tensiones_12v'),
+    'tp4e_muestreo': _tp('tp4_familias', 'ejecutar_tp4_comparacion_muestreo'),
+    'tp4f_sensibilidad': _tp('tp4_familias', 'ejecutar_tp4_sensibilidad'),
+    'tp5_evento_basico': _tp('tp5_estocasticos', 'ejecutar_tp5_evento_basico'),
+    'tp5_multiples': _tp('tp5_estocasticos', 'ejecutar_tp5_multiples_simulaciones', workers=1),
+    'tp5_percentiles': _tp('tp5_estocasticos', 'ejecutar_tp5_percentiles', workers=1),
+    'tp5_convergencia': _tp('tp5_estocasticos', 'ejecutar_tp5_convergencia', workers=1),
+    'tp5_densidad': _tp('tp5_estocasticos', 'ejecutar_tp5_densidad', n_simulaciones=20_000, workers=1),
+    'tp5_tp4_con_eventos': _tp('tp5_estocasticos', 'ejecutar_tp5_tp4_con_eventos'),
+}
+
+
+# Escenarios de `main.py run`: tp -> escenario -> (módulo, función, opciones).
+# Las opciones traducen cada opción de la línea de comandos al argumento de la
+# función; el primer escenario de cada TP es el que se usa si no se indica otro.
+ESCENARIOS = {
+    'tp1': {
+        'diseño': ('tp1_diseño', 'ejecutar_tp1', {}),
+    },
+    'tp2': {
+        'perdidas': ('tp2_perdidas', 'ejecutar_tp2', {}),
+        'hielo': ('tp2_hielo', 'ejecutar_tp2_hielo', {}),
+    },
+    'tp3': {
+        'comparacion': ('tp3_graficos', 'comparacion_completa', {}),
+        'sin_perdidas': ('tp3_graficos', 'grafico_sin_perdidas', {}),
+        'con_perdidas': ('tp3_graficos', 'grafico_con_perdidas', {}),
+        'hielo': ('tp3_graficos', 'grafico_con_hielo', {}),
+        'personalizado': ('tp3_graficos', 'grafico_personalizado', {}),
+    },
+    'tp4': {
+        'familia': ('tp4_familias', 'ejecutar_tp4_familia',
+                    {'dist': 'distribucion', 'n': 'n', 'semilla': 'semilla', 'motor': 'motor',
+                     'muestreo': 'metodo', 'workers': 'workers', 'guardar': 'guardar'}),
+        'muestreo': ('tp4_familias', 'ejecutar_tp4_comparacion_muestreo',
+                     {'n': 'repeticiones', 'semilla': 'semilla'}),
+        'sensibilidad': ('tp4_familias', 'ejecutar_tp4_sensibilidad', {'n': 'n', 'semilla': 'semilla'}),
+    },
+    'tp5': {
+        'multiples': ('tp5_estocasticos', 'ejecutar_tp5_multiples_simulaciones',
+                      {'n': 'n_simulaciones', 'semilla': 'semilla', 'workers': 'workers'}),
+        'basico': ('tp5_estocasticos', 'ejecutar_tp5_evento_basico', {}),
+        'percentiles': ('tp5_estocasticos', 'ejecutar_tp5_percentiles',
+                        {'n': 'n_simulaciones', 'semilla': 'semilla', 'workers': 'workers'}),
+        'densidad': ('tp5_estocasticos', 'ejecutar_tp5_densidad',
+                     {'n': 'n_simulaciones', 'semilla': 'semilla', 'workers': 'workers',
+                      'guardar': 'guardar'}),
+        'convergencia': ('tp5_estocasticos', 'ejecutar_tp5_convergencia',
+                         {'semilla': 'semilla', 'workers': 'workers'}),
+        'tp4_con_eventos': ('tp5_estocasticos', 'ejecutar_tp5_tp4_con_eventos',
+                            {'dist': 'distribucion', 'semilla': 'semilla'}),
+    },
+}
+
+# Opciones de `run` que se pasan al escenario (las demás son de salida)
+OPCIONES_ESCENARIO = ('dist', 'n', 'semilla', 'motor', 'muestreo', 'workers', 'guardar')
 
 
 class MenuPrincipal:
@@ -34,38 +142,44 @@ class MenuPrincipal:
             "1": {
                 "titulo": "TP 1 - Diseño de Parámetros del Calentador",
                 "opciones": {
-                    "1": ("Ejecutar TP1 completo", tp1_diseño.ejecutar_tp1),
+                    "1": ("Ejecutar TP1 completo", _tp('tp1_diseño', 'ejecutar_tp1')),
                 }
             },
             "2": {
                 "titulo": "TP 2 - Cálculo de Pérdidas Térmicas",
                 "opciones": {
-                    "1": ("Ejecutar TP2 - Cálculo de pérdidas", tp2_perdidas.ejecutar_tp2),
-                    "2": ("EXTRA - Simulación con hielo", tp2_hielo.ejecutar_tp2_hielo),
+                    "1": ("Ejecutar TP2 - Cálculo de pérdidas", _tp('tp2_perdidas', 'ejecutar_tp2')),
+                    "2": ("EXTRA - Simulación con hielo", _tp('tp2_hielo', 'ejecutar_tp2_hielo')),
                 }
             },
             "3": {
                 "titulo": "TP 3 - Gráficos de Temperatura",
                 "opciones": {
-                    "1": ("Ejecutar TP3 - Gráficos básicos", tp3_graficos.ejecutar_tp3),
-                    "2": ("Comparación completa de gráficos", tp3_graficos.ejecutar_comparacion_completa),
+                    "1": ("Ejecutar TP3 - Gráficos básicos", _tp('tp3_graficos', 'ejecutar_tp3')),
+                    "2": ("Comparación completa de gráficos", _tp('tp3_graficos', 'ejecutar_comparacion_completa')),
                 }
             },
             "4": {
                 "titulo": "TP 4 - Familias de Curvas con Distribuciones",
                 "opciones": {
-                    "1": ("4.A - Distribución uniforme de resistencias", tp4_familias.ejecutar_tp4_resistencias),
-                    "2": ("4.B - Distribución normal de temperaturas iniciales", tp4_familias.ejecutar_tp4_temperaturas_iniciales),
-                    "3": ("4.C - Distribución uniforme de temperaturas ambiente", tp4_familias.ejecutar_tp4_temperaturas_ambiente),
-                    "4": ("4.D - Distribución normal de tensiones (12V)", tp4_familias.ejecutar_tp4_tensiones_12v),
-                    "5": ("4.E - Información del TP4", tp4_familias.mostrar_info_tp4),
+                    "1": ("4.A - Distribución uniforme de resistencias", _tp('tp4_familias', 'ejecutar_tp4_resistencias')),
+                    "2": ("4.B - Distribución normal de temperaturas iniciales", _tp('tp4_familias', 'ejecutar_tp4_temperaturas_iniciales')),
+                    "3": ("4.C - Distribución uniforme de temperaturas ambiente", _tp('tp4_familias', 'ejecutar_tp4_temperaturas_ambiente')),
+                    "4": ("4.D - Distribución normal de tensiones (12V)", _tp('tp4_familias', 'ejecutar_tp4_tensiones_12v')),
+                    "5": ("4.E - Comparación de métodos de muestreo", _tp('tp4_familias', 'ejecutar_tp4_comparacion_muestreo')),
+                    "6": ("4.F - Análisis de sensibilidad global (índices de Sobol)", _tp('tp4_familias', 'ejecutar_tp4_sensibilidad')),
+                    "7": ("4.G - Información del TP4", _tp('tp4_familias', 'mostrar_info_tp4')),
                 }
             },
             "5": {
                 "titulo": "TP 5 - Eventos Estocásticos",
                 "opciones": {
-                    "1": ("5.1 - Simulación básica con eventos estocásticos", tp5_estocasticos.ejecutar_tp5_evento_basico),
-                    "2": ("5.2 - Múltiples simulaciones estocásticas", tp5_estocasticos.ejecutar_tp5_multiples_simulaciones),
+                    "1": ("5.1 - Simulación básica con eventos estocásticos", _tp('tp5_estocasticos', 'ejecutar_tp5_evento_basico')),
+                    "2": ("5.2 - Múltiples simulaciones estocásticas", _tp('tp5_estocasticos', 'ejecutar_tp5_multiples_simulaciones')),
+                    "3": ("5.3 - Percentiles del ensamble (abanico)", _tp('tp5_estocasticos', 'ejecutar_tp5_percentiles')),
+                    "4": ("5.4 - Monte Carlo hasta convergencia", _tp('tp5_estocasticos', 'ejecutar_tp5_convergencia')),
+                    "5": ("5.5 - Densidad de un ensamble grande (imagen)", _tp('tp5_estocasticos', 'ejecutar_tp5_densidad')),
+                    "6": ("5.6 - Familias del TP4 con eventos estocásticos", _tp('tp5_estocasticos', 'ejecutar_tp5_tp4_con_eventos')),
                 }
             }
         }
@@ -158,8 +272,157 @@ class MenuPrincipal:
                     input("Presiona Enter para continuar...")
 
 
+def renderizar_graficos(directorio: str, formatos: List[str], workers: int = None):
+    """Genera todos los gráficos de los TPs como archivos, sin pantalla ni pausas."""
+    print(f"🖼️ Generando {len(TAREAS_GRAFICOS)} gráficos en {directorio}...")
+    archivos = renderizar_en_paralelo(TAREAS_GRAFICOS, directorio, formatos, workers=workers)
+    for nombre, rutas in archivos.items():
+        print(f"  {nombre}: {len(rutas)} archivo(s)")
+    print(f"✅ {sum(len(rutas) for rutas in archivos.values())} archivos escritos")
+
+
+def listar_escenarios():
+    """Muestra los escenarios de `run` y las opciones que admite cada uno."""
+    for tp, escenarios in ESCENARIOS.items():
+        print(f"{tp}:")
+        for escenario, (modulo, nombre, opciones) in escenarios.items():
+            admitidas = ' '.join(f"--{opcion}" for opcion in opciones) or '(sin opciones)'
+            print(f"  {escenario:<14} {admitidas}")
+
+
+def preparar_escenario(tp: str, escenario: Optional[str], opciones: Dict) -> FuncionPerezosa:
+    """
+    Arma la función de un escenario con las opciones de la línea de comandos.
+    
+    Args:
+        tp: Clave de ESCENARIOS ('tp1' ... 'tp5')
+        escenario: Escenario del TP (None = el primero)
+        opciones: Opciones de OPCIONES_ESCENARIO; las que valen None no se pasan
+            y la función usa su valor por defecto
+    
+    Returns:
+        FuncionPerezosa lista para ejecutar
+    
+    Raises:
+        ValueError: Si el escenario no existe o no admite alguna opción
+    """
+    escenarios = ESCENARIOS[tp]
+    escenario = escenario or next(iter(escenarios))
+    if escenario not in escenarios:
+        raise ValueError(f"{tp} no tiene el escenario '{escenario}' (opciones: {', '.join(escenarios)})")
+    
+    modulo, nombre, admitidas = escenarios[escenario]
+    argumentos = {}
+    for opcion, valor in opciones.items():
+        if valor is None:
+            continue
+        if opcion not in admitidas:
+            raise ValueError(f"El escenario {tp} {escenario} no admite --{opcion}")
+        argumentos[admitidas[opcion]] = valor
+    return _tp(modulo, nombre, **argumentos)
+
+
+def ejecutar_escenario(tp: str, escenario: Optional[str], opciones: Dict, directorio: str,
+                       formatos: List[str], dpi: int = 100) -> List[str]:
+    """
+    Ejecuta un escenario sin pantalla: guarda sus gráficos y nunca lee la entrada estándar.
+    
+    Returns:
+        Lista de archivos escritos
+    """
+    funcion = preparar_escenario(tp, escenario, opciones)
+    nombre = f"{tp}_{escenario or next(iter(ESCENARIOS[tp]))}"
+    print(f"🚀 Ejecutando {nombre}: {funcion}")
+    
+    # input() ya devuelve '' en modo headless; además se corta stdin por si algo lo lee directo
+    stdin_original = sys.stdin
+    sys.stdin = open(os.devnull)
+    try:
+        archivos = renderizar_en_paralelo({nombre: funcion}, directorio, formatos, dpi,
+                                          workers=1, silenciar=False)[nombre]
+    finally:
+        sys.stdin.close()
+        sys.stdin = stdin_original
+    
+    print(f"✅ {len(archivos)} archivo(s) en {os.path.abspath(directorio)}")
+    return archivos
+
+
+def tiempo_hasta_menu() -> float:
+    """Segundos desde que empezó a cargarse main.py hasta tener el menú listo."""
+    MenuPrincipal()
+    return time.perf_counter() - _INICIO
+
+
+def informar_inicio():
+    """Muestra el tiempo de arranque y qué módulos pesados ya están cargados."""
+    segundos = tiempo_hasta_menu()
+    print(f"⏱️ Tiempo hasta el menú: {segundos * 1000:.1f} ms (sin contar el arranque de Python)")
+    for modulo in ('numpy', 'matplotlib', 'tps.tp4_familias'):
+        print(f"  {modulo}: {'cargado' if modulo in sys.modules else 'sin cargar'}")
+
+
 def main():
     """Función principal del programa."""
+    parser = argparse.ArgumentParser(description="Simulador de calentador eléctrico")
+    parser.add_argument('--render', metavar='DIRECTORIO',
+                        help="Genera todos los gráficos como archivos (sin pantalla) y termina")
+    parser.add_argument('--formato', nargs='+', choices=FORMATOS, default=['png'],
+                        help="Formatos de los archivos generados con --render")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Procesos para --render (por defecto, uno por núcleo)")
+    parser.add_argument('--tiempo-inicio', action='store_true',
+                        help="Muestra cuánto tarda en estar listo el menú y termina")
+    
+    # Sin subcomando se abre el menú interactivo
+    subcomandos = parser.add_subparsers(dest='comando', metavar='{run,listar}')
+    subcomandos.add_parser('listar', help="Lista los escenarios de run y sus opciones")
+    
+    run = subcomandos.add_parser('run', help="Ejecuta un escenario sin pantalla ni preguntas")
+    run.add_argument('tp', choices=list(ESCENARIOS), help="Trabajo práctico")
+    run.add_argument('escenario', nargs='?', default=None,
+                     help="Escenario del TP (ver `listar`; por defecto, el primero)")
+    run.add_argument('--dist', help="Distribución de la familia (TP4 y TP5 tp4_con_eventos)")
+    run.add_argument('--n', type=int, help="Cantidad de muestras o simulaciones")
+    run.add_argument('--semilla', type=int, help="Semilla de los números aleatorios")
+    run.add_argument('--motor', choices=['euler', 'analitico'], help="Motor de simulación (TP4)")
+    run.add_argument('--muestreo', choices=['mc', 'lhs', 'sobol'], help="Método de muestreo (TP4)")
+    run.add_argument('--workers', type=int, default=argparse.SUPPRESS,
+                     help="Procesos del escenario (por defecto, uno por núcleo)")
+    run.add_argument('--out', default='resultados', help="Carpeta de salida (por defecto, resultados/)")
+    run.add_argument('--formato', nargs='+', choices=FORMATOS, default=argparse.SUPPRESS,
+                     help="Formatos de los gráficos (por defecto, png)")
+    run.add_argument('--dpi', type=int, default=100, help="Resolución de los PNG")
+    run.add_argument('--guardar', metavar='DIRECTORIO',
+                     help="Guarda las trayectorias en un archivo de resultados (utils.resultados)")
+    argumentos = parser.parse_args()
+
+    if argumentos.tiempo_inicio:
+        informar_inicio()
+        return
+
+    if argumentos.render:
+        renderizar_graficos(argumentos.render, argumentos.formato, argumentos.workers)
+        return
+    
+    if argumentos.comando == 'listar':
+        listar_escenarios()
+        return
+    
+    if argumentos.comando == 'run':
+        opciones = {opcion: getattr(argumentos, opcion) for opcion in OPCIONES_ESCENARIO}
+        try:
+            preparar_escenario(argumentos.tp, argumentos.escenario, opciones)
+        except ValueError as e:
+            run.error(str(e))
+        try:
+            ejecutar_escenario(argumentos.tp, argumentos.escenario, opciones, argumentos.out,
+                               argumentos.formato, argumentos.dpi)
+        except Exception as e:
+            print(f"❌ Error durante la ejecución: {e}", file=sys.stderr)
+            sys.exit(1)
+        return
+
     try:
         menu = MenuPrincipal()
         menu.ejecutar()
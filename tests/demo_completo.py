@@ -127,9 +127,7 @@ def demo_tension_resistencia():
     simulaciones = []
     
     for tension in tensiones:
-        params = HeatSimulationParameters(tension=tension, resistencia=resistencia)
-        params.usar_tension_resistencia = True
-        params._calcular_parametros_derivados()
+        params = HeatSimulationParameters().con_potencia_desde_tension(tension, resistencia)
         
         simulator = HeatSimulator(params)
         tiempos, temperaturas = simulator.simular()
@@ -0,0 +1,167 @@
+"""
+Pruebas de la caché de simulaciones de utils.cache.
+"""
+import os
+import sys
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import matplotlib
+matplotlib.use('Agg')
+import numpy as np
+from utils import render
+from utils.heat_simulation import HeatSimulationParameters, HeatSimulator
+from utils.cache import CacheSimulaciones, cache_global, clave_simulacion, simular_cacheado
+
+
+def test_clave_estable():
+    """Escenarios idénticos comparten clave; cualquier diferencia la cambia."""
+    print("✓ Probando clave_simulacion...")
+
+    clave = clave_simulacion(HeatSimulationParameters(T_amb=5), parar_en_100c=True)
+    assert clave == clave_simulacion(HeatSimulationParameters(T_amb=np.float64(5)), parar_en_100c=True), \
+        "Parámetros iguales deberían dar la misma clave"
+    assert clave != clave_simulacion(HeatSimulationParameters(T_amb=6), parar_en_100c=True), "Parámetros distintos"
+    assert clave != clave_simulacion(HeatSimulationParameters(T_amb=5), parar_en_100c=False), "Opciones distintas"
+    assert clave != clave_simulacion(HeatSimulationParameters(T_amb=5), semilla=1, parar_en_100c=True), "Semilla distinta"
+
+
+def test_lru_en_memoria():
+    """Los resultados se reutilizan, son de solo lectura y el LRU desaloja el menos usado."""
+    print("✓ Probando nivel en memoria...")
+
+    cache = CacheSimulaciones(max_items=2)
+    params = HeatSimulationParameters(tiempo_total=3600)
+    tiempos, temperaturas = simular_cacheado(params, cache=cache)
+    esperado = HeatSimulator(params).simular()
+    assert np.array_equal(temperaturas, esperado[1]), "Resultado distinto al del simulador"
+    assert not temperaturas.flags.writeable, "Los resultados cacheados deben ser de solo lectura"
+
+    assert simular_cacheado(params, cache=cache)[1] is temperaturas, "Debería reutilizarse el resultado"
+    assert (cache.aciertos, cache.fallos) == (1, 1), "Aciertos y fallos mal contados"
+
+    evento = {'probabilidad': 1/300}
+    con_semilla = simular_cacheado(params, evento, semilla=3, cache=cache)
+    assert simular_cacheado(params, evento, semilla=3, cache=cache) is con_semilla, "Con semilla se debe cachear"
+    simular_cacheado(params, evento, cache=cache)
+    assert len(cache._memoria) == 2, "Sin semilla los eventos no se deben cachear"
+
+    simular_cacheado(params, motor='analitico', cache=cache)
+    assert simular_cacheado(params, cache=cache)[1] is not temperaturas, "El LRU debería haber desalojado"
+
+
+def test_nivel_en_disco():
+    """El nivel en disco sobrevive a la memoria y respeta el tamaño máximo."""
+    print("✓ Probando nivel en disco...")
+
+    with tempfile.TemporaryDirectory() as directorio:
+        cache = CacheSimulaciones(max_items=1, directorio=directorio, max_bytes=45_000)
+        params = [HeatSimulationParameters(T_inicial=T, tiempo_total=3600) for T in (10, 20, 30)]
+        resultados = [simular_cacheado(p, cache=cache) for p in params]
+
+        # Cada trayectoria ocupa unos 17-20 KB: la más antigua se desaloja del disco
+        archivos = [n for n in os.listdir(directorio) if n.endswith('.npz')]
+        assert len(archivos) == 2, f"El disco debería conservar 2 resultados, hay {len(archivos)}"
+
+        otra = CacheSimulaciones(directorio=directorio, max_bytes=45_000)
+        recuperado = simular_cacheado(params[2], cache=otra)
+        assert otra.aciertos == 1 and np.array_equal(recuperado[1], resultados[2][1]), "No se leyó del disco"
+        simular_cacheado(params[0], cache=otra)
+        assert otra.fallos == 1, "El resultado desalojado no debería estar en disco"
+
+
+def test_disco_dañado_o_desalojado():
+    """Un .npz truncado o borrado por otro proceso durante la lectura cuenta como fallo."""
+    print("✓ Probando archivos de caché dañados o desalojados...")
+
+    params = HeatSimulationParameters(tiempo_total=300)
+    with tempfile.TemporaryDirectory() as directorio:
+        cache = CacheSimulaciones(directorio=directorio)
+        simular_cacheado(params, cache=cache)
+        clave = clave_simulacion(params, parar_en_100c=True)
+        ruta = cache._ruta(clave)
+
+        # Truncado: np.load lanza BadZipFile
+        with open(ruta, 'r+b') as archivo:
+            archivo.truncate(os.path.getsize(ruta) // 2)
+        cache.limpiar()
+        assert cache.obtener(clave) is None, "Un archivo truncado debería ser un fallo"
+        assert not os.path.exists(ruta), "El archivo dañado debería borrarse"
+
+        # Desalojado por otro proceso entre la lectura y la marca de uso
+        simular_cacheado(params, cache=cache)
+        cache.limpiar()
+        utime_original = os.utime
+
+        def desalojar(ruta_tocada, *args, **kwargs):
+            os.remove(ruta_tocada)
+            return utime_original(ruta_tocada, *args, **kwargs)
+
+        os.utime = desalojar
+        try:
+            assert cache.obtener(clave) is None, "Un archivo desalojado debería ser un fallo"
+        finally:
+            os.utime = utime_original
+
+
+def test_tp3_reutiliza_tp2():
+    """Los gráficos del TP3 sin y con pérdidas usan los mismos escenarios (y motor) que el TP2."""
+    print("✓ Probando que el TP3 reutiliza las simulaciones del TP2...")
+
+    from tps import tp2_perdidas, tp3_graficos
+
+    cache = cache_global()
+    cache.limpiar()
+    tp2_perdidas.simular_sin_perdidas()
+    tp2_perdidas.simular_con_perdidas()
+    aciertos, fallos = cache.aciertos, cache.fallos
+
+    with tempfile.TemporaryDirectory() as directorio:
+        render.configurar_render(directorio)
+        try:
+            tp3_graficos.grafico_sin_perdidas()
+            tp3_graficos.grafico_con_perdidas()
+        finally:
+            render.desactivar_render()
+    assert (cache.aciertos - aciertos, cache.fallos - fallos) == (2, 0), \
+        "El TP3 debería encontrar en la caché los dos escenarios del TP2"
+
+
+def test_tp5_tp4_con_eventos_reutiliza():
+    """Repetir una familia del TP4 con eventos y la misma semilla sale entera de la caché."""
+    print("✓ Probando que el TP4 con eventos del TP5 usa la caché...")
+
+    from tps import tp5_estocasticos
+
+    cache = cache_global()
+    cache.limpiar()
+    aciertos, fallos = cache.aciertos, cache.fallos
+    with tempfile.TemporaryDirectory() as directorio:
+        render.configurar_render(directorio)
+        try:
+            _, primera = tp5_estocasticos.ejecutar_tp5_tp4_con_eventos('resistencias', semilla=7)
+            assert (cache.aciertos - aciertos, cache.fallos - fallos) == (0, 10), \
+                "La primera corrida simula 5 curvas sin y con eventos"
+            aciertos, fallos = cache.aciertos, cache.fallos
+            _, segunda = tp5_estocasticos.ejecutar_tp5_tp4_con_eventos('resistencias', semilla=7)
+        finally:
+            render.desactivar_render()
+    assert (cache.aciertos - aciertos, cache.fallos - fallos) == (10, 0), \
+        "La segunda corrida debería salir entera de la caché"
+    for (_, T1, etiqueta1), (_, T2, etiqueta2) in zip(primera, segunda):
+        assert etiqueta1 == etiqueta2 and np.array_equal(T1, T2), "La misma semilla debe dar la misma familia"
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("PRUEBAS DE CACHÉ DE SIMULACIONES")
+    print("=" * 60)
+
+    test_clave_estable()
+    test_lru_en_memoria()
+    test_nivel_en_disco()
+    test_disco_dañado_o_desalojado()
+    test_tp3_reutiliza_tp2()
+    test_tp5_tp4_con_eventos_reutiliza()
+
+    print("\n✅ Todas las pruebas de caché pasaron")
@@ -0,0 +1,90 @@
+"""
+Pruebas de la línea de comandos no interactiva (python main.py run ...).
+"""
+import os
+import subprocess
+import sys
+import tempfile
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+import main
+from utils.resultados import LectorResultados
+
+
+def _main(*argumentos: str) -> subprocess.CompletedProcess:
+    """Ejecuta main.py con una entrada estándar que nunca termina de llegar."""
+    return subprocess.run([sys.executable, 'main.py', *argumentos], cwd=RAIZ, capture_output=True,
+                          text=True, stdin=subprocess.PIPE, timeout=120)
+
+
+def test_preparar_escenario():
+    """Las opciones se traducen a los argumentos de cada función; las no admitidas fallan."""
+    print("✓ Probando preparar_escenario...")
+
+    funcion = main.preparar_escenario('tp4', None, {'dist': 'tensiones', 'n': 100, 'semilla': None})
+    assert funcion.nombre == 'ejecutar_tp4_familia', "El escenario por defecto de tp4 es la familia"
+    assert funcion.argumentos == {'distribucion': 'tensiones', 'n': 100}, \
+        f"Argumentos inesperados: {funcion.argumentos}"
+
+    funcion = main.preparar_escenario('tp5', 'multiples', {'n': 20, 'semilla': 7, 'workers': 1})
+    assert funcion.argumentos == {'n_simulaciones': 20, 'semilla': 7, 'workers': 1}
+
+    funcion = main.preparar_escenario('tp5', 'tp4_con_eventos', {'dist': 'tensiones', 'semilla': 3})
+    assert funcion.argumentos == {'distribucion': 'tensiones', 'semilla': 3}
+
+    for escenario, opciones in (('inexistente', {}), ('diseño', {'n': 3})):
+        try:
+            main.preparar_escenario('tp1', escenario, opciones)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"tp1 {escenario} {opciones} debería fallar")
+
+
+def test_run_sin_entrada():
+    """run guarda los gráficos sin esperar la entrada estándar, también en escenarios con pausas."""
+    print("✓ Probando main.py run...")
+
+    with tempfile.TemporaryDirectory() as directorio:
+        resultado = _main('run', 'tp4', '--dist', 'resistencias', '--n', '60', '--semilla', '1',
+                          '--motor', 'analitico', '--out', directorio)
+        assert resultado.returncode == 0, resultado.stderr
+        assert "Curvas que llegan a 100°C" in resultado.stdout
+        assert [a for a in os.listdir(directorio) if a.endswith('.png')], "Debería haber un PNG"
+
+        guardado = os.path.join(directorio, 'trayectorias')
+        resultado = _main('run', 'tp4', '--dist', 'tensiones', '--n', '20', '--semilla', '2',
+                          '--out', directorio, '--guardar', guardado)
+        assert resultado.returncode == 0, resultado.stderr
+        resultados = LectorResultados(guardado)
+        assert len(resultados) == 20 and resultados.metadatos['distribucion'] == 'tensiones'
+
+        resultado = _main('run', 'tp2', 'hielo', '--formato', 'svg', '--out', directorio)
+        assert resultado.returncode == 0, resultado.stderr
+        assert [a for a in os.listdir(directorio) if a.startswith('tp2_hielo') and a.endswith('.svg')]
+
+        for tp, escenario in (('tp3', 'personalizado'), ('tp5', 'tp4_con_eventos')):
+            resultado = _main('run', tp, escenario, '--out', directorio)
+            assert resultado.returncode == 0, resultado.stderr
+            assert [a for a in os.listdir(directorio) if a.startswith(f"{tp}_{escenario}")], \
+                f"{tp} {escenario} debería guardar su gráfico sin preguntar nada"
+
+    resultado = _main('run', 'tp3', '--n', '10')
+    assert resultado.returncode == 2 and "no admite --n" in resultado.stderr, \
+        "Una opción no admitida debería ser un error de uso"
+
+    resultado = _main('run', 'tp4', '--motor', 'rk4')
+    assert resultado.returncode == 2 and "invalid choice" in resultado.stderr, \
+        "Un motor desconocido debería ser un error de uso"
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("PRUEBAS DE LA LÍNEA DE COMANDOS")
+    print("=" * 60)
+
+    test_preparar_escenario()
+    test_run_sin_entrada()
+
+    print("\n✅ Todas las pruebas de la línea de comandos pasaron")
@@ -0,0 +1,166 @@
+"""
+Pruebas de las estadísticas de ensamble de utils.estadisticas.
+"""
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from utils.estadisticas import EstadisticasEnsamble, TDigestVectorial, CuantilesEnsamble, DensidadEnsamble
+
+
+def _trayectorias_de_prueba():
+    """Trayectorias aleatorias de distinta longitud, como corridas que paran en 100°C."""
+    rng = np.random.default_rng(0)
+    return [rng.normal(50, 10, size=rng.integers(1, 40)) for _ in range(200)]
+
+
+def _matriz_rellena(trayectorias):
+    """Matriz (corridas, pasos) rellenada con NaN, como la de BatchHeatSimulator."""
+    matriz = np.full((len(trayectorias), max(t.size for t in trayectorias)), np.nan)
+    for i, t in enumerate(trayectorias):
+        matriz[i, :t.size] = t
+    return matriz
+
+
+def test_welford_igual_a_numpy():
+    """Agregando de a una trayectoria se obtienen las mismas estadísticas que con NumPy."""
+    print("✓ Probando EstadisticasEnsamble.agregar contra NumPy...")
+
+    trayectorias = _trayectorias_de_prueba()
+    matriz = _matriz_rellena(trayectorias)
+
+    estadisticas = EstadisticasEnsamble()
+    for t in trayectorias:
+        estadisticas.agregar(t)
+
+    conteo = (~np.isnan(matriz)).sum(axis=0)
+    assert estadisticas.n_corridas == 200, "Cantidad de corridas incorrecta"
+    assert np.array_equal(estadisticas.conteo, conteo), "Conteo por paso incorrecto"
+    assert np.allclose(estadisticas.media, np.nanmean(matriz, axis=0)), "Media incorrecta"
+    suficientes = conteo > 1
+    assert np.allclose(estadisticas.varianza[suficientes],
+                       np.nanvar(matriz, axis=0, ddof=1)[suficientes]), "Varianza incorrecta"
+    assert np.isnan(estadisticas.varianza[~suficientes]).all(), "Varianza con una sola corrida"
+    assert np.array_equal(estadisticas.minimo, np.nanmin(matriz, axis=0)), "Mínimo incorrecto"
+    assert np.array_equal(estadisticas.maximo, np.nanmax(matriz, axis=0)), "Máximo incorrecto"
+
+
+def test_lotes_y_combinacion():
+    """Agregar por lotes o combinar acumuladores parciales da el mismo resultado."""
+    print("✓ Probando agregar_lote y combinar...")
+
+    trayectorias = _trayectorias_de_prueba()
+    referencia = EstadisticasEnsamble()
+    for t in trayectorias:
+        referencia.agregar(t)
+
+    por_lotes = EstadisticasEnsamble()
+    for inicio in range(0, 200, 64):
+        por_lotes.agregar_lote(_matriz_rellena(trayectorias[inicio:inicio + 64]))
+
+    parcial_a, parcial_b = EstadisticasEnsamble(), EstadisticasEnsamble()
+    for t in trayectorias[:70]:
+        parcial_a.agregar(t)
+    parcial_b.agregar_lote(_matriz_rellena(trayectorias[70:]))
+    combinado = parcial_a.combinar(parcial_b)
+
+    for estadisticas in (por_lotes, combinado):
+        assert estadisticas.n_corridas == 200, "Cantidad de corridas incorrecta"
+        assert np.array_equal(estadisticas.conteo, referencia.conteo), "Conteo distinto"
+        assert np.allclose(estadisticas.media, referencia.media), "Media distinta"
+        assert np.allclose(estadisticas.varianza, referencia.varianza, equal_nan=True), "Varianza distinta"
+        assert np.array_equal(estadisticas.minimo, referencia.minimo), "Mínimo distinto"
+
+
+def test_tdigest_cuantiles():
+    """Los cuantiles del t-digest aproximan a los exactos, también al combinar digests."""
+    print("✓ Probando TDigestVectorial...")
+
+    rng = np.random.default_rng(1)
+    datos = np.column_stack([rng.normal(50, 10, 20000), rng.exponential(5, 20000)])
+    qs = [0.05, 0.25, 0.5, 0.75, 0.95]
+    exactos = np.quantile(datos, qs, axis=0)
+    escala = datos.std(axis=0)
+
+    digest = TDigestVectorial()
+    for fila in datos:
+        digest.agregar(fila)
+    assert np.all(np.abs(digest.cuantiles(qs) - exactos) < 0.02 * escala), "Cuantiles imprecisos"
+    assert np.array_equal(digest.cuantiles([0, 1]), [datos.min(axis=0), datos.max(axis=0)]), "Extremos incorrectos"
+    assert digest._pesos.shape[1] <= 101, "El digest no debe crecer con las observaciones"
+
+    parcial_a, parcial_b = TDigestVectorial(), TDigestVectorial()
+    parcial_a.agregar_lote(datos[:5000])
+    for fila in datos[5000:]:
+        parcial_b.agregar(fila)
+    combinado = parcial_a.combinar(parcial_b)
+    assert np.array_equal(combinado.conteo, [20000, 20000]), "Conteo combinado incorrecto"
+    assert np.all(np.abs(combinado.cuantiles(qs) - exactos) < 0.02 * escala), "Cuantiles combinados imprecisos"
+
+
+def test_cuantiles_ensamble():
+    """CuantilesEnsamble resume trayectorias de distinta longitud y resultados escalares."""
+    print("✓ Probando CuantilesEnsamble...")
+
+    trayectorias = _trayectorias_de_prueba()
+    cuantiles = CuantilesEnsamble()
+    for t in trayectorias:
+        cuantiles.agregar(t, longitud=t.size, nada=None)
+
+    matriz = _matriz_rellena(trayectorias)
+    assert cuantiles.n_corridas == 200 and cuantiles.tiempos.size == matriz.shape[1], "Tamaños incorrectos"
+    mediana = cuantiles.cuantiles_temperatura(0.5)
+    assert np.all(np.abs(mediana[:20] - np.nanmedian(matriz, axis=0)[:20]) < 2.0), "Mediana imprecisa"
+    assert cuantiles.cuantiles_escalar('longitud', 1.0) == max(t.size for t in trayectorias), "Máximo escalar incorrecto"
+    assert 'nada' not in cuantiles.escalares, "Los valores None se deben ignorar"
+
+
+
+def test_densidad_ensamble():
+    """El histograma 2D coincide con histogram2d, por corrida, en lote y combinado."""
+    print("✓ Probando DensidadEnsamble...")
+
+    trayectorias = _trayectorias_de_prueba()
+    matriz = _matriz_rellena(trayectorias)
+    tiempos = np.arange(matriz.shape[1], dtype=np.float64)
+    grilla = dict(t_max=40.0, T_min=20.0, T_max=80.0, n_tiempo=8, n_temperatura=12)
+
+    por_corrida = DensidadEnsamble(**grilla)
+    for t in trayectorias:
+        por_corrida.agregar(tiempos[:t.size], t)
+    lote = _densidad(grilla, tiempos, matriz[:150])
+    lote.combinar(_densidad(grilla, tiempos, matriz[150:]))
+
+    validos = ~np.isnan(matriz)
+    t, T = np.broadcast_to(tiempos, matriz.shape)[validos], matriz[validos]
+    esperado, _, _ = np.histogram2d(T, t, bins=(12, 8), range=((20.0, 80.0), (0.0, 40.0)))
+    dentro = (T >= 20.0) & (T < 80.0)
+
+    for densidad in (por_corrida, lote):
+        assert np.array_equal(densidad.conteos, esperado), "Conteos distintos de histogram2d"
+        assert densidad.n_corridas == 200, "Cantidad de corridas incorrecta"
+        assert densidad.fuera_de_rango == np.count_nonzero(~dentro), "Muestras fuera de rango mal contadas"
+    columnas = por_corrida.densidad.sum(axis=0)
+    assert np.allclose(columnas[columnas > 0], 1.0), "Cada columna con datos debería sumar 1"
+    assert por_corrida.conteos.nbytes == 12 * 8 * 8, "La memoria debería ser solo la de la grilla"
+
+
+def _densidad(grilla, tiempos, matriz):
+    """DensidadEnsamble con un lote ya agregado."""
+    densidad = DensidadEnsamble(**grilla)
+    densidad.agregar_lote(tiempos, matriz)
+    return densidad
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("PRUEBAS DE ESTADÍSTICAS DE ENSAMBLE")
+    print("=" * 60)
+
+    test_welford_igual_a_numpy()
+    test_lotes_y_combinacion()
+    test_tdigest_cuantiles()
+    test_cuantiles_ensamble()
+    test_densidad_ensamble()
+
+    print("\n✅ Todas las pruebas de estadísticas pasaron")
@@ -0,0 +1,137 @@
+"""
+Pruebas del ejecutor Monte Carlo de utils.montecarlo.
+"""
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from utils.heat_simulation import HeatSimulationParameters
+from utils import montecarlo
+from utils.montecarlo import MonteCarloRunner, metrica_tiempo_100c, metrica_supera_tiempo
+
+
+def test_resultados_independientes_de_workers():
+    """Con la misma semilla, 1 proceso y varios procesos dan resultados idénticos y en orden."""
+    print("✓ Probando MonteCarloRunner con 1 y 2 procesos...")
+
+    params = HeatSimulationParameters(tiempo_total=3600)
+    evento = {'probabilidad': 1/300}
+
+    secuencial = MonteCarloRunner(params, evento, registrar='resumen', workers=1).ejecutar(12, semilla=7)
+    paralelo = MonteCarloRunner(params, evento, registrar='resumen', workers=2, tam_lote=5).ejecutar(12, semilla=7)
+
+    assert len(paralelo) == 12, "Faltan corridas"
+    assert secuencial == paralelo, "Los resultados dependen de la cantidad de procesos"
+
+
+def test_parametros_por_corrida():
+    """Con una lista de parámetros cada corrida usa los suyos y las trayectorias llegan completas."""
+    print("✓ Probando MonteCarloRunner con parámetros por corrida...")
+
+    lista_params = [HeatSimulationParameters(T_inicial=T) for T in (0, 20, 40)]
+    resultados = MonteCarloRunner(lista_params, workers=2, tam_lote=1).ejecutar()
+
+    tiempos = [r[0][-1] for r in resultados]
+    assert tiempos[0] > tiempos[1] > tiempos[2], "Los resultados no respetan el orden de los parámetros"
+    assert all(isinstance(r[1], np.ndarray) for r in resultados), "Se esperaban trayectorias completas"
+
+
+def test_hasta_convergencia():
+    """La campaña adaptativa para al alcanzar la tolerancia o el tope de corridas."""
+    print("✓ Probando ejecutar_hasta_convergencia...")
+
+    params = HeatSimulationParameters(tiempo_total=2500)
+    runner = MonteCarloRunner(params, {'probabilidad': 1/300}, registrar='resumen', workers=1)
+
+    resultado = runner.ejecutar_hasta_convergencia(metrica_tiempo_100c, tolerancia=30.0, tam_tanda=50,
+                                                   max_corridas=2000, semilla=3)
+    assert resultado['convergio'] and resultado['semi_ancho'] <= 30.0, "No convergió"
+    assert resultado['n_corridas'] % 50 == 0, "Las corridas deben ir por tandas completas"
+    assert resultado['n_censuradas'] == resultado['n_corridas'] - resultado['n_validas']
+    bajo, alto = resultado['intervalo']
+    assert bajo < resultado['media'] < alto, "Intervalo mal formado"
+
+    # Tolerancia inalcanzable: para por el tope de corridas e informa la precisión lograda
+    resultado = runner.ejecutar_hasta_convergencia(metrica_supera_tiempo(2500), tolerancia=1e-6,
+                                                   tam_tanda=40, max_corridas=100, semilla=3)
+    assert resultado['motivo'] == 'max_corridas' and resultado['n_corridas'] == 100, "No respetó max_corridas"
+    assert not resultado['convergio'] and 0 < resultado['semi_ancho'] < 0.2, "Precisión mal informada"
+    assert 0 <= resultado['media'] <= 1, "La métrica indicadora debe dar una probabilidad"
+
+
+def test_indicadora_sin_eventos():
+    """Con una indicadora que nunca vale 1, el intervalo de Wilson no colapsa a ancho cero."""
+    print("✓ Probando el intervalo de Wilson de las indicadoras...")
+
+    runner = MonteCarloRunner(HeatSimulationParameters(), registrar='resumen', workers=1)
+    # Sin eventos ninguna corrida tarda más de 10⁶ s: p̂ = 0 en todas las tandas
+    resultado = runner.ejecutar_hasta_convergencia(metrica_supera_tiempo(1e6), tolerancia=0.01, tam_tanda=50,
+                                                   min_corridas=30, max_corridas=1000, semilla=1)
+    assert resultado['media'] == 0.0 and resultado['convergio'], "Debería converger a p = 0"
+    assert resultado['n_corridas'] == 200, \
+        f"Wilson exige unas 190 corridas para ± 0.01 con p̂ = 0; se hicieron {resultado['n_corridas']}"
+    bajo, alto = resultado['intervalo']
+    assert bajo <= 0 < alto <= 0.02, f"Intervalo de Wilson inesperado: {resultado['intervalo']}"
+
+
+def test_un_pool_por_campania():
+    """La campaña adaptativa crea un solo pool para todas las tandas y da lo mismo que en serie."""
+    print("✓ Probando que la campaña reutiliza el pool de procesos...")
+
+    creados = []
+
+    class PoolContado(montecarlo.ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            creados.append(self)
+            super().__init__(*args, **kwargs)
+
+    params = HeatSimulationParameters(tiempo_total=2500)
+    opciones = dict(tolerancia=1e-6, tam_tanda=20, max_corridas=60, semilla=5)
+    en_serie = MonteCarloRunner(params, {'probabilidad': 1/300}, registrar='resumen', workers=1)
+    esperado = en_serie.ejecutar_hasta_convergencia(metrica_tiempo_100c, **opciones)
+
+    original = montecarlo.ProcessPoolExecutor
+    montecarlo.ProcessPoolExecutor = PoolContado
+    try:
+        paralelo = MonteCarloRunner(params, {'probabilidad': 1/300}, registrar='resumen', workers=2)
+        resultado = paralelo.ejecutar_hasta_convergencia(metrica_tiempo_100c, **opciones)
+    finally:
+        montecarlo.ProcessPoolExecutor = original
+
+    assert len(creados) == 1, f"Se crearon {len(creados)} pools para 3 tandas"
+    assert resultado['historial'] == esperado['historial'], "El resultado no debe depender de los procesos"
+
+
+def test_convergencia_sin_tope():
+    """Sin max_corridas ni tiempo_max la campaña podría no terminar: se rechaza."""
+    print("✓ Probando ejecutar_hasta_convergencia sin tope...")
+
+    # En 100 s ninguna corrida llega a 100°C, así que la métrica nunca tiene valor
+    runner = MonteCarloRunner(HeatSimulationParameters(tiempo_total=100), registrar='resumen', workers=1)
+    try:
+        runner.ejecutar_hasta_convergencia(metrica_tiempo_100c, semilla=3)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Una campaña sin tope debería rechazarse")
+
+    resultado = runner.ejecutar_hasta_convergencia(metrica_tiempo_100c, tam_tanda=10, max_corridas=30, semilla=3)
+    assert resultado['motivo'] == 'max_corridas' and resultado['n_validas'] == 0, "Debería parar por el tope"
+    assert resultado['n_censuradas'] == 30 and resultado['fraccion_censurada'] == 1.0, \
+        "Las corridas sin valor deben informarse como censuradas"
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("PRUEBAS DEL EJECUTOR MONTE CARLO")
+    print("=" * 60)
+
+    test_resultados_independientes_de_workers()
+    test_parametros_por_corrida()
+    test_hasta_convergencia()
+    test_indicadora_sin_eventos()
+    test_un_pool_por_campania()
+    test_convergencia_sin_tope()
+
+    print("\n✅ Todas las pruebas de Monte Carlo pasaron")
@@ -0,0 +1,335 @@
+"""
+Pruebas de los motores de simulación de utils.heat_simulation.
+"""
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from utils.heat_simulation import (
+    HeatSimulationParameters,
+    HeatSimulator,
+    BatchHeatSimulator,
+    BatchIceHeatSimulator,
+    IceHeatSimulator,
+    ParameterTable,
+    AnalyticHeatSolver,
+    PoliticaRegistro,
+    ParameterDistribution,
+    generadores_por_corrida
+)
+
+
+def test_lote_igual_a_escalar():
+    """Cada fila del BatchHeatSimulator debe coincidir con HeatSimulator.simular."""
+    print("✓ Probando BatchHeatSimulator contra el simulador escalar...")
+
+    lista_params = [
+        HeatSimulationParameters(),
+        HeatSimulationParameters(T_inicial=5.3, T_amb=-12.0),
+        HeatSimulationParameters(masa=0.5, potencia=800, T_inicial=10),
+        HeatSimulationParameters(potencia=120, tiempo_total=600),  # No llega a 100°C
+        HeatSimulationParameters(potencia=120, tiempo_total=600.5),  # Tiempo total no múltiplo de dt
+        HeatSimulationParameters(k_acero=1e6, k_poliuretano=1e6),  # Sin pérdidas
+    ]
+
+    lote = BatchHeatSimulator.desde_parametros(lista_params)
+    lote.simular(parar_en_100c=True)
+
+    for i, params in enumerate(lista_params):
+        tiempos, temperaturas = HeatSimulator(params).simular(parar_en_100c=True)
+        tiempos_lote, temperaturas_lote = lote.trayectoria(i)
+
+        assert len(tiempos_lote) == len(tiempos), f"Fila {i}: longitud distinta"
+        assert np.array_equal(tiempos_lote, tiempos), f"Fila {i}: tiempos distintos"
+        assert np.array_equal(temperaturas_lote, temperaturas), f"Fila {i}: temperaturas distintas"
+        assert lote.T_final[i] == temperaturas[-1], f"Fila {i}: T_final distinta"
+
+
+def test_lote_sin_trayectorias():
+    """Sin registrar trayectorias el lote conserva T_final y el tiempo a 100°C."""
+    print("✓ Probando BatchHeatSimulator sin registrar trayectorias...")
+
+    T_inicial = np.linspace(0, 40, 1000)
+    lote = BatchHeatSimulator(masa=1.0, potencia=360, coef_perdidas=1.46,
+                              T_amb=20, T_inicial=T_inicial, tiempo_total=3000)
+    _, temperaturas = lote.simular(registrar_trayectorias=False)
+
+    assert temperaturas is None, "No debería registrarse la matriz de temperaturas"
+    assert np.all(lote.T_final >= 100.0), "Todas las filas deberían llegar a 100°C"
+    assert np.all(np.diff(lote.tiempo_100c) <= 0), "Más temperatura inicial debe tardar menos"
+
+
+def test_tiempo_100c_sin_parar():
+    """tiempo_100c es el primer cruce de 100°C, también si el lote sigue integrando después."""
+    print("✓ Probando tiempo_100c con y sin parar en 100°C...")
+
+    lista_params = [
+        HeatSimulationParameters(tiempo_total=3600),
+        HeatSimulationParameters(T_inicial=60, tiempo_total=3600),
+        HeatSimulationParameters(potencia=120, tiempo_total=3600),  # No llega a 100°C
+    ]
+    for parar in (True, False):
+        lote = BatchHeatSimulator.desde_parametros(lista_params)
+        lote.simular(parar_en_100c=parar)
+        for i, params in enumerate(lista_params):
+            simulator = HeatSimulator(params)
+            simulator.simular(parar_en_100c=parar)
+            esperado = simulator.resumen['tiempo_100c']
+            if esperado is None:
+                assert np.isnan(lote.tiempo_100c[i]), f"Fila {i}: no debería llegar a 100°C"
+            else:
+                assert lote.tiempo_100c[i] == esperado, \
+                    f"Fila {i} (parar={parar}): {lote.tiempo_100c[i]} en lugar de {esperado}"
+
+
+def test_analitico_sin_perdidas():
+    """Sin pérdidas la solución exacta coincide con la integración paso a paso."""
+    print("✓ Probando AnalyticHeatSolver sin pérdidas...")
+
+    params = HeatSimulationParameters(tiempo_total=1200, k_acero=1e6, k_poliuretano=1e6)
+    solver = AnalyticHeatSolver(params)
+    tiempos, temperaturas = HeatSimulator(params).simular(parar_en_100c=True)
+    tiempos_an, temperaturas_an = solver.simular(parar_en_100c=True)
+
+    assert len(tiempos_an) == len(tiempos), "El corte en 100°C no coincide"
+    assert np.allclose(temperaturas_an, temperaturas), "Temperaturas distintas"
+    assert abs(solver.tiempo_hasta(100) - 80 * 4186 / 360) < 1e-9, "Tiempo exacto incorrecto"
+
+
+def test_analitico_con_perdidas():
+    """Con pérdidas la solución exacta aproxima al integrador con dt = 1 s."""
+    print("✓ Probando AnalyticHeatSolver con pérdidas...")
+
+    params = HeatSimulationParameters(tiempo_total=3600)
+    solver = AnalyticHeatSolver(params)
+    tiempos, temperaturas = HeatSimulator(params).simular(parar_en_100c=True)
+
+    assert abs(solver.tiempo_hasta(100) - tiempos[-1]) < 1.0, "Tiempo a 100°C inconsistente"
+    assert abs(solver.temperatura(1000.0) - temperaturas[1000]) < 5e-2, "Temperatura inconsistente"
+
+    # Equilibrio por debajo de 100°C: nunca se alcanza el objetivo
+    params_frio = HeatSimulationParameters(potencia=60)
+    assert AnalyticHeatSolver(params_frio).tiempo_hasta(100) == np.inf, "Debería ser inalcanzable"
+
+    # Arrancando sobre el equilibrio la temperatura no baja (energía neta ≥ 0)
+    params_caliente = HeatSimulationParameters(potencia=60, T_inicial=95)
+    assert AnalyticHeatSolver(params_caliente).temperatura(500.0) == 95, "No debería enfriarse"
+
+
+def test_paso_dt_respetado():
+    """Con dt distinto de 1 s los tiempos son múltiplos de dt y cubren el horizonte."""
+    print("✓ Probando simulación con dt = 2.5 s...")
+
+    params = HeatSimulationParameters(tiempo_total=100, dt=2.5)
+    tiempos, _ = HeatSimulator(params).simular(parar_en_100c=False)
+
+    assert len(tiempos) == 41, "Cantidad de pasos incorrecta"
+    assert tiempos[1] == 2.5 and tiempos[-1] == 100.0, "Tiempos mal escalados"
+
+
+def test_adaptativo():
+    """El integrador adaptativo usa muy pocos pasos y respeta la tolerancia."""
+    print("✓ Probando integrador adaptativo...")
+
+    params = HeatSimulationParameters(tiempo_total=3600)
+    exacto = AnalyticHeatSolver(params)
+
+    simulator = HeatSimulator(params)
+    tiempos, temperaturas = simulator.simular_adaptativo(tolerancia=1e-4)
+    assert len(tiempos) < 50, f"Demasiados pasos: {len(tiempos)}"
+    assert 100.0 <= temperaturas[-1] <= 100.0 + 1e-4, "El cruce de 100°C no respeta la tolerancia"
+    assert abs(tiempos[-1] - exacto.tiempo_hasta(100)) < 0.1, "Tiempo a 100°C impreciso"
+
+    tiempos, temperaturas = simulator.simular_adaptativo(parar_en_100c=False, tolerancia=1e-4)
+    assert tiempos[-1] == 3600.0, "No se cubrió todo el horizonte"
+    assert abs(temperaturas[-1] - exacto.temperatura(3600.0)) < 1e-2, "Temperatura final imprecisa"
+
+    # Con eventos: los pasos nunca atraviesan el inicio o el fin de un evento
+    np.random.seed(3)
+    tiempos, _ = simulator.simular_adaptativo(evento_estocastico={'probabilidad': 1/300})
+    for evento in simulator.eventos_estocasticos:
+        assert evento['tiempo'] in tiempos, "Falta el borde de inicio de un evento"
+
+
+def test_buffers_preasignados():
+    """simular devuelve ndarrays recortados; simular_listas mantiene la API de listas."""
+    print("✓ Probando buffers preasignados...")
+
+    params = HeatSimulationParameters(tiempo_total=3600)
+    tiempos, temperaturas = HeatSimulator(params).simular()
+    assert isinstance(temperaturas, np.ndarray) and temperaturas.dtype == np.float64, "Se esperaba un ndarray float64"
+    assert tiempos.size == temperaturas.size == 1126, "La trayectoria no se recortó al parar en 100°C"
+
+    tiempos_32, temperaturas_32 = HeatSimulator(params, dtype=np.float32).simular()
+    assert temperaturas_32.dtype == np.float32, "No se respetó el dtype pedido"
+    assert np.allclose(temperaturas_32, temperaturas, atol=1e-4), "float32 no debe cambiar la integración"
+
+    tiempos_lista, temperaturas_lista = HeatSimulator(params).simular_listas()
+    assert isinstance(temperaturas_lista, list) and temperaturas_lista == temperaturas.tolist(), "Shim de listas incorrecto"
+
+
+def test_modo_resumen():
+    """El modo resumen devuelve las mismas métricas sin guardar la trayectoria."""
+    print("✓ Probando simular(registrar='resumen')...")
+
+    params = HeatSimulationParameters(tiempo_total=3600)
+    simulator = HeatSimulator(params)
+    tiempos, temperaturas = simulator.simular()
+    completo = simulator.resumen
+
+    resumen = simulator.simular(registrar='resumen')
+    assert simulator.temperaturas is None, "El modo resumen no debe guardar la trayectoria"
+    assert resumen == completo, "Las métricas deben coincidir con el modo completo"
+    assert resumen['tiempo_100c'] == tiempos[-1] and resumen['T_final'] == temperaturas[-1], "Métricas incorrectas"
+    assert resumen['energia_entregada'] == 360 * tiempos[-1], "Energía entregada incorrecta"
+
+    # Sin parar en 100°C se registra igualmente el primer cruce
+    resumen = simulator.simular(parar_en_100c=False, registrar='resumen')
+    assert resumen['tiempo_100c'] == tiempos[-1] and resumen['tiempo_final'] == 3600, "Cruce de 100°C mal registrado"
+
+    np.random.seed(7)
+    resumen = simulator.simular(evento_estocastico={'probabilidad': 1/100}, registrar='resumen')
+    assert resumen['n_eventos'] > 0 and simulator.eventos_estocasticos == [], "Los eventos solo deben contarse"
+
+
+def test_registro_decimado():
+    """Las políticas de registro reducen puntos y conservan inicio, fin y eventos."""
+    print("✓ Probando PoliticaRegistro...")
+
+    params = HeatSimulationParameters(tiempo_total=3600)
+    tiempos, temperaturas = HeatSimulator(params).simular()
+
+    for politica in [PoliticaRegistro(cada=60), PoliticaRegistro(max_puntos=50), PoliticaRegistro(epsilon=1.0)]:
+        tiempos_dec, temperaturas_dec = HeatSimulator(params).simular(registrar=politica)
+        assert len(tiempos_dec) < len(tiempos) / 10, f"{politica}: no se decimó lo suficiente"
+        assert tiempos_dec[0] == 0 and tiempos_dec[-1] == tiempos[-1], f"{politica}: faltan los extremos"
+        indices = (tiempos_dec / params.dt).astype(int)
+        assert np.array_equal(temperaturas_dec, temperaturas[indices]), f"{politica}: muestras distintas"
+
+    assert len(HeatSimulator(params).simular(registrar=PoliticaRegistro(max_puntos=50))[0]) <= 50, "Se superó max_puntos"
+
+    np.random.seed(11)
+    simulator = HeatSimulator(params)
+    tiempos_dec, _ = simulator.simular(evento_estocastico={'probabilidad': 1/300},
+                                       registrar=PoliticaRegistro(max_puntos=20))
+    for evento in simulator.eventos_estocasticos:
+        assert evento['tiempo'] in tiempos_dec, "Falta el inicio de un evento"
+        assert evento['tiempo'] - 1 in tiempos_dec, "Falta el punto previo a un evento"
+
+
+def test_eventos_presorteados():
+    """Los eventos se sortean en bloque: sin llamadas al generador por paso y con la misma tasa."""
+    print("✓ Probando sorteo geométrico de eventos estocásticos...")
+
+    params = HeatSimulationParameters(tiempo_total=3600)
+    simulator = HeatSimulator(params)
+    evento = {'probabilidad': 1/300}
+
+    original = np.random.random
+    np.random.random = None  # Cualquier sorteo por paso fallaría
+    try:
+        np.random.seed(5)
+        simulator.simular(evento_estocastico=evento, parar_en_100c=False)
+    finally:
+        np.random.random = original
+
+    # Los eventos no se superponen: cada uno empieza después de terminar el anterior
+    eventos = simulator.eventos_estocasticos
+    for anterior, siguiente in zip(eventos, eventos[1:]):
+        assert siguiente['tiempo'] >= anterior['tiempo'] + anterior['duracion'], "Eventos superpuestos"
+
+    # Ciclo medio: espera geométrica (300 s) + duración media (119.5 s)
+    np.random.seed(6)
+    n_eventos = [simulator.simular(evento_estocastico=evento, parar_en_100c=False,
+                                   registrar='resumen')['n_eventos'] for _ in range(300)]
+    esperado = 3600 / (300 + 119.5)
+    assert abs(np.mean(n_eventos) - esperado) < 0.5, f"Tasa de eventos incorrecta: {np.mean(n_eventos)}"
+
+
+def test_generadores_por_corrida():
+    """Cada corrida tiene su propio generador: el resultado no depende del orden ni del reparto."""
+    print("✓ Probando generadores independientes por corrida...")
+
+    params = HeatSimulationParameters(tiempo_total=3600)
+    evento = {'probabilidad': 1/300}
+
+    def corrida(rng):
+        return HeatSimulator(params, rng=rng).simular(evento_estocastico=evento, registrar='resumen')
+
+    en_orden = [corrida(rng) for rng in generadores_por_corrida(42, 8)]
+    # Simula dos workers que reciben las corridas intercaladas y en orden inverso
+    generadores = generadores_por_corrida(42, 8)
+    repartidas = {i: corrida(generadores[i]) for i in [7, 5, 3, 1, 6, 4, 2, 0]}
+    assert en_orden == [repartidas[i] for i in range(8)], "Los resultados dependen del reparto"
+    assert len({r['tiempo_100c'] for r in en_orden}) > 1, "Las corridas deberían diferir entre sí"
+
+    # El estado global no interfiere con un generador explícito
+    np.random.seed(0)
+    assert corrida(np.random.default_rng(1)) == corrida(np.random.default_rng(1)), "Generador no reproducible"
+    valores = ParameterDistribution.distribucion_normal_tension(5, rng=np.random.default_rng(3))
+    assert valores == ParameterDistribution.distribucion_normal_tension(5, rng=3), "Distribución no reproducible"
+
+
+def test_hielo_lote_y_escalar():
+    """El lote con hielo coincide fila a fila con el escalar y sin cubitos es el calentador simple."""
+    print("✓ Probando IceHeatSimulator y BatchIceHeatSimulator...")
+
+    params = HeatSimulationParameters(tiempo_total=2500)
+    n_cubos = np.array([0, 1, 2, 4])
+    lote = BatchIceHeatSimulator.desde_parametros([params], n_cubos=n_cubos, T_hielo=[-5, -5, -10, -5],
+                                                  tiempo_adicion=[120, 60, 120, 300])
+    lote.simular(parar_en_100c=True)
+
+    for i in range(len(n_cubos)):
+        simulator = IceHeatSimulator(params, n_cubos=int(n_cubos[i]), T_hielo=lote.hielo['T_hielo'][i],
+                                     tiempo_adicion=lote.hielo['tiempo_adicion'][i])
+        tiempos, temperaturas = simulator.simular(parar_en_100c=True)
+        assert np.array_equal(temperaturas, lote.trayectoria(i)[1]), f"Fila {i}: trayectoria distinta"
+        assert simulator.masa_hielo_final == 0.0, f"Fila {i}: debería derretirse todo el hielo"
+
+    simple = HeatSimulator(params).simular(parar_en_100c=True)[1]
+    assert np.array_equal(lote.trayectoria(0)[1], simple), "Sin cubitos debería coincidir con HeatSimulator"
+    assert np.all(np.diff(lote.tiempo_100c[[0, 1, 3]]) > 0), "Más hielo debería tardar más"
+    masa_hielo = n_cubos * 0.05
+    assert np.allclose(lote.masa_agua_final, 1.0 + masa_hielo), "El hielo fundido debe sumarse al agua"
+
+
+def test_hielo_por_tramos():
+    """El modo por tramos salta los tramos sin hielo y reproduce la integración paso a paso."""
+    print("✓ Probando BatchIceHeatSimulator en modo por tramos...")
+
+    rng = np.random.default_rng(0)
+    n = 60
+    tabla = ParameterTable(T_inicial=rng.uniform(-5, 60, n), T_amb=rng.uniform(-20, 50, n),
+                           potencia=rng.uniform(100, 900, n), tiempo_total=3000)
+    hielo = dict(n_cubos=rng.integers(0, 5, n), T_hielo=rng.uniform(-20, 0, n),
+                 tiempo_adicion=rng.uniform(0, 600, n))
+
+    for parar in (True, False):
+        numerico = BatchIceHeatSimulator.desde_tabla(tabla, **hielo)
+        numerico.simular(parar_en_100c=parar)
+        por_tramos = BatchIceHeatSimulator.desde_tabla(tabla, **hielo)
+        por_tramos.simular(parar_en_100c=parar, modo='por_tramos')
+
+        assert np.array_equal(numerico.pasos, por_tramos.pasos), "Los pasos finales deberían coincidir"
+        assert np.allclose(numerico.temperaturas, por_tramos.temperaturas, rtol=0, atol=1e-9, equal_nan=True), \
+            "Las trayectorias deberían coincidir salvo redondeo"
+        assert np.allclose(numerico.masa_agua_final, por_tramos.masa_agua_final), "Masa de agua distinta"
+        assert np.array_equal(numerico.tiempo_100c, por_tramos.tiempo_100c, equal_nan=True), \
+            "El primer cruce de 100°C debería coincidir"
+        hirvio = numerico.temperaturas[:, 1:] >= 100.0
+        cruce = np.where(hirvio.any(axis=1), numerico.tiempos[1:][np.argmax(hirvio, axis=1)], np.nan)
+        assert np.array_equal(numerico.tiempo_100c, cruce, equal_nan=True), "tiempo_100c debería ser el primer cruce"
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("PRUEBAS DE MOTORES DE SIMULACIÓN")
+    print("=" * 60)
+
+    tests = [nombre for nombre in dir() if nombre.startswith("test_")]
+    for nombre in sorted(tests):
+        globals()[nombre]()
+
+    print("\n✅ Todas las pruebas de motores pasaron")
@@ -0,0 +1,74 @@
+"""
+Pruebas de los muestreadores conjuntos de utils.muestreo.
+"""
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from statistics import NormalDist
+
+import numpy as np
+from utils.muestreo import sobol, latin_hypercube, normal_inversa
+from utils.heat_simulation import ParameterDistribution
+
+
+def test_normal_inversa():
+    """La inversa de Acklam coincide con statistics.NormalDist."""
+    print("✓ Probando normal_inversa...")
+
+    u = np.array([1e-8, 0.001, 0.02, 0.1, 0.5, 0.7, 0.98, 0.999999])
+    esperado = [NormalDist(10, 5).inv_cdf(p) for p in u]
+    assert np.allclose(normal_inversa(u, 10, 5), esperado, rtol=1e-8), "Cuantiles normales incorrectos"
+
+
+def test_estratificacion():
+    """Sobol y el hipercubo latino ponen un punto por estrato en cada dimensión."""
+    print("✓ Probando estratificación de Sobol y LHS...")
+
+    sin_desorden = sobol(4, 2, aleatorizar=False)
+    assert np.allclose(sin_desorden - 0.5 / 2**32, [[0, 0], [0.5, 0.5], [0.75, 0.25], [0.25, 0.75]]), \
+        "Primeros puntos de Sobol incorrectos"
+
+    for puntos in (sobol(256, 16, rng=1), latin_hypercube(256, 4, rng=1)):
+        assert puntos.min() > 0 and puntos.max() < 1, "Puntos fuera del hipercubo"
+        for j in range(puntos.shape[1]):
+            estratos = np.floor(puntos[:, j] * 256)
+            assert np.unique(estratos).size == 256, f"La dimensión {j} no está estratificada"
+
+    assert not np.array_equal(sobol(64, 3, rng=1), sobol(64, 3, rng=2)), "El desorden debe depender de la semilla"
+
+
+def test_muestreo_conjunto_converge_mas_rapido():
+    """Con Sobol y LHS la media de un modelo suave converge mucho más rápido que con MC."""
+    print("✓ Probando ParameterDistribution.muestreo_conjunto...")
+
+    muestra = ParameterDistribution.muestreo_conjunto(4096, 'sobol', rng=0)
+    assert set(muestra) == {'resistencia', 'T_inicial', 'T_amb', 'tension'}, "Faltan parámetros"
+    assert 0.35 <= muestra['resistencia'].min() and muestra['resistencia'].max() <= 0.45, "Resistencia fuera de rango"
+    assert abs(muestra['tension'].mean() - 12) < 0.01 and abs(muestra['tension'].std() - 4) < 0.05, "Tensión mal distribuida"
+
+    def error(metodo, n=256, repeticiones=20):
+        rng = np.random.default_rng(5)
+        medias = [np.mean(ParameterDistribution.muestreo_conjunto(n, metodo, rng=rng)['T_inicial'] ** 2)
+                  for _ in range(repeticiones)]
+        return np.sqrt(np.mean((np.array(medias) - 125.0) ** 2))  # E[T²] = μ² + σ²
+
+    assert error('sobol') < error('mc') / 5, "Sobol debería reducir mucho el error"
+    assert error('lhs') < error('mc') / 5, "LHS debería reducir mucho el error"
+
+    lista_params = ParameterDistribution.parametros_desde_muestra(
+        ParameterDistribution.muestreo_conjunto(3, 'lhs', parametros=['tension'], rng=1), T_amb=5)
+    assert all(p.T_amb == 5 and abs(p.potencia - p.tension ** 2 / 0.4) < 1e-9 for p in lista_params), \
+        "Parámetros mal construidos"
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("PRUEBAS DE MUESTREO CONJUNTO")
+    print("=" * 60)
+
+    test_normal_inversa()
+    test_estratificacion()
+    test_muestreo_conjunto_converge_mas_rapido()
+
+    print("\n✅ Todas las pruebas de muestreo pasaron")
@@ -0,0 +1,97 @@
+"""
+Pruebas de HeatSimulationParameters inmutable de utils.heat_simulation.
+"""
+import os
+import pickle
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from utils.heat_simulation import HeatSimulationParameters, ParameterTable, BatchHeatSimulator
+
+
+def test_inmutable_y_replace():
+    """Los parámetros no se modifican en el lugar y replace recalcula los derivados."""
+    print("✓ Probando inmutabilidad y replace...")
+
+    params = HeatSimulationParameters()
+    for nombre in ('potencia', 'radio', 'U', 'otro'):
+        try:
+            setattr(params, nombre, 1.0)
+        except AttributeError:
+            pass
+        else:
+            raise AssertionError(f"Se pudo asignar {nombre}")
+
+    mas_ancho = params.replace(radio=0.1)
+    assert params.radio == 0.05, "replace modificó el original"
+    assert abs(mas_ancho.area_total - params.area_total) > 1e-6, "replace no recalculó las áreas"
+    assert mas_ancho.replace(radio=0.05) == params, "Ida y vuelta debería dar parámetros iguales"
+
+    con_tension = params.con_potencia_desde_tension(10.0)
+    assert con_tension.tension == 10.0 and abs(con_tension.potencia - 250.0) < 1e-9, "Potencia mal calculada"
+
+    try:
+        params.replace(no_existe=1)
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("replace debería rechazar parámetros desconocidos")
+
+
+def test_hash_igualdad_y_pickle():
+    """Parámetros con los mismos valores son iguales, comparten hash y sobreviven a pickle."""
+    print("✓ Probando hash, igualdad y pickle...")
+
+    a = HeatSimulationParameters(T_amb=5, masa=0.5)
+    b = HeatSimulationParameters(masa=0.5, T_amb=5.0)
+    assert a == b and hash(a) == hash(b), "Parámetros iguales deberían ser iguales"
+    assert a != HeatSimulationParameters(T_amb=6, masa=0.5), "Parámetros distintos deberían diferir"
+    assert len({a, b, HeatSimulationParameters()}) == 2, "Deberían servir como claves"
+
+    copia = pickle.loads(pickle.dumps(a))
+    assert copia == a and copia.U == a.U, "pickle debería preservar los parámetros"
+
+
+def test_tabla_de_parametros():
+    """La tabla columnar reproduce los derivados escalares y guarda constantes como escalares."""
+    print("✓ Probando ParameterTable...")
+
+    lista_params = [
+        HeatSimulationParameters(T_amb=-5, radio=0.04),
+        HeatSimulationParameters(T_amb=30, radio=0.06),
+        HeatSimulationParameters(T_amb=10, radio=0.05, k_acero=1e6, k_poliuretano=1e6),
+    ]
+    tabla = ParameterTable.desde_parametros(lista_params)
+    assert len(tabla) == 3 and tabla.es_constante('masa') and not tabla.es_constante('radio'), \
+        "Las columnas constantes deberían guardarse como escalares"
+    assert tabla.a_parametros() == lista_params, "Ida y vuelta debería dar los mismos parámetros"
+    for i, params in enumerate(lista_params):
+        assert tabla.coef_perdidas[i] == params.U * params.area_total, f"Fila {i}: U·A distinto"
+        assert tabla.temp_equilibrio[i] == params.calcular_temp_equilibrio(), f"Fila {i}: equilibrio distinto"
+
+    calidas = tabla.filtrar(tabla.T_amb > 0)
+    assert len(calidas) == 2 and calidas[0] == lista_params[1], "Filtro incorrecto"
+    unidas = ParameterTable.concatenar([tabla[:1], calidas])
+    assert unidas.a_parametros() == [lista_params[0]] + lista_params[1:], "Concatenación incorrecta"
+
+    grande = ParameterTable(T_inicial=np.zeros(10**6), dtype=np.float32)
+    assert grande.nbytes < 5 * 10**6, "Solo la columna variable debería ocupar memoria"
+
+    lote = BatchHeatSimulator.desde_tabla(tabla)
+    lote.simular(parar_en_100c=True)
+    referencia = BatchHeatSimulator.desde_parametros(lista_params)
+    referencia.simular(parar_en_100c=True)
+    assert np.array_equal(lote.T_final, referencia.T_final), "desde_tabla debería coincidir con desde_parametros"
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("PRUEBAS DE PARÁMETROS")
+    print("=" * 60)
+
+    test_inmutable_y_replace()
+    test_hash_igualdad_y_pickle()
+    test_tabla_de_parametros()
+
+    print("\n✅ Todas las pruebas de parámetros pasaron")
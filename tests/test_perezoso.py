@@ -0,0 +1,66 @@
+"""
+Pruebas de la importación perezosa (utils.perezoso) y del arranque de main.py.
+"""
+import os
+import subprocess
+import sys
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from utils.perezoso import ModuloPerezoso, importar_perezoso
+
+
+def _en_proceso_nuevo(codigo: str) -> str:
+    """Ejecuta código en un intérprete limpio (con sys.modules vacío) y devuelve su salida."""
+    resultado = subprocess.run([sys.executable, '-c', codigo], cwd=RAIZ, capture_output=True,
+                               text=True, check=True)
+    return resultado.stdout.strip()
+
+
+def test_modulo_perezoso():
+    """El módulo se importa recién al usar un atributo; si ya estaba, se devuelve tal cual."""
+    print("✓ Probando importar_perezoso...")
+
+    assert importar_perezoso('os') is os, "Un módulo ya importado se devuelve directamente"
+
+    salida = _en_proceso_nuevo(
+        "import sys\n"
+        "from utils.perezoso import importar_perezoso\n"
+        "colorsys = importar_perezoso('colorsys')\n"
+        "antes = 'colorsys' in sys.modules\n"
+        "valor = colorsys.rgb_to_hsv(1.0, 0.0, 0.0)\n"
+        "print(antes, 'colorsys' in sys.modules, valor)")
+    assert salida == "False True (0.0, 1.0, 1.0)", f"Salida inesperada: {salida}"
+    assert isinstance(ModuloPerezoso('colorsys'), type(os)), "El sustituto debería ser un módulo"
+
+
+def test_menu_sin_modulos_pesados():
+    """Construir el menú no importa los TPs, numpy ni matplotlib."""
+    print("✓ Probando el arranque perezoso de main.py...")
+
+    salida = _en_proceso_nuevo(
+        "import sys\n"
+        "import main\n"
+        "main.MenuPrincipal()\n"
+        "print(sorted(m for m in ('numpy', 'matplotlib', 'tps.tp1_diseño', 'tps.tp5_estocasticos')"
+        " if m in sys.modules))")
+    assert salida == "[]", f"Módulos cargados al arrancar: {salida}"
+
+    salida = _en_proceso_nuevo(
+        "import sys, io, contextlib\n"
+        "import main\n"
+        "with contextlib.redirect_stdout(io.StringIO()):\n"
+        "    main.MenuPrincipal().opciones_tp['4']['opciones']['7'][1]()\n"
+        "print('tps.tp4_familias' in sys.modules, 'matplotlib' in sys.modules)")
+    assert salida == "True False", f"Las opciones de solo texto no deberían cargar matplotlib: {salida}"
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("PRUEBAS DE IMPORTACIÓN PEREZOSA")
+    print("=" * 60)
+
+    test_modulo_perezoso()
+    test_menu_sin_modulos_pesados()
+
+    print("\n✅ Todas las pruebas de importación perezosa pasaron")
@@ -0,0 +1,74 @@
+"""
+Pruebas del renderizado sin pantalla de utils.render.
+"""
+import os
+import sys
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+from utils import render
+
+
+def grafico_de_prueba():
+    """Función de gráficos como las de los TPs: dibuja, muestra y pausa."""
+    for titulo in ("Calentamiento sin pérdidas", "Curva con pérdidas"):
+        plt.figure()
+        plt.plot([0, 1], [20, 100])
+        plt.title(titulo)
+        render.mostrar_figuras()
+        render.pausar()
+    plt.figure()  # Figura que queda abierta: se guarda al final de la tarea
+    plt.plot([0, 1], [0, 1])
+
+
+def test_mostrar_figuras_guarda_y_cierra():
+    """En modo headless cada figura se guarda en todos los formatos y se cierra."""
+    print("✓ Probando mostrar_figuras en modo headless...")
+
+    with tempfile.TemporaryDirectory() as directorio:
+        render.configurar_render(directorio, formatos=('png', 'svg'), prefijo='prueba')
+        try:
+            plt.figure()
+            plt.title("Temperatura del agua")
+            rutas = render.mostrar_figuras()
+            render.pausar()  # No debe esperar al usuario
+        finally:
+            render.desactivar_render()
+
+        assert [os.path.basename(r) for r in rutas] == ['prueba_01_temperatura_del_agua.png',
+                                                        'prueba_01_temperatura_del_agua.svg'], \
+            f"Nombres inesperados: {rutas}"
+        assert all(os.path.getsize(r) > 0 for r in rutas), "Los archivos no deberían estar vacíos"
+        assert plt.get_fignums() == [], "La figura debería cerrarse después de guardarla"
+
+
+def test_renderizar_en_paralelo():
+    """Con 1 o 2 procesos se escriben las mismas figuras, incluida la que queda abierta."""
+    print("✓ Probando renderizar_en_paralelo con 1 y 2 procesos...")
+
+    tareas = {'a': grafico_de_prueba, 'b': grafico_de_prueba}
+    for workers in (1, 2):
+        with tempfile.TemporaryDirectory() as directorio:
+            archivos = render.renderizar_en_paralelo(tareas, directorio, workers=workers)
+            assert list(archivos) == ['a', 'b'], "Los resultados deberían respetar el orden de las tareas"
+            assert [os.path.basename(r) for r in archivos['a']] == [
+                'a_01_calentamiento_sin_perdidas.png', 'a_02_curva_con_perdidas.png', 'a_03.png'], \
+                f"Archivos inesperados: {archivos['a']}"
+            assert len(os.listdir(directorio)) == 6, "Deberían escribirse tres figuras por tarea"
+    assert not render.render_activo(), "El modo headless no debería quedar activo en el proceso principal"
+    assert plt.get_fignums() == [], "No deberían quedar figuras abiertas"
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("PRUEBAS DE RENDERIZADO")
+    print("=" * 60)
+
+    test_mostrar_figuras_guarda_y_cierra()
+    test_renderizar_en_paralelo()
+
+    print("\n✅ Todas las pruebas de renderizado pasaron")
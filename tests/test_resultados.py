@@ -0,0 +1,117 @@
+"""
+Pruebas del archivo columnar de resultados (utils.resultados).
+"""
+import os
+import sys
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import matplotlib
+matplotlib.use('Agg')
+import numpy as np
+
+from utils import render
+from utils.heat_simulation import BatchHeatSimulator, HeatSimulationParameters, HeatSimulator, ParameterTable
+from utils.resultados import EscritorResultados, LectorResultados
+
+
+def test_escritura_y_lectura():
+    """Corridas sueltas y lotes se leen igual que se escribieron, como memmaps."""
+    print("✓ Probando EscritorResultados y LectorResultados...")
+
+    tabla = ParameterTable(T_inicial=np.linspace(0, 30, 40))
+    lote = BatchHeatSimulator.desde_tabla(tabla)
+    lote.simular(parar_en_100c=True)
+    longitudes = lote.pasos + 1
+    params = HeatSimulationParameters().como_dict()
+
+    with tempfile.TemporaryDirectory() as directorio:
+        with EscritorResultados(directorio, dtype=np.float64, metadatos={'tp': 'prueba'},
+                                puntos_por_bloque=100) as escritor:
+            escritor.agregar([0.0, 1.0, 2.0], [20.0, 21.0, 22.5], params, semilla=7)
+            escritor.agregar_lote(lote.tiempos, lote.temperaturas, longitudes, tabla, semilla=3)
+            escritor.agregar([0.0], [99.0], params)
+
+        lector = LectorResultados(directorio)
+        assert lector.completo and lector.metadatos == {'tp': 'prueba'}
+        assert len(lector) == 42, f"Se esperaban 42 corridas, hay {len(lector)}"
+        assert isinstance(lector.temperaturas, np.memmap), "Las columnas se leen sin cargarlas"
+        assert np.array_equal(lector.longitudes, np.concatenate([[3], longitudes, [1]]))
+        assert list(lector.semillas[[0, 1, 41]]) == [7, 3, -1]
+
+        tiempos, temperaturas = lector[0]
+        assert np.array_equal(tiempos, [0, 1, 2]) and np.array_equal(temperaturas, [20, 21, 22.5])
+        for i in (0, 17, 39):
+            tiempos, temperaturas = lector[i + 1]
+            assert np.array_equal(temperaturas, lote.temperaturas[i, :longitudes[i]]), f"Corrida {i} distinta"
+            assert np.array_equal(tiempos, lote.tiempos[:longitudes[i]])
+        assert np.allclose(lector.parametros['T_inicial'][1:41], tabla.T_inicial)
+        assert np.all(lector.parametros['potencia'] == params['potencia'])
+        assert np.array_equal(lector.temperaturas_finales()[1:41], lote.T_final)
+
+        bloques = list(lector.bloques(10))
+        assert [inicio for inicio, *_ in bloques] == [0, 10, 20, 30, 40]
+        inicio, tiempos, temperaturas, desplazamientos = bloques[1]
+        assert np.array_equal(temperaturas[desplazamientos[2]:desplazamientos[3]], lector[12][1])
+
+
+def test_archivo_incompleto():
+    """Si la escritura se corta, se leen las corridas de los bloques ya escritos."""
+    print("✓ Probando la lectura de un archivo sin cerrar...")
+
+    with tempfile.TemporaryDirectory() as directorio:
+        escritor = EscritorResultados(directorio, puntos_por_bloque=5)
+        escritor.agregar(np.arange(3.0), np.full(3, 20.0), {'T_amb': 20}, semilla=1)
+        escritor.agregar(np.arange(4.0), np.full(4, 21.0), {'T_amb': 25}, semilla=1)  # completa un bloque
+        escritor.agregar(np.arange(2.0), np.full(2, 22.0), {'T_amb': 30}, semilla=1)  # queda pendiente
+
+        lector = LectorResultados(directorio)
+        assert not lector.completo
+        assert len(lector) == 2 and lector.n_puntos == 7, "Solo el bloque escrito debería verse"
+        assert np.array_equal(lector.parametros['T_amb'], [20, 25])
+        assert lector.temperaturas.dtype == np.float32, "Por defecto las trayectorias van en float32"
+
+        try:
+            escritor.agregar(np.arange(2.0), np.full(2, 22.0), {'T_inicial': 30})
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Cambiar las columnas de parámetros debería fallar")
+        escritor.cerrar()
+        assert len(LectorResultados(directorio)) == 3
+
+
+def test_corridas_reproducibles():
+    """Cada corrida guardada por el TP5 se reproduce sola a partir de su semilla."""
+    print("✓ Probando la semilla por corrida del archivo de resultados...")
+
+    from tps.tp5_estocasticos import ejecutar_tp5_densidad
+
+    with tempfile.TemporaryDirectory() as directorio:
+        render.configurar_render(os.path.join(directorio, 'graficos'))
+        try:
+            ejecutar_tp5_densidad(12, semilla=None, workers=1, guardar=os.path.join(directorio, 'corridas'))
+        finally:
+            render.desactivar_render()
+
+        lector = LectorResultados(os.path.join(directorio, 'corridas'))
+        assert np.array_equal(lector.semillas, np.arange(12)), "Cada corrida debe tener su propia semilla"
+        params = HeatSimulationParameters()
+        for i in (0, 7, 11):
+            simulador = HeatSimulator(params, rng=lector.generador(i))
+            _, temperaturas = simulador.simular(evento_estocastico=lector.metadatos['evento_estocastico'],
+                                                parar_en_100c=False)
+            assert np.array_equal(np.asarray(temperaturas, dtype=np.float32), lector[i][1]), \
+                f"La corrida {i} no se reproduce con su semilla"
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("PRUEBAS DEL ARCHIVO DE RESULTADOS")
+    print("=" * 60)
+
+    test_escritura_y_lectura()
+    test_archivo_incompleto()
+    test_corridas_reproducibles()
+
+    print("\n✅ Todas las pruebas del archivo de resultados pasaron")
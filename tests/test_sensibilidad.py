@@ -0,0 +1,55 @@
+"""
+Pruebas del análisis de sensibilidad global de utils.sensibilidad.
+"""
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from utils.heat_simulation import HeatSimulationParameters, AnalyticHeatSolver
+from utils.sensibilidad import indices_sobol, modelo_calentador
+
+
+def test_ishigami():
+    """Los índices de la función de Ishigami coinciden con sus valores exactos."""
+    print("✓ Probando índices de Sobol con la función de Ishigami...")
+
+    def ishigami(muestra):
+        x1, x2, x3 = muestra['x1'], muestra['x2'], muestra['x3']
+        return {'y': np.sin(x1) + 7 * np.sin(x2) ** 2 + 0.1 * x3 ** 4 * np.sin(x1)}
+
+    distribuciones = {nombre: ('uniforme', -np.pi, np.pi) for nombre in ('x1', 'x2', 'x3')}
+    resultado = indices_sobol(ishigami, n=2**13, distribuciones=distribuciones, tam_lote=5000, rng=0)
+
+    assert resultado['n_evaluaciones'] == 2**13 * 5, "Cantidad de evaluaciones incorrecta"
+    assert np.allclose(resultado['y']['S1'], [0.3139, 0.4424, 0.0], atol=0.03), "S1 incorrectos"
+    assert np.allclose(resultado['y']['ST'], [0.5576, 0.4424, 0.2437], atol=0.03), "ST incorrectos"
+    assert np.all(resultado['y']['S1_ic'] > 0), "Faltan los intervalos bootstrap"
+
+
+def test_modelo_calentador():
+    """El modelo vectorizado coincide con AnalyticHeatSolver y la tensión domina la varianza."""
+    print("✓ Probando modelo_calentador...")
+
+    params = HeatSimulationParameters(espesor_poliuretano=0.0012, masa=1.1, T_amb=5)
+    salidas = modelo_calentador({'espesor_poliuretano': np.array([0.0012]), 'masa': np.array([1.1]),
+                                 'T_amb': np.array([5.0])})
+    solver = AnalyticHeatSolver(params)
+    assert np.isclose(salidas['tiempo_100c'][0], solver.tiempo_hasta(100.0)), "Tiempo incorrecto"
+    assert np.isclose(salidas['T_final'][0], solver.temperatura(2500.0)), "Temperatura final incorrecta"
+
+    resultado = indices_sobol(n=2**10, n_bootstrap=0, rng=1)
+    tension = resultado['parametros'].index('tension')
+    assert np.argmax(resultado['tiempo_100c']['ST']) == tension, "La tensión debería dominar"
+    assert np.isnan(resultado['T_final']['ST_ic']).all(), "Sin bootstrap no hay intervalos"
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("PRUEBAS DE ANÁLISIS DE SENSIBILIDAD")
+    print("=" * 60)
+
+    test_ishigami()
+    test_modelo_calentador()
+
+    print("\n✅ Todas las pruebas de sensibilidad pasaron")
@@ -0,0 +1,139 @@
+"""
+Pruebas del submuestreo LTTB de utils.submuestreo y de la familia en LineCollection.
+"""
+import os
+import sys
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+from utils.heat_simulation import HeatSimulationParameters, BatchHeatSimulator, HeatPlotter
+from utils.submuestreo import lttb, lttb_lote, matriz_de_curvas
+
+
+def _lttb_referencia(x, y, n_salida):
+    """Implementación directa de LTTB (Steinarsson, 2013), una curva a la vez."""
+    cada = (len(x) - 2) / (n_salida - 2)
+    anterior, elegidos = 0, [0]
+    for i in range(n_salida - 2):
+        inicio, fin = int(i * cada) + 1, int((i + 1) * cada) + 1
+        fin_siguiente = min(int((i + 2) * cada) + 1, len(x))
+        promedio_x, promedio_y = x[fin:fin_siguiente].mean(), y[fin:fin_siguiente].mean()
+        area = np.abs((x[anterior] - promedio_x) * (y[inicio:fin] - y[anterior]) -
+                      (x[anterior] - x[inicio:fin]) * (promedio_y - y[anterior]))
+        anterior = inicio + int(np.argmax(area))
+        elegidos.append(anterior)
+    return np.array(elegidos + [len(x) - 1])
+
+
+def test_lttb_coincide_con_referencia():
+    """Los dos caminos (abscisas comunes y por curva) eligen los puntos del LTTB clásico."""
+    print("✓ Probando LTTB contra la implementación de referencia...")
+
+    rng = np.random.default_rng(0)
+    for n in (10, 777, 2501):
+        x = np.arange(n) * 1.0
+        y = np.cumsum(rng.normal(size=n))
+        for n_salida in (3, 7, 100):
+            if n <= n_salida:
+                continue
+            esperado = _lttb_referencia(x, y, n_salida)
+            xs, ys = lttb(x, y, n_salida)
+            assert np.array_equal(xs, x[esperado]), f"LTTB distinto para n={n}, n_salida={n_salida}"
+            xs, _ = lttb_lote(np.tile(x, (2, 1)), np.tile(y, (2, 1)), n_salida)
+            assert np.array_equal(xs[1], x[esperado]), "El camino por curva debería dar lo mismo"
+
+
+def test_lttb_conserva_extremos_y_picos():
+    """Se conservan el primer y el último punto y los picos aislados."""
+    print("✓ Probando que LTTB conserva extremos y picos...")
+
+    x = np.arange(5000) * 1.0
+    y = np.zeros_like(x)
+    y[1234], y[3210] = 50.0, -40.0
+    xs, ys = lttb(x, y, 200)
+    assert len(xs) == 200, "Debería devolver n_salida puntos"
+    assert xs[0] == 0 and xs[-1] == 4999, "Deberían conservarse los extremos"
+    assert ys.max() == 50.0 and ys.min() == -40.0, "Deberían conservarse los picos"
+
+    corta = lttb(x[:50], y[:50], 200)
+    assert len(corta[0]) == 50, "Una curva más corta que n_salida no se modifica"
+
+
+def test_lttb_lote_curvas_que_terminan_antes():
+    """Con longitudes distintas cada curva termina en su último punto válido."""
+    print("✓ Probando LTTB en lote con curvas de distinta longitud...")
+
+    params = [HeatSimulationParameters(potencia=p) for p in (300.0, 360.0, 450.0)]
+    simulador = BatchHeatSimulator.desde_parametros(params)
+    simulador.simular(parar_en_100c=True)
+    longitudes = simulador.pasos + 1
+
+    xs, ys = lttb_lote(simulador.tiempos, simulador.temperaturas, 300, longitudes)
+    assert xs.shape == (3, 300), f"Forma inesperada: {xs.shape}"
+    assert not np.isnan(ys).any(), "No deberían quedar NaN del relleno"
+    for i, L in enumerate(longitudes):
+        assert xs[i, -1] == simulador.tiempos[L - 1], "La curva debería terminar en su último paso"
+        assert ys[i, -1] == simulador.temperaturas[i, L - 1], "La temperatura final debería conservarse"
+
+    curvas = [(simulador.tiempos[:L], simulador.temperaturas[i, :L]) for i, L in enumerate(longitudes)]
+    x, y, longitudes_matriz = matriz_de_curvas(curvas)
+    assert x.ndim == 1, "Con el mismo dt las abscisas deberían ser comunes"
+    assert np.array_equal(longitudes_matriz, longitudes), "Las longitudes deberían coincidir"
+
+
+def test_familia_en_coleccion():
+    """Muchas curvas se dibujan como un único artista con barra de colores."""
+    print("✓ Probando plot_family_curves con muchas curvas...")
+
+    params = [HeatSimulationParameters(T_amb=t) for t in np.linspace(15, 25, 60)]
+    simulador = BatchHeatSimulator.desde_parametros(params)
+    simulador.simular(parar_en_100c=True)
+    simulaciones = [(simulador.tiempos[:L], simulador.temperaturas[i, :L], f"Curva {i}")
+                    for i, L in enumerate(simulador.pasos + 1)]
+
+    fig = HeatPlotter.plot_family_curves(simulaciones, "Familia grande")
+    ax = fig.axes[0]
+    assert len(ax.collections) == 1, "Debería haber una sola LineCollection"
+    assert len(ax.collections[0].get_segments()) == 60, "Debería haber un segmento por curva"
+    assert len(fig.axes) == 2, "Debería agregarse la barra de colores"
+    plt.close(fig)
+
+
+def test_tp5_multiples_en_coleccion():
+    """Con más de MAX_CURVAS_INDIVIDUALES corridas, el TP5 las dibuja como una LineCollection."""
+    print("✓ Probando la familia del TP5 con muchas corridas...")
+
+    from matplotlib.collections import LineCollection
+    from utils import render
+    from tps import tp5_estocasticos
+
+    with tempfile.TemporaryDirectory() as directorio:
+        render.configurar_render(directorio)
+        try:
+            fig, simulaciones = tp5_estocasticos.ejecutar_tp5_multiples_simulaciones(60, semilla=1, workers=1)
+        finally:
+            render.desactivar_render()
+    colecciones = [c for c in fig.axes[0].collections if isinstance(c, LineCollection)]
+    assert len(simulaciones) == 60, "Por defecto deberían conservarse todas las curvas"
+    assert len(colecciones) == 1 and len(colecciones[0].get_segments()) == 60, \
+        "Las 60 curvas deberían dibujarse como una sola LineCollection"
+    plt.close(fig)
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("PRUEBAS DE SUBMUESTREO")
+    print("=" * 60)
+
+    test_lttb_coincide_con_referencia()
+    test_lttb_conserva_extremos_y_picos()
+    test_lttb_lote_curvas_que_terminan_antes()
+    test_familia_en_coleccion()
+    test_tp5_multiples_en_coleccion()
+
+    print("\n✅ Todas las pruebas de submuestreo pasaron")
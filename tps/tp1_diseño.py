@@ -7,9 +7,12 @@ del calentador de agua eléctrico según las especificaciones del curso.
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
 
 from utils.heat_simulation import HeatSimulationParameters
+from utils.render import mostrar_figuras
+from utils.perezoso import importar_perezoso
+
+plt = importar_perezoso('matplotlib.pyplot')
 
 
 def mostrar_parametros_diseño():
@@ -122,8 +125,8 @@ def graficar_temperatura_teorica():
     """Grafica la curva de temperatura teórica sin pérdidas usando la misma simulación que otros TPs."""
     print("📈 GENERANDO GRÁFICO TEÓRICO (SIN PÉRDIDAS)...")
     
-    # Usar la misma simulación que en TP2/TP3 para consistencia
-    from utils.heat_simulation import HeatSimulationParameters, HeatSimulator
+    # Sin pérdidas la curva tiene solución exacta: no hace falta iterar paso a paso
+    from utils.heat_simulation import HeatSimulationParameters, AnalyticHeatSolver
     
     # Crear parámetros normales PERO simular sin pérdidas
     params = HeatSimulationParameters(
@@ -147,12 +150,12 @@ def graficar_temperatura_teorica():
         espesor_poliuretano=0.001
     )
     
-    sim = HeatSimulator(params_sin_perdidas)
-    tiempos, temperaturas = sim.simular(parar_en_100c=True)
+    solver = AnalyticHeatSolver(params_sin_perdidas)
+    tiempos, temperaturas = solver.simular(parar_en_100c=True)
     
     # Crear gráfico
     plt.figure(figsize=(10, 6))
-    tiempos_min = np.array(tiempos) / 60.0
+    tiempos_min = np.asarray(tiempos) / 60.0
     plt.plot(tiempos_min, temperaturas, 'b-', linewidth=2, label="Temperatura teórica")
     plt.axhline(100, color='r', linestyle='--', label="100°C (objetivo)")
     plt.axhline(20, color='g', linestyle=':', alpha=0.7, label="20°C (inicial)")
@@ -163,12 +166,11 @@ def graficar_temperatura_teorica():
     plt.grid(True, alpha=0.3)
     plt.legend()
     
-    # Encontrar el tiempo donde se alcanza 100°C
+    # Tiempo exacto en que se alcanza 100°C
     tiempo_100c = None
-    for i, temp in enumerate(temperaturas):
-        if temp >= 100:
-            tiempo_100c = tiempos_min[i]
-            break
+    tiempo_100c_s = solver.tiempo_hasta(100.0)
+    if tiempo_100c_s <= params_sin_perdidas.tiempo_total:
+        tiempo_100c = tiempo_100c_s / 60.0
     
     if tiempo_100c:
         plt.annotate(f'Tiempo total: {tiempo_100c:.1f} min', 
@@ -177,7 +179,7 @@ def graficar_temperatura_teorica():
                     fontsize=10, ha='center')
     
     plt.tight_layout()
-    plt.show()
+    mostrar_figuras()
     
     if tiempo_100c:
         print(f"✅ Gráfico generado - Tiempo para 100°C: {tiempo_100c:.1f} minutos")
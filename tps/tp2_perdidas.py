@@ -12,9 +12,13 @@ Autor: Ignacio Chaves (Legajo: 61.220)
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
 
-from utils.heat_simulation import HeatSimulator, HeatSimulationParameters
+from utils.heat_simulation import HeatSimulationParameters, IceHeatSimulator
+from utils.cache import simular_cacheado
+from utils.render import mostrar_figuras
+from utils.perezoso import importar_perezoso
+
+plt = importar_perezoso('matplotlib.pyplot')
 
 # =============================================================================
 # PARÁMETROS DEL SISTEMA
@@ -54,6 +58,17 @@ H_AGUA_HIELO = 500  # W/(m²·K) - coeficiente de película
 LADO_CUBO = 0.03  # m
 SUPERFICIE_HIELO = 6 * LADO_CUBO**2 * N_CUBOS  # área total de los cubos
 
+HIELO = {
+    'n_cubos': N_CUBOS,
+    'masa_cubo': MASA_HIELO_POR_CUBO,
+    'lado_cubo': LADO_CUBO,
+    'T_hielo': T_HIELO_INICIAL,
+    'tiempo_adicion': 120,  # s - momento en que se agrega el hielo
+    'calor_fusion': CALOR_FUSION_HIELO,
+    'calor_especifico_hielo': CALOR_ESPECIFICO_HIELO,
+    'h_agua_hielo': H_AGUA_HIELO,
+}
+
 # =============================================================================
 # FUNCIONES DE CÁLCULO
 # =============================================================================
@@ -86,6 +101,37 @@ def calcular_parametros_termicos():
     print(f"  Porcentaje de potencia perdida: {porcentaje_perdida:.1f}%")
     print(f"  Potencia neta disponible: {POTENCIA - perdida_maxima:.2f} W")
 
+def parametros_sin_perdidas() -> HeatSimulationParameters:
+    """
+    Escenario sin pérdidas del TP2 (también lo usa el TP3, así comparten caché).
+    
+    Se simula con motor='analitico': sin pérdidas la EDO tiene solución exacta.
+    """
+    tiempo_teorico = MASA_AGUA * CALOR_ESPECIFICO * (T_OBJETIVO - T_INICIAL) / POTENCIA
+    return HeatSimulationParameters(
+        masa=MASA_AGUA,
+        calor_especifico=CALOR_ESPECIFICO,
+        potencia=POTENCIA,
+        T_inicial=T_INICIAL,
+        T_amb=T_AMBIENTE,
+        tiempo_total=int(tiempo_teorico * 1.5),  # 50% más tiempo del teórico
+        k_acero=1e6,  # Muy alta conductividad = sin pérdidas
+        k_poliuretano=1e6  # Muy alta conductividad = sin pérdidas
+    )
+
+
+def parametros_con_perdidas() -> HeatSimulationParameters:
+    """Escenario con pérdidas del TP2 (también lo usa el TP3, así comparten caché)."""
+    return HeatSimulationParameters(
+        masa=MASA_AGUA,
+        calor_especifico=CALOR_ESPECIFICO,
+        potencia=POTENCIA,
+        T_inicial=T_INICIAL,
+        T_amb=T_AMBIENTE,
+        tiempo_total=3600  # 1 hora máximo
+    )
+
+
 def simular_sin_perdidas():
     """Simula el calentamiento sin pérdidas térmicas."""
     print("\n" + "="*50)
@@ -100,19 +146,10 @@ def simular_sin_perdidas():
     print(f"Tiempo teórico: {tiempo_teorico:.1f} s ({tiempo_teorico/60:.1f} min)")
     
     # Crear simulación sin pérdidas (U = 0) - usar la misma que TP1
-    params = HeatSimulationParameters(
-        masa=MASA_AGUA,
-        calor_especifico=CALOR_ESPECIFICO,
-        potencia=POTENCIA,
-        T_inicial=T_INICIAL,
-        T_amb=T_AMBIENTE,
-        tiempo_total=int(tiempo_teorico * 1.5),  # 50% más tiempo del teórico
-        k_acero=1e6,  # Muy alta conductividad = sin pérdidas
-        k_poliuretano=1e6  # Muy alta conductividad = sin pérdidas
-    )
+    params = parametros_sin_perdidas()
     
-    sim = HeatSimulator(params)
-    tiempos, temperaturas = sim.simular(parar_en_100c=True)
+    # Sin pérdidas la EDO tiene solución exacta: se evalúa sin iterar paso a paso
+    tiempos, temperaturas = simular_cacheado(params, parar_en_100c=True, motor='analitico')
     
     print(f"Tiempo real de simulación: {tiempos[-1]:.1f} s ({tiempos[-1]/60:.1f} min)")
     print(f"Temperatura final alcanzada: {temperaturas[-1]:.1f}°C")
@@ -131,21 +168,14 @@ def simular_con_perdidas():
     print(f"Coeficiente de pérdidas: {coef_perdidas:.6f} W/K")
     
     # Crear simulación con pérdidas (usando los valores por defecto de k)
-    params = HeatSimulationParameters(
-        masa=MASA_AGUA,
-        calor_especifico=CALOR_ESPECIFICO,
-        potencia=POTENCIA,
-        T_inicial=T_INICIAL,
-        T_amb=T_AMBIENTE,
-        tiempo_total=3600  # 1 hora máximo
-    )
+    params = parametros_con_perdidas()
     
-    sim = HeatSimulator(params)
-    tiempos, temperaturas = sim.simular(parar_en_100c=True)
+    # Escenario compartido con la comparación del TP3: se reutiliza si ya se simuló
+    tiempos, temperaturas = simular_cacheado(params, parar_en_100c=True)
     
     # Verificar si se alcanzó la temperatura objetivo
     if temperaturas[-1] < T_OBJETIVO:
-        temp_equilibrio = sim.calcular_temp_equilibrio()
+        temp_equilibrio = params.calcular_temp_equilibrio()
         print(f"ATENCIÓN: La temperatura de equilibrio ({temp_equilibrio:.1f}°C) es menor que el objetivo ({T_OBJETIVO}°C)")
         print(f"Temperatura alcanzada: {temperaturas[-1]:.1f}°C en {tiempos[-1]:.0f} s")
     else:
@@ -165,107 +195,14 @@ def simular_con_hielo():
     print(f"  Temperatura inicial: {T_HIELO_INICIAL}°C")
     print(f"  Superficie total: {SUPERFICIE_HIELO:.6f} m²")
     
-    # Inicialización
-    dt = 1  # s
-    tiempo_max = 2500  # s
-    tiempo_hielo = 120  # s - momento en que se agrega el hielo
-    
-    T_agua = T_INICIAL
-    T_hielo = T_HIELO_INICIAL
-    masa_agua = MASA_AGUA
-    masa_hielo_restante = MASA_HIELO_TOTAL
-    
-    tiempos = [0]
-    temperaturas = [T_agua]
-    
-    for t in range(1, tiempo_max + 1):
-        # Energía del calefactor
-        energia_calefactor = POTENCIA * dt
-        
-        # Pérdidas al ambiente
-        perdida_ambiente = U_COEFF * AREA_TOTAL * (T_agua - T_AMBIENTE) * dt
-        
-        # Energía neta disponible
-        energia_neta = energia_calefactor - perdida_ambiente
-        if energia_neta < 0:
-            energia_neta = 0
-        
-        energia_disponible = energia_neta
-        
-        # Interacción con hielo (después del tiempo_hielo)
-        if t >= tiempo_hielo and masa_hielo_restante > 0:
-            
-            # 1. Transferencia convectiva agua → hielo
-            if T_agua > T_hielo:
-                Q_conv = H_AGUA_HIELO * SUPERFICIE_HIELO * (T_agua - T_hielo) * dt
-                max_energia_agua = masa_agua * CALOR_ESPECIFICO * (T_agua - T_hielo)
-                energia_conv = min(Q_conv, max_energia_agua)
-                
-                energia_efectiva = 0
-                masa_agua_inicial = masa_agua
-                
-                # Calentar hielo hasta 0°C
-                if T_hielo < 0:
-                    energia_calentar = masa_hielo_restante * CALOR_ESPECIFICO_HIELO * abs(T_hielo)
-                    energia_usada = min(energia_conv, energia_calentar)
-                    T_hielo += energia_usada / (masa_hielo_restante * CALOR_ESPECIFICO_HIELO)
-                    energia_conv -= energia_usada
-                    energia_efectiva += energia_usada
-                
-                # Derretir hielo a 0°C
-                if T_hielo == 0 and energia_conv > 0 and masa_hielo_restante > 0:
-                    energia_fusion = masa_hielo_restante * CALOR_FUSION_HIELO
-                    energia_usada = min(energia_conv, energia_fusion)
-                    masa_derretida = energia_usada / CALOR_FUSION_HIELO
-                    masa_agua += masa_derretida
-                    masa_hielo_restante -= masa_derretida
-                    energia_efectiva += energia_usada
-                
-                # Enfriar el agua
-                if masa_agua_inicial > 0 and energia_efectiva > 0:
-                    T_agua -= energia_efectiva / (masa_agua_inicial * CALOR_ESPECIFICO)
-            
-            # 2. Aplicar energía del calefactor al hielo
-            if masa_hielo_restante > 0:
-                # Calentar hielo hasta 0°C
-                if T_hielo < 0:
-                    energia_calentar = masa_hielo_restante * CALOR_ESPECIFICO_HIELO * abs(T_hielo)
-                    energia_usada = min(energia_disponible, energia_calentar)
-                    T_hielo += energia_usada / (masa_hielo_restante * CALOR_ESPECIFICO_HIELO)
-                    energia_disponible -= energia_usada
-                
-                # Derretir hielo a 0°C
-                if T_hielo == 0 and masa_hielo_restante > 0:
-                    energia_fusion = masa_hielo_restante * CALOR_FUSION_HIELO
-                    energia_usada = min(energia_disponible, energia_fusion)
-                    masa_derretida = energia_usada / CALOR_FUSION_HIELO
-                    masa_agua += masa_derretida
-                    masa_hielo_restante -= masa_derretida
-                    energia_disponible -= energia_usada
-            
-            # Limpiar variables si no queda hielo
-            if masa_hielo_restante <= 0:
-                T_hielo = None
-                masa_hielo_restante = 0
-        
-        # 3. Calentar el agua con energía restante
-        if energia_disponible > 0 and masa_agua > 0:
-            T_agua += energia_disponible / (masa_agua * CALOR_ESPECIFICO)
-        
-        # Restricciones de temperatura
-        if masa_hielo_restante > 0 and T_hielo is not None:
-            if T_hielo < 0:
-                T_agua = max(T_agua, T_hielo)
-            else:
-                T_agua = max(T_agua, 0)
-        elif T_agua < 0:
-            T_agua = 0
-        
-        tiempos.append(t)
-        temperaturas.append(T_agua)
-        
-        if T_agua >= T_OBJETIVO:
-            break
+    params = HeatSimulationParameters(
+        masa=MASA_AGUA, calor_especifico=CALOR_ESPECIFICO, potencia=POTENCIA,
+        T_amb=T_AMBIENTE, T_inicial=T_INICIAL, tiempo_total=2500
+    )
+    simulator = IceHeatSimulator(params, **HIELO)
+    tiempos, temperaturas = simulator.simular(parar_en_100c=True, modo='por_tramos')
+    masa_agua = simulator.masa_agua_final
+    masa_hielo_restante = simulator.masa_hielo_final
     
     print(f"Tiempo final de simulación: {tiempos[-1]:.0f} s ({tiempos[-1]/60:.1f} min)")
     print(f"Temperatura final: {temperaturas[-1]:.1f}°C")
@@ -289,9 +226,9 @@ def graficar_comparacion():
     plt.figure(figsize=(12, 8))
     
     # Convertir tiempos a minutos
-    t_sin_min = np.array(t_sin) / 60
-    t_con_min = np.array(t_con) / 60
-    t_hielo_min = np.array(t_hielo) / 60
+    t_sin_min = np.asarray(t_sin) / 60
+    t_con_min = np.asarray(t_con) / 60
+    t_hielo_min = np.asarray(t_hielo) / 60
     
     # Graficar curvas
     plt.plot(t_sin_min, T_sin, 'b-', linewidth=2, label='Sin pérdidas térmicas')
@@ -316,7 +253,7 @@ def graficar_comparacion():
     plt.ylim(T_INICIAL - 5, T_OBJETIVO + 5)
     
     plt.tight_layout()
-    plt.show()
+    mostrar_figuras()
 
 # =============================================================================
 # FUNCIONES DE INTERFAZ PARA MAIN.PY
@@ -1,73 +1,39 @@
 """
 TP 4: Generar familias de curvas con distribuciones normales y uniformes de parámetros iniciales
 """
+import os
 import numpy as np
-import matplotlib.pyplot as plt
-from typing import List, Tuple
-from utils.heat_simulation import HeatSimulationParameters, HeatSimulator
+from typing import Dict, List, Optional, Tuple
+from utils.heat_simulation import (
+    HeatSimulationParameters,
+    BatchHeatSimulator,
+    HeatPlotter,
+    ParameterDistribution,
+    ParameterTable,
+    temperatura_analitica,
+    tiempo_analitico_hasta,
+    pasos_de_simulacion
+)
+from utils.estadisticas import DensidadEnsamble
+from utils.resultados import EscritorResultados
+from utils.sensibilidad import indices_sobol
+from utils.render import mostrar_figuras
+from utils.perezoso import importar_perezoso
 
+plt = importar_perezoso('matplotlib.pyplot')
 
-class ParameterDistribution:
-    """Clase para generar distribuciones de parámetros."""
-    
-    @staticmethod
-    def distribucion_uniforme_resistencias(n: int = 5, base: float = 0.4, variacion: float = 0.05) -> List[float]:
-        """Genera n valores de resistencia con distribución uniforme."""
-        min_val = base - variacion
-        max_val = base + variacion
-        return np.random.uniform(min_val, max_val, n).tolist()
-    
-    @staticmethod
-    def distribucion_normal_temperatura_inicial(n: int = 5, media: float = 10, std: float = 5) -> List[float]:
-        """Genera n temperaturas iniciales con distribución normal."""
-        return np.random.normal(media, std, n).tolist()
-    
-    @staticmethod
-    def distribucion_uniforme_temperatura_ambiente(n: int = 8, min_temp: float = -20, max_temp: float = 50) -> List[float]:
-        """Genera n temperaturas ambiente con distribución uniforme."""
-        return np.random.uniform(min_temp, max_temp, n).tolist()
-    
-    @staticmethod
-    def distribucion_normal_tension(n: int = 5, media: float = 12, std: float = 4) -> List[float]:
-        """Genera n tensiones con distribución normal."""
-        return np.random.normal(media, std, n).tolist()
-
+# Familias de los puntos 4.A-4.D: nombre de la distribución -> parámetro que varía
+# (la distribución de cada parámetro está en ParameterDistribution.DISTRIBUCIONES)
+DISTRIBUCIONES_TP4 = {
+    'resistencias': 'resistencia',
+    'temperaturas_iniciales': 'T_inicial',
+    'temperaturas_ambiente': 'T_amb',
+    'tensiones': 'tension',
+}
+MOTORES_TP4 = ('euler', 'analitico')
 
-class HeatPlotter:
-    """Clase para generar gráficos de las simulaciones."""
-    
-    @staticmethod
-    def plot_family_curves(simulaciones: List[Tuple], titulo: str):
-        """
-        Genera gráfico de familia de curvas.
-        
-        Args:
-            simulaciones: Lista de tuplas (tiempos, temperaturas, etiqueta)
-            titulo: Título del gráfico
-        """
-        fig, ax = plt.subplots(figsize=(12, 8))
-        
-        # Generar un color diferente para cada curva usando colores predefinidos
-        colors = ['blue', 'red', 'green', 'orange', 'purple', 'brown', 'pink', 'gray', 'olive', 'cyan']
-        
-        for i, (tiempos, temperaturas, etiqueta) in enumerate(simulaciones):
-            # Convertir tiempos a minutos para el eje X
-            tiempos_min = np.array(tiempos) / 60.0
-            color = colors[i % len(colors)]  # Ciclar colores si hay más de 10 curvas
-            ax.plot(tiempos_min, temperaturas, 
-                   color=color, linewidth=2, 
-                   label=etiqueta, alpha=0.8)
-        
-        ax.set_xlabel('Tiempo (minutos)', fontsize=12)
-        ax.set_ylabel('Temperatura (°C)', fontsize=12)
-        ax.set_title(titulo, fontsize=14, fontweight='bold')
-        ax.grid(True, alpha=0.3)
-        ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
-        
-        plt.tight_layout()
-        plt.show()
-        
-        return fig
+# Por encima de esta cantidad de curvas la familia se grafica como densidad
+MAX_CURVAS_FAMILIA = 2000
 
 
 def ejecutar_tp4_resistencias():
@@ -78,26 +44,29 @@ def ejecutar_tp4_resistencias():
     # Generar 5 valores de resistencia con distribución uniforme
     resistencias = ParameterDistribution.distribucion_uniforme_resistencias(n=5, base=0.4, variacion=0.05)
     
+    # Tabla de parámetros con resistencia específica y potencia basada en tensión y resistencia
+    tabla = ParameterTable(resistencia=resistencias).con_potencia_desde_tension()
+    
+    # Simular toda la familia en una sola pasada vectorizada
+    lote = BatchHeatSimulator.desde_tabla(tabla)
+    lote.simular(parar_en_100c=True)
+    
     simulaciones = []
     
-    for i, resistencia in enumerate(resistencias):
-        # Crear parámetros con resistencia específica
-        params = HeatSimulationParameters(resistencia=resistencia)
-        # Actualizar potencia basada en tensión y resistencia
-        params.actualizar_potencia_desde_tension(params.tension)
-        
-        simulator = HeatSimulator(params)
-        tiempos, temperaturas = simulator.simular(parar_en_100c=True)
+    for i, (resistencia, potencia) in enumerate(zip(resistencias, tabla.potencia)):
+        tiempos, temperaturas = lote.trayectoria(i)
         
-        etiqueta = f"R = {resistencia:.3f} Ω (P = {params.potencia:.0f} W)"
+        etiqueta = f"R = {resistencia:.3f} Ω (P = {potencia:.0f} W)"
         simulaciones.append((tiempos, temperaturas, etiqueta))
-        print(f"  Simulación {i+1}: R = {resistencia:.3f} Ω, P = {params.potencia:.0f} W")
+        print(f"  Simulación {i+1}: R = {resistencia:.3f} Ω, P = {potencia:.0f} W")
     
     print("\nGenerando gráfico de familias de curvas...")
     fig = HeatPlotter.plot_family_curves(
         simulaciones, 
         "TP4.A - Familia de Curvas con Distribución Uniforme de Resistencias"
     )
+    plt.tight_layout()
+    mostrar_figuras()
     
     return fig, simulaciones
 
@@ -110,14 +79,14 @@ def ejecutar_tp4_temperaturas_iniciales():
     # Generar temperaturas iniciales con distribución normal
     temps_iniciales = ParameterDistribution.distribucion_normal_temperatura_inicial(n=5, media=10, std=5)
     
+    # Crear parámetros con temperatura inicial específica y simular en lote
+    lote = BatchHeatSimulator.desde_tabla(ParameterTable(T_inicial=temps_iniciales))
+    lote.simular(parar_en_100c=True)
+    
     simulaciones = []
     
     for i, temp_inicial in enumerate(temps_iniciales):
-        # Crear parámetros con temperatura inicial específica
-        params = HeatSimulationParameters(T_inicial=temp_inicial)
-        
-        simulator = HeatSimulator(params)
-        tiempos, temperaturas = simulator.simular(parar_en_100c=True)
+        tiempos, temperaturas = lote.trayectoria(i)
         
         etiqueta = f"T₀ = {temp_inicial:.1f} °C"
         simulaciones.append((tiempos, temperaturas, etiqueta))
@@ -128,6 +97,8 @@ def ejecutar_tp4_temperaturas_iniciales():
         simulaciones, 
         "TP4.B - Familia de Curvas con Distribución Normal de Temperaturas Iniciales"
     )
+    plt.tight_layout()
+    mostrar_figuras()
     
     return fig, simulaciones
 
@@ -140,14 +111,14 @@ def ejecutar_tp4_temperaturas_ambiente():
     # Generar temperaturas ambiente con distribución uniforme
     temps_ambiente = ParameterDistribution.distribucion_uniforme_temperatura_ambiente(n=8, min_temp=-20, max_temp=50)
     
+    # Crear parámetros con temperatura ambiente específica y simular en lote
+    lote = BatchHeatSimulator.desde_tabla(ParameterTable(T_amb=temps_ambiente))
+    lote.simular(parar_en_100c=True)
+    
     simulaciones = []
     
     for i, temp_ambiente in enumerate(temps_ambiente):
-        # Crear parámetros con temperatura ambiente específica
-        params = HeatSimulationParameters(T_amb=temp_ambiente)
-        
-        simulator = HeatSimulator(params)
-        tiempos, temperaturas = simulator.simular(parar_en_100c=True)
+        tiempos, temperaturas = lote.trayectoria(i)
         
         etiqueta = f"T_amb = {temp_ambiente:.1f} °C"
         simulaciones.append((tiempos, temperaturas, etiqueta))
@@ -158,6 +129,8 @@ def ejecutar_tp4_temperaturas_ambiente():
         simulaciones, 
         "TP4.C - Familia de Curvas con Distribución Uniforme de Temperaturas Ambiente"
     )
+    plt.tight_layout()
+    mostrar_figuras()
     
     return fig, simulaciones
 
@@ -170,34 +143,301 @@ def ejecutar_tp4_tensiones_12v():
     # Generar tensiones con distribución normal
     tensiones = ParameterDistribution.distribucion_normal_tension(n=5, media=12, std=4)
     
+    # Tabla de parámetros con tensión específica
+    tabla = ParameterTable(tension=tensiones).con_potencia_desde_tension()
+    
+    lote = BatchHeatSimulator.desde_tabla(tabla)
+    lote.simular(parar_en_100c=True)
+    
     simulaciones = []
     print(f"{'Tensión (V)':<12} {'Potencia (W)':<12} {'Tiempo (min)':<12} {'Temp Final (°C)':<12}")
     print("-" * 50)
     
-    for i, tension in enumerate(tensiones):
-        # Crear parámetros con tensión específica
-        params = HeatSimulationParameters()
-        params.actualizar_potencia_desde_tension(tension)
-        
-        simulator = HeatSimulator(params)
-        tiempos, temperaturas = simulator.simular(parar_en_100c=True)
+    for i, (tension, potencia) in enumerate(zip(tensiones, tabla.potencia)):
+        tiempos, temperaturas = lote.trayectoria(i)
         
-        etiqueta = f"V = {tension:.1f} V (P = {params.potencia:.0f} W)"
+        etiqueta = f"V = {tension:.1f} V (P = {potencia:.0f} W)"
         simulaciones.append((tiempos, temperaturas, etiqueta))
         
-        tiempo_min = len(tiempos) * params.dt / 60  # Convertir a minutos
+        tiempo_min = len(tiempos) * lote.dt / 60  # Convertir a minutos
         temp_final = temperaturas[-1]
-        print(f"{tension:<12.1f} {params.potencia:<12.0f} {tiempo_min:<12.2f} {temp_final:<12.2f}")
+        print(f"{tension:<12.1f} {potencia:<12.0f} {tiempo_min:<12.2f} {temp_final:<12.2f}")
     
     print("\nGenerando gráfico de familias de curvas...")
     fig = HeatPlotter.plot_family_curves(
         simulaciones, 
         "TP4.D - Familia de Curvas con Distribución Normal de Tensiones (12V)"
     )
+    plt.tight_layout()
+    mostrar_figuras()
     
     return fig, simulaciones
 
 
+def _simular_familia(tabla: ParameterTable, motor: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Simula una tabla de parámetros hasta 100°C con el motor elegido.
+    
+    Returns:
+        Tupla (tiempos, temperaturas, longitudes, tiempo_100c) como las de
+        BatchHeatSimulator: temperaturas rellenas con NaN después de cada final
+        y tiempo_100c NaN en las filas que no llegan
+    """
+    if motor == 'euler':
+        lote = BatchHeatSimulator.desde_tabla(tabla)
+        lote.simular(parar_en_100c=True)
+        return lote.tiempos, lote.temperaturas, lote.pasos + 1, lote.tiempo_100c
+    if motor != 'analitico':
+        raise ValueError(f"Motor desconocido: {motor}")
+    
+    dt = float(tabla.dt[0])
+    # Misma grilla que BatchHeatSimulator, así los dos motores dan curvas de igual largo
+    n_pasos = int(np.max(pasos_de_simulacion(tabla.tiempo_total, dt)))
+    tiempos = np.arange(n_pasos + 1) * dt
+    argumentos = (tabla.masa, tabla.calor_especifico, tabla.potencia, tabla.coef_perdidas,
+                  tabla.T_amb, tabla.T_inicial)
+    
+    tiempo_100c = tiempo_analitico_hasta(100.0, *argumentos)
+    # Mismo criterio que Euler: la curva termina en el primer paso que llega a 100°C
+    longitudes = np.minimum(np.ceil(np.minimum(tiempo_100c, tiempos[-1]) / dt), n_pasos).astype(np.int64) + 1
+    temperaturas = temperatura_analitica(tiempos, *(np.asarray(a)[:, None] for a in argumentos))
+    temperaturas[np.arange(n_pasos + 1) >= longitudes[:, None]] = np.nan
+    tiempo_100c = np.where(tiempo_100c <= tabla.tiempo_total, tiempo_100c, np.nan)
+    return tiempos, temperaturas, longitudes, tiempo_100c
+
+
+def _tabla_familia(parametro: str, valores: np.ndarray) -> ParameterTable:
+    """Tabla con el parámetro variando; la potencia sale de tensión y resistencia si corresponde."""
+    tabla = ParameterTable(**{parametro: valores})
+    if parametro in ('tension', 'resistencia'):
+        tabla = tabla.con_potencia_desde_tension()
+    return tabla
+
+
+def parametros_familia(distribucion: str, n: int, semilla=None,
+                       metodo: str = 'mc') -> Tuple[np.ndarray, ParameterTable]:
+    """
+    Muestrea una familia de 4.A-4.D sin simularla.
+
+    Args:
+        distribucion: Clave de DISTRIBUCIONES_TP4
+        n: Cantidad de curvas
+        semilla: Semilla o generador del muestreo (None = aleatoria)
+        metodo: Muestreo 'mc', 'lhs' o 'sobol'
+
+    Returns:
+        Tupla (valores del parámetro que varía, tabla de parámetros)
+    """
+    if distribucion not in DISTRIBUCIONES_TP4:
+        raise ValueError(f"Distribución desconocida: {distribucion} (opciones: {', '.join(DISTRIBUCIONES_TP4)})")
+    parametro = DISTRIBUCIONES_TP4[distribucion]
+    valores = ParameterDistribution.muestreo_conjunto(n, metodo, parametros=[parametro], rng=semilla)[parametro]
+    return valores, _tabla_familia(parametro, valores)
+
+
+def _densidad_bloque(parametro: str, valores: np.ndarray, motor: str, grilla: Dict,
+                     trayectorias: bool = False) -> Tuple[DensidadEnsamble, np.ndarray, Optional[Tuple]]:
+    """
+    Simula un bloque de la familia y lo resume en una densidad (para repartir entre procesos).
+    
+    Con trayectorias=True también devuelve (tiempos, temperaturas en float32,
+    longitudes) para guardarlas; si no, None.
+    """
+    tiempos, temperaturas, longitudes, tiempo_100c = _simular_familia(_tabla_familia(parametro, valores), motor)
+    densidad = DensidadEnsamble(**grilla)
+    densidad.agregar_lote(tiempos, temperaturas)
+    if trayectorias:
+        return densidad, tiempo_100c, (tiempos, temperaturas.astype(np.float32), longitudes)
+    return densidad, tiempo_100c, None
+
+
+def ejecutar_tp4_familia(distribucion: str = 'resistencias', n: int = 5, semilla: Optional[int] = None,
+                         metodo: str = 'mc', motor: str = 'euler', workers: Optional[int] = 1,
+                         tam_lote: int = 2000, guardar: Optional[str] = None):
+    """
+    Familia de curvas de cualquier tamaño para una de las distribuciones de 4.A-4.D.
+    
+    Hasta MAX_CURVAS_FAMILIA curvas se simulan en un solo lote y se grafican
+    como líneas. Con más, la familia se simula de a tam_lote filas (repartidas
+    entre workers procesos) y cada bloque se resume en una DensidadEnsamble,
+    así que la memoria no depende de n. Con guardar, las trayectorias y los
+    parámetros de cada curva se escriben bloque a bloque en un archivo de
+    resultados (ver utils.resultados). Las curvas son deterministas dados sus
+    parámetros; la semilla del muestreo queda en los metadatos.
+    
+    Args:
+        distribucion: Clave de DISTRIBUCIONES_TP4
+        n: Cantidad de curvas
+        semilla: Semilla del muestreo (None = aleatoria)
+        metodo: Muestreo 'mc', 'lhs' o 'sobol'
+        motor: 'euler' (BatchHeatSimulator) o 'analitico' (solución exacta)
+        workers: Procesos para las familias grandes (None = uno por núcleo)
+        tam_lote: Curvas por bloque en las familias grandes
+        guardar: Carpeta donde guardar las trayectorias (None = no se guardan)
+    """
+    if distribucion not in DISTRIBUCIONES_TP4:
+        raise ValueError(f"Distribución desconocida: {distribucion} (opciones: {', '.join(DISTRIBUCIONES_TP4)})")
+    if motor not in MOTORES_TP4:
+        raise ValueError(f"Motor desconocido: {motor} (opciones: {', '.join(MOTORES_TP4)})")
+    
+    parametro = DISTRIBUCIONES_TP4[distribucion]
+    tipo, a, b = ParameterDistribution.DISTRIBUCIONES[parametro]
+    print(f"=== TP4 - Familia de {n} curvas: {distribucion} ({tipo} {a:g}, {b:g}) ===")
+    print(f"Muestreo: {metodo}, motor: {motor}")
+    
+    valores, tabla = parametros_familia(distribucion, n, semilla, metodo)
+    titulo = f"TP4 - Familia de curvas: {distribucion} ({motor})"
+    escritor = None
+    if guardar:
+        escritor = EscritorResultados(guardar, metadatos={
+            'tp': 'tp4', 'distribucion': distribucion, 'n': n, 'semilla': semilla, 'metodo': metodo,
+            'motor': motor})
+    
+    if n <= MAX_CURVAS_FAMILIA:
+        tiempos, temperaturas, longitudes, tiempo_100c = _simular_familia(tabla, motor)
+        if escritor is not None:
+            escritor.agregar_lote(tiempos, temperaturas, longitudes, tabla)
+        if n <= HeatPlotter.MAX_CURVAS_INDIVIDUALES:
+            simulaciones = [(tiempos[:L], temperaturas[i, :L], f"{parametro} = {valores[i]:.3f}")
+                            for i, L in enumerate(longitudes)]
+            fig = HeatPlotter.plot_family_curves(simulaciones, titulo)
+        else:
+            fig = HeatPlotter.plot_familia_coleccion(tiempos, temperaturas, valores, parametro,
+                                                     titulo, longitudes=longitudes)
+        plt.tight_layout()
+        mostrar_figuras()
+    else:
+        grilla = dict(t_max=float(HeatSimulationParameters().tiempo_total),
+                      T_min=float(np.floor(np.min(tabla.T_inicial))) - 5,
+                      T_max=105.0)
+        bloques = [valores[i:i + tam_lote] for i in range(0, n, tam_lote)]
+        argumentos = ([parametro] * len(bloques), bloques, [motor] * len(bloques), [grilla] * len(bloques),
+                      [escritor is not None] * len(bloques))
+        
+        workers = workers or os.cpu_count() or 1
+        ejecutor = None
+        if workers == 1:
+            resultados = map(_densidad_bloque, *argumentos)
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+            ejecutor = ProcessPoolExecutor(max_workers=min(workers, len(bloques)))
+            resultados = ejecutor.map(_densidad_bloque, *argumentos)
+        
+        densidad = DensidadEnsamble(**grilla)
+        tiempos_100c = []
+        try:
+            for i, (parcial, tiempo_100c, trayectorias) in enumerate(resultados):
+                densidad.combinar(parcial)
+                tiempos_100c.append(tiempo_100c)
+                if escritor is not None:
+                    escritor.agregar_lote(*trayectorias, _tabla_familia(parametro, bloques[i]))
+                print(f"  Bloque {i + 1}/{len(bloques)}")
+        except BaseException:
+            # Ante un error o Ctrl-C se cancelan los bloques pendientes y se cierra el pool
+            if ejecutor is not None:
+                ejecutor.shutdown(wait=False, cancel_futures=True)
+            raise
+        if ejecutor is not None:
+            ejecutor.shutdown()
+        tiempo_100c = np.concatenate(tiempos_100c)
+        
+        fig = HeatPlotter.plot_densidad_ensamble(densidad, titulo)
+        plt.tight_layout()
+        mostrar_figuras()
+    
+    if escritor is not None:
+        escritor.cerrar()
+        print(f"Trayectorias guardadas en {escritor.directorio} ({escritor.n_puntos} puntos)")
+    
+    llegaron = ~np.isnan(tiempo_100c)
+    print(f"\nCurvas que llegan a 100°C: {np.count_nonzero(llegaron)} de {n}")
+    if llegaron.any():
+        p5, p50, p95 = np.percentile(tiempo_100c[llegaron], [5, 50, 95]) / 60.0
+        print(f"Tiempo hasta 100°C: media = {np.mean(tiempo_100c[llegaron]) / 60.0:.2f} min, "
+              f"P5 = {p5:.2f} min, P50 = {p50:.2f} min, P95 = {p95:.2f} min")
+    
+    return fig, {parametro: valores, 'tiempo_100c': tiempo_100c}
+
+
+def ejecutar_tp4_comparacion_muestreo(repeticiones: int = 20, tiempo: float = 1200, semilla: int = 42):
+    """
+    Compara Monte Carlo simple, hipercubo latino y Sobol al estimar la
+    temperatura media a los `tiempo` segundos con los cuatro parámetros del
+    TP4 variando a la vez.
+    
+    Para cada tamaño de muestra se repite la estimación `repeticiones` veces y
+    se mide el error cuadrático medio contra una referencia de 2^16 puntos de
+    Sobol. Se usa la solución analítica para que la comparación sea inmediata.
+    """
+    print("=== TP4 - Comparación de métodos de muestreo ===")
+    
+    base = HeatSimulationParameters()
+    coef_perdidas = base.U * base.area_total
+    
+    def temperatura_media(muestra):
+        potencia = muestra['tension'] ** 2 / muestra['resistencia']
+        return np.mean(temperatura_analitica(tiempo, base.masa, base.calor_especifico, potencia,
+                                             coef_perdidas, muestra['T_amb'], muestra['T_inicial']))
+    
+    rng = np.random.default_rng(semilla)
+    referencia = temperatura_media(ParameterDistribution.muestreo_conjunto(2**16, 'sobol', rng=rng))
+    
+    tamaños = [16, 64, 256, 1024]
+    metodos = {'mc': "Monte Carlo", 'lhs': "Hipercubo latino", 'sobol': "Sobol"}
+    errores = {metodo: [] for metodo in metodos}
+    for n in tamaños:
+        for metodo in metodos:
+            estimaciones = [temperatura_media(ParameterDistribution.muestreo_conjunto(n, metodo, rng=rng))
+                            for _ in range(repeticiones)]
+            errores[metodo].append(np.sqrt(np.mean((np.array(estimaciones) - referencia) ** 2)))
+    
+    fig = plt.figure(figsize=(10, 6))
+    for metodo, nombre in metodos.items():
+        plt.loglog(tamaños, errores[metodo], marker='o', label=nombre)
+    plt.title(f'TP4: Error de la temperatura media a los {tiempo / 60:.0f} min')
+    plt.xlabel('Cantidad de simulaciones')
+    plt.ylabel('Error cuadrático medio (°C)')
+    plt.grid(True, which='both', alpha=0.3)
+    plt.legend()
+    plt.tight_layout()
+    mostrar_figuras()
+    
+    print(f"Temperatura media de referencia: {referencia:.3f} °C")
+    print(f"{'N':<8}" + "".join(f"{nombre:<20}" for nombre in metodos.values()))
+    for i, n in enumerate(tamaños):
+        print(f"{n:<8}" + "".join(f"{errores[metodo][i]:<20.4f}" for metodo in metodos))
+    
+    return fig, errores
+
+
+def ejecutar_tp4_sensibilidad(n: int = 2**14, semilla: int = 42):
+    """
+    Análisis de sensibilidad global: índices de Sobol del tiempo hasta 100°C y
+    de la temperatura final respecto de resistencia, tensión, temperaturas
+    inicial y ambiente, masa y espesor de la aislación.
+    """
+    print("=== TP4 - Análisis de Sensibilidad Global (índices de Sobol) ===")
+    
+    resultado = indices_sobol(n=n, rng=semilla)
+    print(f"Evaluaciones del modelo: {resultado['n_evaluaciones']}")
+    
+    figuras = []
+    for salida, descripcion in [('tiempo_100c', "Tiempo hasta 100°C"), ('T_final', "Temperatura final")]:
+        indices = resultado[salida]
+        print(f"\n{descripcion}:")
+        print(f"{'Parámetro':<22} {'S1':<16} {'ST':<16}")
+        print("-" * 54)
+        for i, parametro in enumerate(resultado['parametros']):
+            print(f"{parametro:<22} {indices['S1'][i]:.3f} ± {indices['S1_ic'][i]:<8.3f} "
+                  f"{indices['ST'][i]:.3f} ± {indices['ST_ic'][i]:.3f}")
+        
+        figuras.append(HeatPlotter.plot_indices_sensibilidad(resultado, salida, f"TP4: Sensibilidad de {descripcion.lower()}"))
+        plt.tight_layout()
+        mostrar_figuras()
+    
+    return figuras, resultado
+
+
 def mostrar_info_tp4():
     """Muestra información detallada sobre TP4."""
     print("=== Información del TP4 - Familias de Curvas ===")
@@ -211,6 +451,9 @@ def mostrar_info_tp4():
     print("• TP4.B: Distribución normal de temperaturas iniciales (μ=10, σ=5)")
     print("• TP4.C: Distribución uniforme de temperaturas ambiente (-20 a 50°C)")
     print("• TP4.D: Distribución normal de tensiones 12V (μ=12, σ=4)")
+    print("• Familias de cualquier tamaño para 4.A-4.D (python main.py run tp4 --dist ... --n ...)")
+    print("• Comparación de muestreo conjunto: Monte Carlo, hipercubo latino y Sobol")
+    print("• Análisis de sensibilidad global con índices de Sobol")
     print()
     print("Propósito académico:")
     print("- Análisis de sensibilidad paramétrica")
@@ -230,10 +473,12 @@ if __name__ == "__main__":
     print("2. Distribución normal de temperaturas iniciales")
     print("3. Distribución uniforme de temperaturas ambiente")
     print("4. Distribución normal de tensiones (12V)")
-    print("5. Información del TP4")
+    print("5. Comparación de métodos de muestreo")
+    print("6. Análisis de sensibilidad global")
+    print("7. Información del TP4")
     
     try:
-        opcion = input("\nSeleccione una opción (1-5): ")
+        opcion = input("\nSeleccione una opción (1-7): ")
         
         if opcion == "1":
             ejecutar_tp4_resistencias()
@@ -244,6 +489,10 @@ if __name__ == "__main__":
         elif opcion == "4":
             ejecutar_tp4_tensiones_12v()
         elif opcion == "5":
+            ejecutar_tp4_comparacion_muestreo()
+        elif opcion == "6":
+            ejecutar_tp4_sensibilidad()
+        elif opcion == "7":
             mostrar_info_tp4()
         else:
             print("Opción no válida.")
@@ -5,11 +5,19 @@ de X grados, durante Y segundos. Variación máxima 50 grados en descenso.
 Rehacer el gráfico de temperaturas del TP 4.
 """
 import numpy as np
-import matplotlib.pyplot as plt
 from typing import List, Tuple, Dict, Optional
-from utils.heat_simulation import HeatSimulationParameters, HeatSimulator
+from utils.heat_simulation import HeatSimulationParameters, HeatSimulator, HeatPlotter
+from utils.montecarlo import MonteCarloRunner, metrica_tiempo_100c, metrica_supera_tiempo
+from utils.estadisticas import EstadisticasEnsamble, CuantilesEnsamble, DensidadEnsamble
+from utils.submuestreo import matriz_de_curvas
+from utils.resultados import EscritorResultados
+from utils.cache import simular_cacheado
+from utils.render import mostrar_figuras
+from utils.perezoso import importar_perezoso
 from tps import tp4_familias
 
+plt = importar_perezoso('matplotlib.pyplot')
+
 
 def ejecutar_tp5_evento_basico():
     """Simulación básica con evento estocástico."""
@@ -30,15 +38,14 @@ def ejecutar_tp5_evento_basico():
     tiempos_normal, temperaturas_normal = simulator_normal.simular(parar_en_100c=True)
     
     # Simulación con eventos estocásticos
-    np.random.seed(42)  # Para reproducibilidad
-    simulator_estocastico = HeatSimulator(params)
+    simulator_estocastico = HeatSimulator(params, rng=np.random.default_rng(42))  # Para reproducibilidad
     tiempos_estocastico, temperaturas_estocastico = simulator_estocastico.simular(parar_en_100c=True, evento_estocastico=evento_params)
     
     # Crear gráfico comparativo
     fig = plt.figure(figsize=(12, 8))
     
-    tiempos_normal_min = np.array(tiempos_normal) / 60.0
-    tiempos_estocastico_min = np.array(tiempos_estocastico) / 60.0
+    tiempos_normal_min = np.asarray(tiempos_normal) / 60.0
+    tiempos_estocastico_min = np.asarray(tiempos_estocastico) / 60.0
     
     plt.plot(tiempos_normal_min, temperaturas_normal, 
              label="Sin eventos estocásticos", linestyle='-', color='blue', linewidth=2)
@@ -69,7 +76,7 @@ def ejecutar_tp5_evento_basico():
     plt.xlim(0, max_tiempo_min * 1.05)
     
     plt.tight_layout()
-    plt.show()
+    mostrar_figuras()
     
     # Mostrar estadísticas
     print(f"\nResultados:")
@@ -87,8 +94,21 @@ def ejecutar_tp5_evento_basico():
     return fig, (tiempos_normal, temperaturas_normal), (tiempos_estocastico, temperaturas_estocastico)
 
 
-def ejecutar_tp5_multiples_simulaciones(n_simulaciones: int = 10):
-    """Ejecuta múltiples simulaciones con eventos estocásticos para mostrar la variabilidad."""
+def ejecutar_tp5_multiples_simulaciones(n_simulaciones: int = 10, semilla: int = 42,
+                                        workers: Optional[int] = None, max_curvas: int = 200):
+    """
+    Ejecuta múltiples simulaciones con eventos estocásticos para mostrar la variabilidad.
+    
+    Las corridas se reparten entre workers procesos (por defecto, uno por núcleo).
+    Cada corrida usa su propio generador, derivado de la semilla de la campaña,
+    así que el resultado no depende de la cantidad de procesos.
+    
+    Las trayectorias se resumen en streaming (media ± σ por paso) y solo se
+    conservan las primeras max_curvas para graficarlas, así que la memoria no
+    crece con n_simulaciones. Con más de HeatPlotter.MAX_CURVAS_INDIVIDUALES
+    curvas se dibujan como una sola LineCollection submuestreada, coloreada por
+    el tiempo final.
+    """
     print(f"=== TP5 - {n_simulaciones} Simulaciones Múltiples ===")
     print("Mostrando la variabilidad de los eventos estocásticos...")
     
@@ -101,32 +121,51 @@ def ejecutar_tp5_multiples_simulaciones(n_simulaciones: int = 10):
     
     params = HeatSimulationParameters()
     simulaciones = []
+    estadisticas = EstadisticasEnsamble(dt=params.dt)
+    tiempos_finales = []
+    temps_finales = []
     
     # Simulación base sin eventos
     simulator_normal = HeatSimulator(params)
     tiempos_normal, temperaturas_normal = simulator_normal.simular(parar_en_100c=True)
     
-    # Múltiples simulaciones con eventos estocásticos
-    for i in range(n_simulaciones):
-        np.random.seed(42 + i)  # Diferentes semillas para variabilidad
-        simulator = HeatSimulator(params)
-        tiempos, temperaturas = simulator.simular(parar_en_100c=True, evento_estocastico=evento_params)
-        simulaciones.append((tiempos, temperaturas, f"Simulación {i+1}"))
+    # Múltiples simulaciones con eventos estocásticos, en paralelo
+    runner = MonteCarloRunner(params, evento_estocastico=evento_params, parar_en_100c=True, workers=workers)
+    for i, (tiempos, temperaturas) in enumerate(runner.iterar(n_simulaciones, semilla=semilla)):
+        estadisticas.agregar(temperaturas)
+        tiempos_finales.append(tiempos[-1] / 60.0)
+        temps_finales.append(temperaturas[-1])
+        if i < max_curvas:
+            simulaciones.append((tiempos, temperaturas, f"Simulación {i+1}"))
     
     # Crear gráfico
     fig = plt.figure(figsize=(14, 10))
     
     # Gráfico base sin eventos
-    tiempos_normal_min = np.array(tiempos_normal) / 60.0
+    tiempos_normal_min = np.asarray(tiempos_normal) / 60.0
     plt.plot(tiempos_normal_min, temperaturas_normal, 
              label="Sin eventos estocásticos", linestyle='-', color='black', linewidth=3, alpha=0.8)
     
     # Simulaciones con eventos estocásticos
-    colores = ['red', 'blue', 'green', 'orange', 'purple', 'brown', 'pink', 'gray', 'olive', 'cyan']
-    for i, (tiempos, temperaturas, etiqueta) in enumerate(simulaciones):
-        tiempos_min = np.array(tiempos) / 60.0
-        color = colores[i % len(colores)]
-        plt.plot(tiempos_min, temperaturas, label=etiqueta, color=color, alpha=0.7, linewidth=1.5)
+    if len(simulaciones) > HeatPlotter.MAX_CURVAS_INDIVIDUALES:
+        # Muchas curvas: una sola LineCollection coloreada por el tiempo final
+        tiempos, temperaturas, longitudes = matriz_de_curvas([(t, T) for t, T, _ in simulaciones])
+        coleccion = HeatPlotter.dibujar_coleccion(plt.gca(), tiempos, temperaturas,
+                                                  valores=tiempos_finales[:len(simulaciones)],
+                                                  longitudes=longitudes, cmap='plasma', alpha=0.5)
+        plt.colorbar(coleccion, label="Tiempo final (min)")
+    else:
+        colores = ['red', 'blue', 'green', 'orange', 'purple', 'brown', 'pink', 'gray', 'olive', 'cyan']
+        for i, (tiempos, temperaturas, etiqueta) in enumerate(simulaciones):
+            tiempos_min = np.asarray(tiempos) / 60.0
+            color = colores[i % len(colores)]
+            plt.plot(tiempos_min, temperaturas, label=etiqueta, color=color, alpha=0.7, linewidth=1.5)
+    
+    # Banda media ± σ de todo el ensamble
+    media = estadisticas.media
+    desviacion = np.nan_to_num(estadisticas.desviacion)
+    plt.fill_between(estadisticas.tiempos / 60.0, media - desviacion, media + desviacion,
+                     color='gray', alpha=0.25, label="Media ± σ")
     
     plt.axhline(100, color='red', linestyle='--', alpha=0.7, label="100 °C")
     plt.title(f'TP 5: {n_simulaciones} Simulaciones con Eventos Estocásticos')
@@ -136,8 +175,7 @@ def ejecutar_tp5_multiples_simulaciones(n_simulaciones: int = 10):
     plt.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
     
     # Ajustar ticks del eje X
-    max_tiempo_min = max(max(np.array(sim[0]) / 60.0) for sim in simulaciones if len(sim[0]) > 0)
-    max_tiempo_min = max(max_tiempo_min, max(tiempos_normal_min))
+    max_tiempo_min = max(max(tiempos_finales), max(tiempos_normal_min))
     tick_spacing = 2 if max_tiempo_min > 40 else 1
     if max_tiempo_min > 0:
         upper_limit = np.ceil(max_tiempo_min / tick_spacing) * tick_spacing + tick_spacing / 2
@@ -145,13 +183,10 @@ def ejecutar_tp5_multiples_simulaciones(n_simulaciones: int = 10):
     plt.xlim(0, max_tiempo_min * 1.05)
     
     plt.tight_layout()
-    plt.show()
+    mostrar_figuras()
     
     # Mostrar estadísticas
     print(f"\nEstadísticas de {n_simulaciones} simulaciones:")
-    tiempos_finales = [sim[0][-1]/60.0 for sim in simulaciones]
-    temps_finales = [sim[1][-1] for sim in simulaciones]
-    
     print(f"Tiempo promedio: {np.mean(tiempos_finales):.2f} ± {np.std(tiempos_finales):.2f} min")
     print(f"Temperatura final promedio: {np.mean(temps_finales):.2f} ± {np.std(temps_finales):.2f}°C")
     print(f"Tiempo base (sin eventos): {tiempos_normal[-1]/60.0:.2f} min")
@@ -160,8 +195,210 @@ def ejecutar_tp5_multiples_simulaciones(n_simulaciones: int = 10):
     return fig, simulaciones
 
 
-def ejecutar_tp5_tp4_con_eventos():
-    """Rehacer los gráficos del TP4 pero añadiendo eventos estocásticos."""
+def ejecutar_tp5_percentiles(n_simulaciones: int = 500, semilla: int = 42,
+                             workers: Optional[int] = None):
+    """
+    Abanico de percentiles de temperatura y percentiles del tiempo hasta 100°C.
+    
+    Las corridas se resumen en t-digests a medida que llegan, sin guardar
+    ninguna trayectoria. Se simula todo el horizonte (sin parar en 100°C) para
+    que cada paso de tiempo tenga las mismas corridas.
+    """
+    print(f"=== TP5 - Percentiles de {n_simulaciones} Simulaciones ===")
+    
+    evento_params = {
+        'probabilidad': 1/300,
+        'descenso_max': 3,
+        'duracion_min': 60,
+        'duracion_max': 180
+    }
+    
+    params = HeatSimulationParameters()
+    cuantiles = CuantilesEnsamble(dt=params.dt)
+    
+    runner = MonteCarloRunner(params, evento_estocastico=evento_params, parar_en_100c=False, workers=workers)
+    for tiempos, temperaturas in runner.iterar(n_simulaciones, semilla=semilla):
+        hirvio = temperaturas >= 100.0
+        tiempo_100c = tiempos[np.argmax(hirvio)] if hirvio.any() else None
+        cuantiles.agregar(temperaturas, tiempo_100c=tiempo_100c, T_max=temperaturas.max())
+    
+    referencia = HeatSimulator(params).simular(parar_en_100c=False)
+    fig = HeatPlotter.plot_abanico_cuantiles(cuantiles, f'TP 5: Percentiles de {n_simulaciones} Simulaciones con Eventos Estocásticos',
+                                             referencia=referencia)
+    plt.tight_layout()
+    mostrar_figuras()
+    
+    print(f"\nPercentiles de {n_simulaciones} simulaciones:")
+    if 'tiempo_100c' in cuantiles.escalares:
+        p5, p50, p95 = cuantiles.cuantiles_escalar('tiempo_100c', [0.05, 0.5, 0.95]) / 60.0
+        print(f"Tiempo hasta 100°C: P5 = {p5:.2f} min, P50 = {p50:.2f} min, P95 = {p95:.2f} min")
+    p5, p50, p95 = cuantiles.cuantiles_escalar('T_max', [0.05, 0.5, 0.95])
+    print(f"Temperatura máxima: P5 = {p5:.2f}°C, P50 = {p50:.2f}°C, P95 = {p95:.2f}°C")
+    print(f"Tiempo base (sin eventos): {referencia[0][np.argmax(referencia[1] >= 100.0)]/60.0:.2f} min")
+    
+    return fig, cuantiles
+
+
+def ejecutar_tp5_densidad(n_simulaciones: int = 100_000, semilla: int = 42,
+                          workers: Optional[int] = None, guardar: Optional[str] = None):
+    """
+    Densidad (tiempo, temperatura) de un ensamble grande como imagen logarítmica.
+    
+    Cada trayectoria se suma a un histograma 2D apenas sale del simulador y se
+    descarta, así que la memoria es la de la grilla y no depende de
+    n_simulaciones. Encima se dibuja la curva determinista sin eventos.
+    
+    Con guardar (una carpeta), cada trayectoria también se escribe en un
+    archivo de resultados (ver utils.resultados) junto con el índice de su
+    semilla hija, así que cada corrida se reproduce por separado con
+    LectorResultados.generador.
+    """
+    print(f"=== TP5 - Densidad de {n_simulaciones} Simulaciones ===")
+    
+    evento_params = {
+        'probabilidad': 1/300,
+        'descenso_max': 3,
+        'duracion_min': 60,
+        'duracion_max': 180
+    }
+    
+    params = HeatSimulationParameters()
+    referencia = HeatSimulator(params).simular(parar_en_100c=False)
+    densidad = DensidadEnsamble(t_max=params.tiempo_total, T_min=min(params.T_inicial, params.T_amb) - 10,
+                                T_max=np.ceil(np.max(referencia[1])) + 5)
+    
+    # La raíz se crea acá para guardar su entropía aunque semilla sea None
+    raiz = np.random.SeedSequence(semilla)
+    escritor = None
+    if guardar:
+        escritor = EscritorResultados(guardar, metadatos={
+            'tp': 'tp5', 'escenario': 'densidad', 'n': n_simulaciones, 'semilla': semilla,
+            'entropia': raiz.entropy, 'evento_estocastico': evento_params})
+    
+    runner = MonteCarloRunner(params, evento_estocastico=evento_params, parar_en_100c=False, workers=workers)
+    paso_aviso = max(1, n_simulaciones // 10)
+    for i, (tiempos, temperaturas) in enumerate(runner.iterar(n_simulaciones, semilla=raiz)):
+        densidad.agregar(tiempos, temperaturas)
+        if escritor is not None:
+            # La corrida i usa la hija i de la raíz (semillas_por_corrida)
+            escritor.agregar(tiempos, temperaturas, params.como_dict(), semilla=i)
+        if (i + 1) % paso_aviso == 0:
+            print(f"  {i + 1}/{n_simulaciones} corridas")
+    
+    fig = HeatPlotter.plot_densidad_ensamble(densidad, 'TP 5: Densidad de temperaturas con eventos estocásticos',
+                                             referencia=referencia)
+    plt.tight_layout()
+    mostrar_figuras()
+    
+    memoria_kb = densidad.conteos.nbytes / 1024
+    print(f"\nGrilla de {densidad.n_temperatura} x {densidad.n_tiempo} celdas ({memoria_kb:.0f} KB) "
+          f"para {densidad.n_corridas} corridas")
+    if densidad.fuera_de_rango:
+        print(f"Muestras fuera del rango de temperatura: {densidad.fuera_de_rango}")
+    if escritor is not None:
+        escritor.cerrar()
+        print(f"Trayectorias guardadas en {escritor.directorio} ({escritor.n_puntos} puntos)")
+    
+    return fig, densidad
+
+
+def ejecutar_tp5_convergencia(metrica: str = 'tiempo_100c', tolerancia: Optional[float] = None,
+                              tiempo_max: float = 60.0, semilla: int = 42,
+                              workers: Optional[int] = None):
+    """
+    Campaña Monte Carlo adaptativa: agrega corridas hasta que el intervalo de
+    confianza del 95% sea suficientemente angosto o se agote el tiempo.
+    
+    Args:
+        metrica: 'tiempo_100c' (media del tiempo hasta 100°C, en segundos,
+            condicionada a llegar a 100°C en tiempo_total) o 'supera_2500'
+            (probabilidad de tardar más de 2500 s)
+        tolerancia: Semi-ancho buscado (por defecto 5 s o 0.01 según la métrica)
+        tiempo_max: Presupuesto de tiempo de reloj (s)
+        semilla: Semilla de la campaña
+        workers: Cantidad de procesos (por defecto, uno por núcleo)
+    """
+    print("=== TP5 - Monte Carlo hasta convergencia ===")
+    
+    evento_params = {
+        'probabilidad': 1/300,
+        'descenso_max': 3,
+        'duracion_min': 60,
+        'duracion_max': 180
+    }
+    
+    if metrica == 'tiempo_100c':
+        funcion, descripcion = metrica_tiempo_100c, "Tiempo medio hasta 100°C (s)"
+        tolerancia = 5.0 if tolerancia is None else tolerancia
+    elif metrica == 'supera_2500':
+        funcion, descripcion = metrica_supera_tiempo(2500), "P(tiempo hasta 100°C > 2500 s)"
+        tolerancia = 0.01 if tolerancia is None else tolerancia
+    else:
+        raise ValueError(f"Métrica desconocida: {metrica}")
+    
+    params = HeatSimulationParameters(tiempo_total=2500)
+    runner = MonteCarloRunner(params, evento_estocastico=evento_params, registrar='resumen', workers=workers)
+    resultado = runner.ejecutar_hasta_convergencia(funcion, tolerancia=tolerancia,
+                                                   tiempo_max=tiempo_max, semilla=semilla)
+    
+    # Evolución de la estimación y su intervalo con la cantidad de corridas
+    n, media, semi_ancho = (np.array(columna) for columna in zip(*resultado['historial']))
+    fig = plt.figure(figsize=(12, 8))
+    plt.plot(n, media, color='blue', marker='o', label="Media estimada")
+    plt.fill_between(n, media - semi_ancho, media + semi_ancho, color='blue', alpha=0.2,
+                     label=f"IC {resultado['confianza']:.0%}")
+    plt.title(f'TP 5: {descripcion} vs. cantidad de corridas')
+    plt.xlabel('Corridas válidas')
+    plt.ylabel(descripcion)
+    plt.grid(True, alpha=0.3)
+    plt.legend()
+    plt.tight_layout()
+    mostrar_figuras()
+    
+    motivos = {
+        'tolerancia': "se alcanzó la tolerancia",
+        'tiempo': "se agotó el tiempo",
+        'max_corridas': "se alcanzó el máximo de corridas",
+    }
+    bajo, alto = resultado['intervalo']
+    print(f"\n{descripcion}: {resultado['media']:.4f} ± {resultado['semi_ancho']:.4f} "
+          f"(IC {resultado['confianza']:.0%}: [{bajo:.4f}, {alto:.4f}])")
+    print(f"Tolerancia pedida: ± {tolerancia} — {motivos[resultado['motivo']]}")
+    print(f"Corridas: {resultado['n_corridas']} ({resultado['n_validas']} válidas) "
+          f"en {resultado['tiempo']:.1f} s")
+    if resultado['n_censuradas']:
+        print(f"⚠️ {resultado['n_censuradas']} corridas ({resultado['fraccion_censurada']:.1%}) no llegaron "
+              f"a 100°C en {params.tiempo_total:.0f} s y quedaron fuera de la media.")
+        print("   La estimación no es confiable: está sesgada hacia abajo y el intervalo no lo refleja.")
+    
+    return fig, resultado
+
+
+# Familias del TP4 que se rehacen con eventos: distribución -> (curvas, título)
+FAMILIAS_TP4_CON_EVENTOS = {
+    'resistencias': (5, "TP4.A + TP5: Resistencias con Eventos Estocásticos"),
+    'temperaturas_iniciales': (5, "TP4.B + TP5: Temperaturas Iniciales con Eventos Estocásticos"),
+    'temperaturas_ambiente': (8, "TP4.C + TP5: Temperaturas Ambiente con Eventos Estocásticos"),
+    'tensiones': (5, "TP4.D + TP5: Tensiones 12V con Eventos Estocásticos"),
+}
+
+
+def ejecutar_tp5_tp4_con_eventos(distribucion: str = 'resistencias', semilla: int = 42):
+    """
+    Rehacer los gráficos del TP4 pero añadiendo eventos estocásticos.
+    
+    La familia se muestrea con la semilla y cada curva se simula con y sin
+    eventos a través de la caché de simulaciones, así que repetir la misma
+    familia con la misma semilla no vuelve a simular nada.
+    
+    Args:
+        distribucion: Familia del TP4 (clave de FAMILIAS_TP4_CON_EVENTOS)
+        semilla: Semilla del muestreo de la familia y de los eventos
+    """
+    if distribucion not in FAMILIAS_TP4_CON_EVENTOS:
+        raise ValueError(f"Distribución desconocida: {distribucion} "
+                         f"(opciones: {', '.join(FAMILIAS_TP4_CON_EVENTOS)})")
+    
     print("=== TP5 - TP4 con Eventos Estocásticos ===")
     print("Recreando las familias de curvas del TP4 con eventos estocásticos...")
     
@@ -173,74 +410,52 @@ def ejecutar_tp5_tp4_con_eventos():
         'duracion_max': 180
     }
     
-    # Menú para seleccionar qué TP4 rehacer con eventos
-    print("\nSeleccione qué análisis del TP4 desea rehacer con eventos estocásticos:")
-    print("1. Distribución uniforme de resistencias")
-    print("2. Distribución normal de temperaturas iniciales")
-    print("3. Distribución uniforme de temperaturas ambiente")
-    print("4. Distribución normal de tensiones (12V)")
+    n, titulo = FAMILIAS_TP4_CON_EVENTOS[distribucion]
+    parametro = tp4_familias.DISTRIBUCIONES_TP4[distribucion]
     
-    try:
-        opcion = input("Opción (1-4): ")
-        
-        if opcion == "1":
-            print("\nEjecutando distribución de resistencias con eventos estocásticos...")
-            # Obtener simulaciones originales del TP4
-            _, simulaciones_originales = tp4_familias.ejecutar_tp4_resistencias()
-            titulo = "TP4.A + TP5: Resistencias con Eventos Estocásticos"
-            
-        elif opcion == "2":
-            print("\nEjecutando temperaturas iniciales con eventos estocásticos...")
-            _, simulaciones_originales = tp4_familias.ejecutar_tp4_temperaturas_iniciales()
-            titulo = "TP4.B + TP5: Temperaturas Iniciales con Eventos Estocásticos"
-            
-        elif opcion == "3":
-            print("\nEjecutando temperaturas ambiente con eventos estocásticos...")
-            _, simulaciones_originales = tp4_familias.ejecutar_tp4_temperaturas_ambiente()
-            titulo = "TP4.C + TP5: Temperaturas Ambiente con Eventos Estocásticos"
-            
-        elif opcion == "4":
-            print("\nEjecutando tensiones 12V con eventos estocásticos...")
-            _, simulaciones_originales = tp4_familias.ejecutar_tp4_tensiones_12v()
-            titulo = "TP4.D + TP5: Tensiones 12V con Eventos Estocásticos"
-            
-        else:
-            print("Opción no válida.")
-            return None, None
-        
-        # Crear gráfico comparativo con y sin eventos
-        fig = plt.figure(figsize=(15, 10))
-        
-        # Simulaciones originales (sin eventos)
-        for i, (tiempos, temperaturas, etiqueta) in enumerate(simulaciones_originales):
-            tiempos_min = np.array(tiempos) / 60.0
-            plt.plot(tiempos_min, temperaturas, '--', alpha=0.6, linewidth=1.5,
-                    label=f"{etiqueta} (sin eventos)")
-        
-        # Simulaciones con eventos estocásticos
-        # (Nota: En una implementación real, necesitaríamos recrear las simulaciones
-        # con los mismos parámetros pero añadiendo eventos estocásticos)
-        
-        plt.axhline(100, color='red', linestyle=':', alpha=0.7, label="100 °C")
-        plt.title(titulo)
-        plt.xlabel('Tiempo (min)')
-        plt.ylabel('Temperatura (°C)')
-        plt.grid(True, alpha=0.3)
-        plt.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
-        
-        # Ajustar layout y mostrar
-        plt.tight_layout()
-        plt.show()
-        
-        print(f"\\nGráfico generado: {titulo}")
-        print("Nota: En una implementación completa, se recrearían las simulaciones")
-        print("con los mismos parámetros del TP4 pero añadiendo eventos estocásticos.")
-        
-        return fig, simulaciones_originales
-        
-    except KeyboardInterrupt:
-        print("\\nOperación cancelada.")
-        return None, None
+    # Una semilla para el muestreo de la familia y otra (entera, para la
+    # clave de la caché) para los eventos de cada curva
+    semilla_muestreo, semilla_eventos = np.random.SeedSequence(semilla).spawn(2)
+    valores, tabla = tp4_familias.parametros_familia(distribucion, n, semilla=semilla_muestreo)
+    semillas_curvas = semilla_eventos.generate_state(n)
+    
+    print(f"\nEjecutando {distribucion} con eventos estocásticos (semilla {semilla})...")
+    simulaciones_originales = []
+    simulaciones_eventos = []
+    for i, valor in enumerate(valores):
+        params = tabla.fila(i)
+        etiqueta = f"{parametro} = {valor:.3f}"
+        tiempos, temperaturas = simular_cacheado(params)
+        simulaciones_originales.append((tiempos, temperaturas, etiqueta))
+        tiempos, temperaturas = simular_cacheado(params, evento_params, semilla=int(semillas_curvas[i]))
+        simulaciones_eventos.append((tiempos, temperaturas, etiqueta))
+    
+    # Crear gráfico comparativo con y sin eventos
+    fig = plt.figure(figsize=(15, 10))
+    colores = plt.cm.tab10(np.arange(n) % 10)
+    
+    for color, (tiempos, temperaturas, etiqueta) in zip(colores, simulaciones_originales):
+        plt.plot(np.asarray(tiempos) / 60.0, temperaturas, '--', color=color, alpha=0.6, linewidth=1.5,
+                 label=f"{etiqueta} (sin eventos)")
+    
+    for color, (tiempos, temperaturas, etiqueta) in zip(colores, simulaciones_eventos):
+        plt.plot(np.asarray(tiempos) / 60.0, temperaturas, '-', color=color, alpha=0.9, linewidth=1.5,
+                 label=f"{etiqueta} (con eventos)")
+    
+    plt.axhline(100, color='red', linestyle=':', alpha=0.7, label="100 °C")
+    plt.title(titulo)
+    plt.xlabel('Tiempo (min)')
+    plt.ylabel('Temperatura (°C)')
+    plt.grid(True, alpha=0.3)
+    plt.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
+    
+    # Ajustar layout y mostrar
+    plt.tight_layout()
+    mostrar_figuras()
+    
+    print(f"\nGráfico generado: {titulo}")
+    
+    return fig, simulaciones_eventos
 
 
 def mostrar_info_tp5():
@@ -259,6 +474,7 @@ def mostrar_info_tp5():
     print("Funcionalidades disponibles:")
     print("• Simulación básica con eventos estocásticos")
     print("• Múltiples simulaciones para analizar variabilidad")
+    print("• Densidad de temperaturas de ensambles de 10⁵ corridas o más")
     print("• Recreación de gráficos del TP4 con eventos estocásticos")
     print("• Comparación con simulaciones sin eventos")
     print()
@@ -280,10 +496,13 @@ if __name__ == "__main__":
     print("1. Simulación básica con eventos")
     print("2. Múltiples simulaciones (variabilidad)")
     print("3. TP4 con eventos estocásticos")
-    print("4. Información del TP5")
+    print("4. Percentiles del ensamble (abanico)")
+    print("5. Monte Carlo hasta convergencia")
+    print("6. Densidad del ensamble (imagen)")
+    print("7. Información del TP5")
     
     try:
-        opcion = input("\\nSeleccione una opción (1-4): ")
+        opcion = input("\\nSeleccione una opción (1-7): ")
         
         if opcion == "1":
             ejecutar_tp5_evento_basico()
@@ -292,8 +511,26 @@ if __name__ == "__main__":
             n_sims = int(n) if n.isdigit() else 10
             ejecutar_tp5_multiples_simulaciones(n_sims)
         elif opcion == "3":
-            ejecutar_tp5_tp4_con_eventos()
+            print("\nSeleccione qué análisis del TP4 desea rehacer con eventos estocásticos:")
+            for i, distribucion in enumerate(FAMILIAS_TP4_CON_EVENTOS, 1):
+                print(f"{i}. {FAMILIAS_TP4_CON_EVENTOS[distribucion][1]}")
+            familia = input("Opción (1-4): ")
+            familias = list(FAMILIAS_TP4_CON_EVENTOS)
+            if familia in ('1', '2', '3', '4'):
+                ejecutar_tp5_tp4_con_eventos(familias[int(familia) - 1])
+            else:
+                print("Opción no válida.")
         elif opcion == "4":
+            n = input("Número de simulaciones [default: 500]: ")
+            n_sims = int(n) if n.isdigit() else 500
+            ejecutar_tp5_percentiles(n_sims)
+        elif opcion == "5":
+            ejecutar_tp5_convergencia()
+        elif opcion == "6":
+            n = input("Número de simulaciones [default: 100000]: ")
+            n_sims = int(n) if n.isdigit() else 100_000
+            ejecutar_tp5_densidad(n_sims)
+        elif opcion == "7":
             mostrar_info_tp5()
         else:
             print("Opción no válida.")
@@ -0,0 +1,245 @@
+"""
+Caché de resultados de simulación direccionada por contenido.
+
+La clave es un hash estable (SHA-256) de los parámetros, el motor, la
+configuración de eventos y la semilla, así que dos escenarios idénticos
+comparten resultado aunque se construyan por separado (por ejemplo, TP2 y la
+comparación del TP3). Hay un nivel en memoria (LRU acotado) y uno opcional en
+disco (archivos .npz) acotado por tamaño total.
+"""
+import hashlib
+import json
+import os
+import tempfile
+import zipfile
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from utils.heat_simulation import HeatSimulationParameters, HeatSimulator, AnalyticHeatSolver
+
+
+def _normalizar(valor):
+    """Convierte valores (incluidos escalares de NumPy) a tipos JSON canónicos."""
+    if isinstance(valor, dict):
+        return {str(k): _normalizar(v) for k, v in sorted(valor.items())}
+    if isinstance(valor, (list, tuple)):
+        return [_normalizar(v) for v in valor]
+    if isinstance(valor, np.generic):
+        valor = valor.item()
+    if valor is None or isinstance(valor, (bool, str)):
+        return valor
+    if isinstance(valor, (int, float)):
+        # 20 y 20.0 describen el mismo escenario
+        return float(valor)
+    raise TypeError(f"Valor no admitido en la clave de caché: {valor!r}")
+
+
+def clave_simulacion(params: HeatSimulationParameters, motor: str = 'euler',
+                     evento_estocastico: Optional[Dict] = None, semilla: Optional[int] = None,
+                     **opciones) -> str:
+    """
+    Hash estable de todo lo que determina el resultado de una simulación.
+
+    Args:
+        params: Parámetros de la simulación
+        motor: Motor usado ('euler', 'analitico', ...)
+        evento_estocastico: Configuración de eventos (o None)
+        semilla: Semilla entera de la corrida (o None)
+        **opciones: Otras opciones del motor (parar_en_100c, registrar, ...)
+
+    Returns:
+        Clave hexadecimal SHA-256
+    """
+    contenido = {
+        'params': params.como_dict(),
+        'motor': motor,
+        'evento': evento_estocastico,
+        'semilla': semilla,
+        'opciones': opciones,
+    }
+    texto = json.dumps(_normalizar(contenido), sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(texto.encode('utf-8')).hexdigest()
+
+
+class CacheSimulaciones:
+    """Caché de dos niveles: LRU en memoria y, opcionalmente, archivos .npz en disco."""
+
+    def __init__(self, max_items: int = 128, directorio: Optional[str] = None,
+                 max_bytes: int = 256 * 2**20):
+        """
+        Args:
+            max_items: Resultados que se conservan en memoria
+            directorio: Carpeta del nivel en disco (None = solo memoria)
+            max_bytes: Tamaño máximo del nivel en disco; al superarlo se borran
+                los archivos usados hace más tiempo
+        """
+        self.max_items = max_items
+        self.directorio = directorio
+        self.max_bytes = max_bytes
+        self._memoria = OrderedDict()
+        self.aciertos = 0
+        self.fallos = 0
+        if directorio is not None:
+            os.makedirs(directorio, exist_ok=True)
+
+    def _ruta(self, clave: str) -> str:
+        return os.path.join(self.directorio, f"{clave}.npz")
+
+    def _recordar(self, clave: str, arrays: Tuple[np.ndarray, ...]):
+        """Guarda en memoria, desalojando el menos usado si hace falta."""
+        self._memoria[clave] = arrays
+        self._memoria.move_to_end(clave)
+        while len(self._memoria) > self.max_items:
+            self._memoria.popitem(last=False)
+
+    def obtener(self, clave: str) -> Optional[Tuple[np.ndarray, ...]]:
+        """
+        Busca un resultado (primero en memoria, después en disco).
+
+        Returns:
+            Tupla de arrays de solo lectura, o None si no está
+        """
+        if clave in self._memoria:
+            self._memoria.move_to_end(clave)
+            self.aciertos += 1
+            return self._memoria[clave]
+
+        if self.directorio is not None:
+            ruta = self._ruta(clave)
+            try:
+                with np.load(ruta) as datos:
+                    arrays = tuple(datos[f"arr_{i}"] for i in range(len(datos.files)))
+                # Marca de uso para el desalojo por antigüedad; otro proceso pudo
+                # haber borrado el archivo después de leerlo
+                os.utime(ruta)
+            except FileNotFoundError:
+                arrays = None
+            except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile):
+                # Archivo truncado o dañado: se descarta y cuenta como fallo
+                arrays = None
+                self._borrar_archivo(ruta)
+            if arrays is not None:
+                for array in arrays:
+                    array.setflags(write=False)
+                self._recordar(clave, arrays)
+                self.aciertos += 1
+                return arrays
+
+        self.fallos += 1
+        return None
+
+    def guardar(self, clave: str, *arrays: np.ndarray) -> Tuple[np.ndarray, ...]:
+        """
+        Guarda un resultado en ambos niveles.
+
+        Returns:
+            Los arrays guardados (copias de solo lectura)
+        """
+        arrays = tuple(np.array(a, copy=True) for a in arrays)
+        for array in arrays:
+            array.setflags(write=False)
+        self._recordar(clave, arrays)
+
+        if self.directorio is not None:
+            # Escritura atómica: otro proceso nunca ve un archivo a medio escribir
+            descriptor, temporal = tempfile.mkstemp(dir=self.directorio, suffix='.tmp')
+            with os.fdopen(descriptor, 'wb') as archivo:
+                np.savez(archivo, *arrays)
+            os.replace(temporal, self._ruta(clave))
+            self._desalojar_disco()
+        return arrays
+
+    @staticmethod
+    def _borrar_archivo(ruta: str):
+        """Borra un archivo de la caché si todavía existe."""
+        try:
+            os.remove(ruta)
+        except FileNotFoundError:
+            pass
+
+    def _desalojar_disco(self):
+        """Borra los archivos menos usados hasta quedar por debajo de max_bytes."""
+        archivos = []
+        for nombre in os.listdir(self.directorio):
+            if nombre.endswith('.npz'):
+                info = os.stat(os.path.join(self.directorio, nombre))
+                archivos.append((info.st_mtime_ns, info.st_size, nombre))
+
+        total = sum(tamaño for _, tamaño, _ in archivos)
+        for _, tamaño, nombre in sorted(archivos):
+            if total <= self.max_bytes:
+                break
+            self._borrar_archivo(os.path.join(self.directorio, nombre))
+            total -= tamaño
+
+    def limpiar(self, disco: bool = False):
+        """Vacía el nivel en memoria y, si disco es True, también el de disco."""
+        self._memoria.clear()
+        if disco and self.directorio is not None:
+            for nombre in os.listdir(self.directorio):
+                if nombre.endswith('.npz'):
+                    os.remove(os.path.join(self.directorio, nombre))
+
+
+_cache_global = CacheSimulaciones()
+
+
+def configurar_cache(max_items: int = 128, directorio: Optional[str] = None,
+                     max_bytes: int = 256 * 2**20) -> CacheSimulaciones:
+    """Reemplaza la caché global usada por simular_cacheado y la devuelve."""
+    global _cache_global
+    _cache_global = CacheSimulaciones(max_items, directorio, max_bytes)
+    return _cache_global
+
+
+def cache_global() -> CacheSimulaciones:
+    """Caché global usada por simular_cacheado."""
+    return _cache_global
+
+
+def simular_cacheado(params: HeatSimulationParameters,
+                     evento_estocastico: Optional[Dict] = None,
+                     parar_en_100c: bool = True,
+                     motor: str = 'euler',
+                     semilla: Optional[int] = None,
+                     cache: Optional[CacheSimulaciones] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Igual que HeatSimulator.simular (o AnalyticHeatSolver.simular con
+    motor='analitico'), pero reutiliza el resultado si el escenario ya se simuló.
+
+    Las corridas con eventos estocásticos solo se guardan si tienen semilla:
+    sin ella cada corrida es distinta y se simula siempre.
+
+    Args:
+        params: Parámetros de la simulación
+        evento_estocastico: Configuración de eventos (solo motor 'euler')
+        parar_en_100c: Si True, para al alcanzar 100°C
+        motor: 'euler' (HeatSimulator) o 'analitico' (AnalyticHeatSolver)
+        semilla: Semilla entera para los eventos
+        cache: Caché a usar (por defecto, la global)
+
+    Returns:
+        Tupla de arrays de solo lectura (tiempos, temperaturas)
+    """
+    def simular():
+        if motor == 'analitico':
+            if evento_estocastico:
+                raise ValueError("El motor analítico no admite eventos estocásticos")
+            return AnalyticHeatSolver(params).simular(parar_en_100c=parar_en_100c)
+        if motor == 'euler':
+            rng = None if semilla is None else np.random.default_rng(semilla)
+            return HeatSimulator(params, rng=rng).simular(evento_estocastico=evento_estocastico,
+                                                          parar_en_100c=parar_en_100c)
+        raise ValueError(f"Motor desconocido: {motor}")
+
+    if evento_estocastico and semilla is None:
+        return simular()
+
+    cache = _cache_global if cache is None else cache
+    clave = clave_simulacion(params, motor, evento_estocastico, semilla, parar_en_100c=parar_en_100c)
+    resultado = cache.obtener(clave)
+    if resultado is None:
+        resultado = cache.guardar(clave, *simular())
+    return resultado
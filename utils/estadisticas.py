@@ -0,0 +1,548 @@
+"""
+Estadísticas de ensambles de simulaciones calculadas en streaming.
+
+Permite resumir millones de corridas estocásticas (TP5) sin guardar sus
+trayectorias: la memoria es proporcional a la cantidad de pasos de tiempo (o
+al tamaño de la grilla de DensidadEnsamble) y no a la cantidad de corridas.
+"""
+import numpy as np
+
+
+class EstadisticasEnsamble:
+    """
+    Acumulador de conteo, media, varianza, mínimo y máximo por paso de tiempo.
+
+    Usa el algoritmo de Welford corrida a corrida y la combinación de Chan et al.
+    para lotes y para unir acumuladores de distintos procesos. Las trayectorias
+    deben estar en la grilla uniforme de paso dt (las que devuelve
+    HeatSimulator.simular en modo completo). Las corridas que paran antes (por
+    ejemplo al llegar a 100°C) solo aportan a los pasos que efectivamente
+    simularon, así que conteo varía con el tiempo.
+    """
+
+    def __init__(self, dt: float = 1.0, n_pasos: int = 0):
+        """
+        Args:
+            dt: Paso de tiempo de las trayectorias (s)
+            n_pasos: Cantidad de pasos a preasignar (crece si hace falta)
+        """
+        self.dt = dt
+        self.n_corridas = 0
+        self.longitud = 0
+        self._conteo = np.zeros(n_pasos, dtype=np.int64)
+        self._media = np.zeros(n_pasos)
+        self._m2 = np.zeros(n_pasos)
+        self._minimo = np.full(n_pasos, np.inf)
+        self._maximo = np.full(n_pasos, -np.inf)
+
+    def _asegurar_longitud(self, longitud: int):
+        """Agranda los acumuladores (duplicando capacidad) para cubrir longitud pasos."""
+        self.longitud = max(self.longitud, longitud)
+        capacidad = self._conteo.size
+        if longitud <= capacidad:
+            return
+
+        extra = max(longitud, 2 * capacidad) - capacidad
+        self._conteo = np.concatenate([self._conteo, np.zeros(extra, dtype=np.int64)])
+        self._media = np.concatenate([self._media, np.zeros(extra)])
+        self._m2 = np.concatenate([self._m2, np.zeros(extra)])
+        self._minimo = np.concatenate([self._minimo, np.full(extra, np.inf)])
+        self._maximo = np.concatenate([self._maximo, np.full(extra, -np.inf)])
+
+    def agregar(self, temperaturas):
+        """
+        Agrega una trayectoria (paso de Welford en cada paso de tiempo).
+
+        Args:
+            temperaturas: Temperaturas de una corrida, una por paso desde t = 0
+        """
+        x = np.asarray(temperaturas, dtype=np.float64)
+        n = x.size
+        self._asegurar_longitud(n)
+
+        self._conteo[:n] += 1
+        delta = x - self._media[:n]
+        self._media[:n] += delta / self._conteo[:n]
+        self._m2[:n] += delta * (x - self._media[:n])
+        np.minimum(self._minimo[:n], x, out=self._minimo[:n])
+        np.maximum(self._maximo[:n], x, out=self._maximo[:n])
+        self.n_corridas += 1
+
+    def agregar_lote(self, temperaturas):
+        """
+        Agrega un lote de trayectorias de una sola vez.
+
+        Args:
+            temperaturas: Matriz (corridas, pasos) rellenada con NaN después del
+                final de cada corrida, como la de BatchHeatSimulator.simular
+        """
+        matriz = np.atleast_2d(np.asarray(temperaturas, dtype=np.float64))
+        validos = ~np.isnan(matriz)
+        conteo = validos.sum(axis=0)
+        # Se descartan las columnas finales sin ninguna corrida
+        n = int(np.flatnonzero(conteo)[-1]) + 1 if conteo.any() else 0
+        matriz, validos, conteo = matriz[:, :n], validos[:, :n], conteo[:n]
+
+        con_datos = conteo > 0
+        media = np.zeros(n)
+        media[con_datos] = np.where(validos, matriz, 0.0).sum(axis=0)[con_datos] / conteo[con_datos]
+        m2 = np.where(validos, (matriz - media) ** 2, 0.0).sum(axis=0)
+        minimo = np.where(validos, matriz, np.inf).min(axis=0, initial=np.inf)
+        maximo = np.where(validos, matriz, -np.inf).max(axis=0, initial=-np.inf)
+
+        self._combinar_arrays(conteo, media, m2, minimo, maximo)
+        self.n_corridas += matriz.shape[0]
+
+    def combinar(self, otro: 'EstadisticasEnsamble') -> 'EstadisticasEnsamble':
+        """
+        Incorpora las corridas de otro acumulador (por ejemplo, de otro proceso).
+
+        Returns:
+            El propio acumulador, para encadenar llamadas
+        """
+        if otro.dt != self.dt:
+            raise ValueError("No se pueden combinar ensambles con distinto dt")
+        n = otro.longitud
+        self._combinar_arrays(otro._conteo[:n], otro._media[:n], otro._m2[:n],
+                              otro._minimo[:n], otro._maximo[:n])
+        self.n_corridas += otro.n_corridas
+        return self
+
+    def _combinar_arrays(self, conteo, media, m2, minimo, maximo):
+        """Combinación de Chan et al. de dos conjuntos de momentos, paso a paso."""
+        n = conteo.size
+        self._asegurar_longitud(n)
+
+        conteo_a = self._conteo[:n]
+        total = conteo_a + conteo
+        con_datos = total > 0
+        delta = media - self._media[:n]
+
+        peso = np.zeros(n)
+        peso[con_datos] = conteo[con_datos] / total[con_datos]
+        self._media[:n] += delta * peso
+        self._m2[:n] += m2 + delta ** 2 * conteo_a * peso
+        self._conteo[:n] = total
+        np.minimum(self._minimo[:n], minimo, out=self._minimo[:n])
+        np.maximum(self._maximo[:n], maximo, out=self._maximo[:n])
+
+    @property
+    def tiempos(self) -> np.ndarray:
+        """Tiempos de cada paso (s)."""
+        return np.arange(self.longitud) * self.dt
+
+    @property
+    def conteo(self) -> np.ndarray:
+        """Cantidad de corridas que llegaron a cada paso."""
+        return self._conteo[:self.longitud].copy()
+
+    @property
+    def media(self) -> np.ndarray:
+        """Temperatura media por paso."""
+        return self._media[:self.longitud].copy()
+
+    @property
+    def varianza(self) -> np.ndarray:
+        """Varianza muestral por paso (NaN donde hay menos de 2 corridas)."""
+        conteo = self._conteo[:self.longitud]
+        varianza = np.full(self.longitud, np.nan)
+        suficientes = conteo > 1
+        varianza[suficientes] = self._m2[:self.longitud][suficientes] / (conteo[suficientes] - 1)
+        return varianza
+
+    @property
+    def desviacion(self) -> np.ndarray:
+        """Desviación estándar muestral por paso."""
+        return np.sqrt(self.varianza)
+
+    @property
+    def minimo(self) -> np.ndarray:
+        """Temperatura mínima por paso."""
+        return self._minimo[:self.longitud].copy()
+
+    @property
+    def maximo(self) -> np.ndarray:
+        """Temperatura máxima por paso."""
+        return self._maximo[:self.longitud].copy()
+
+
+def _comprimir_centroides(valores: np.ndarray, pesos: np.ndarray, compresion: float) -> tuple:
+    """
+    Agrupa los valores de cada fila en centroides de t-digest (función de escala k1).
+
+    Los valores de cada fila se ordenan y se agrupan los consecutivos cuyo peso
+    acumulado cae en la misma unidad de k(q) = δ/2π·asin(2q-1), así que los
+    centroides son chicos en las colas y grandes cerca de la mediana.
+
+    Args:
+        valores: Matriz (filas, k) de valores o medias de centroides
+        pesos: Matriz (filas, k) de pesos; 0 marca una posición vacía
+        compresion: Parámetro δ del t-digest
+
+    Returns:
+        Tupla (medias, pesos) de forma (filas, δ/2 + 1), ordenadas por valor en
+        cada fila y con las posiciones vacías (peso 0, media NaN) al final
+    """
+    n_filas = valores.shape[0]
+    n_grupos = int(compresion // 2) + 1
+
+    valores = np.where(pesos > 0, valores, np.inf)
+    orden = np.argsort(valores, axis=1, kind='stable')
+    valores = np.take_along_axis(valores, orden, axis=1)
+    pesos = np.take_along_axis(pesos, orden, axis=1)
+
+    total = pesos.sum(axis=1, keepdims=True)
+    izquierda = np.cumsum(pesos, axis=1) - pesos
+    q = np.divide(izquierda, total, out=np.zeros_like(izquierda), where=total > 0)
+    k = compresion / (2 * np.pi) * np.arcsin(np.clip(2 * q - 1, -1, 1)) + compresion / 4
+    grupo = np.clip(np.floor(k).astype(np.int64), 0, n_grupos - 1)
+
+    indice = (np.arange(n_filas)[:, None] * n_grupos + grupo).ravel()
+    suma_pesos = np.bincount(indice, weights=pesos.ravel(), minlength=n_filas * n_grupos)
+    suma_valores = np.bincount(indice, weights=(pesos * np.where(pesos > 0, valores, 0.0)).ravel(),
+                               minlength=n_filas * n_grupos)
+    suma_pesos = suma_pesos.reshape(n_filas, n_grupos)
+    suma_valores = suma_valores.reshape(n_filas, n_grupos)
+
+    # Los grupos vacíos se corren al final sin alterar el orden de los demás
+    orden = np.argsort(suma_pesos == 0, axis=1, kind='stable')
+    suma_pesos = np.take_along_axis(suma_pesos, orden, axis=1)
+    suma_valores = np.take_along_axis(suma_valores, orden, axis=1)
+    medias = np.divide(suma_valores, suma_pesos, out=np.full_like(suma_valores, np.nan),
+                       where=suma_pesos > 0)
+    return medias, suma_pesos
+
+
+class TDigestVectorial:
+    """
+    Un t-digest (Dunning) por columna, actualizado en bloque con NumPy.
+
+    Cada columna estima cuantiles de una variable con memoria fija (unos δ/2
+    centroides) sin importar cuántas observaciones reciba. Las observaciones se
+    acumulan en un buffer y se comprimen de a tam_buffer filas. Dos digests se
+    pueden combinar, así que cada proceso puede resumir sus corridas y
+    unirlas al final. Para variables escalares (por ejemplo, el tiempo hasta
+    100°C) se usa una sola columna.
+    """
+
+    def __init__(self, compresion: float = 200, n_columnas: int = 0, tam_buffer: int = 256):
+        """
+        Args:
+            compresion: Parámetro δ: más alto da cuantiles más precisos y más centroides
+            n_columnas: Columnas a preasignar (crece si hace falta)
+            tam_buffer: Filas acumuladas antes de comprimir
+        """
+        if compresion < 10:
+            raise ValueError("compresion debe ser al menos 10")
+        self.compresion = compresion
+        self.tam_buffer = tam_buffer
+        self.n_columnas = n_columnas
+        n_grupos = int(compresion // 2) + 1
+        self._medias = np.full((n_columnas, n_grupos), np.nan)
+        self._pesos = np.zeros((n_columnas, n_grupos))
+        self._minimo = np.full(n_columnas, np.inf)
+        self._maximo = np.full(n_columnas, -np.inf)
+        self._buffer = np.full((tam_buffer, n_columnas), np.nan)
+        self._filas_buffer = 0
+
+    def _asegurar_columnas(self, n_columnas: int):
+        """Agrega columnas vacías hasta cubrir n_columnas."""
+        extra = n_columnas - self.n_columnas
+        if extra <= 0:
+            return
+        self._medias = np.vstack([self._medias, np.full((extra, self._medias.shape[1]), np.nan)])
+        self._pesos = np.vstack([self._pesos, np.zeros((extra, self._pesos.shape[1]))])
+        self._minimo = np.concatenate([self._minimo, np.full(extra, np.inf)])
+        self._maximo = np.concatenate([self._maximo, np.full(extra, -np.inf)])
+        self._buffer = np.hstack([self._buffer, np.full((self.tam_buffer, extra), np.nan)])
+        self.n_columnas = n_columnas
+
+    def _incorporar(self, valores: np.ndarray, pesos: np.ndarray):
+        """Comprime los centroides actuales junto con valores/pesos (columnas x k)."""
+        self._medias, self._pesos = _comprimir_centroides(
+            np.hstack([self._medias, valores]), np.hstack([self._pesos, pesos]), self.compresion)
+
+    def _vaciar_buffer(self):
+        """Comprime las observaciones pendientes del buffer."""
+        if self._filas_buffer == 0:
+            return
+        bloque = self._buffer[:self._filas_buffer].T
+        self._incorporar(bloque, (~np.isnan(bloque)).astype(np.float64))
+        self._buffer[:self._filas_buffer] = np.nan
+        self._filas_buffer = 0
+
+    def agregar(self, valores):
+        """
+        Agrega una observación por columna (por ejemplo, una trayectoria).
+
+        Args:
+            valores: Valores para las primeras len(valores) columnas; NaN = sin dato
+        """
+        valores = np.atleast_1d(np.asarray(valores, dtype=np.float64))
+        n = valores.size
+        self._asegurar_columnas(n)
+        self._buffer[self._filas_buffer, :n] = valores
+        np.fmin(self._minimo[:n], valores, out=self._minimo[:n])
+        np.fmax(self._maximo[:n], valores, out=self._maximo[:n])
+        self._filas_buffer += 1
+        if self._filas_buffer == self.tam_buffer:
+            self._vaciar_buffer()
+
+    def agregar_lote(self, valores):
+        """
+        Agrega varias observaciones por columna.
+
+        Args:
+            valores: Matriz (observaciones, columnas) rellenada con NaN
+        """
+        matriz = np.asarray(valores, dtype=np.float64)
+        if matriz.ndim == 1:
+            matriz = matriz[:, None]
+        n = matriz.shape[1]
+        self._asegurar_columnas(n)
+        self._vaciar_buffer()
+        self._incorporar(matriz.T, (~np.isnan(matriz.T)).astype(np.float64))
+        if matriz.shape[0] > 0:
+            np.fmin(self._minimo[:n], np.nanmin(matriz, axis=0, initial=np.inf), out=self._minimo[:n])
+            np.fmax(self._maximo[:n], np.nanmax(matriz, axis=0, initial=-np.inf), out=self._maximo[:n])
+
+    def combinar(self, otro: 'TDigestVectorial') -> 'TDigestVectorial':
+        """
+        Incorpora los centroides de otro digest (por ejemplo, de otro proceso).
+
+        Returns:
+            El propio digest, para encadenar llamadas
+        """
+        otro._vaciar_buffer()
+        self._vaciar_buffer()
+        n = otro.n_columnas
+        self._asegurar_columnas(n)
+
+        medias = np.full((self.n_columnas, otro._medias.shape[1]), np.nan)
+        pesos = np.zeros_like(medias)
+        medias[:n], pesos[:n] = otro._medias, otro._pesos
+        self._incorporar(medias, pesos)
+        np.fmin(self._minimo[:n], otro._minimo, out=self._minimo[:n])
+        np.fmax(self._maximo[:n], otro._maximo, out=self._maximo[:n])
+        return self
+
+    @property
+    def conteo(self) -> np.ndarray:
+        """Cantidad de observaciones por columna."""
+        self._vaciar_buffer()
+        return self._pesos.sum(axis=1)
+
+    def cuantiles(self, qs) -> np.ndarray:
+        """
+        Estima cuantiles interpolando entre centroides (y los extremos exactos).
+
+        Args:
+            qs: Cuantil o lista de cuantiles entre 0 y 1
+
+        Returns:
+            Array (len(qs), columnas), o (columnas,) si qs es un escalar. Las
+            columnas sin observaciones dan NaN
+        """
+        self._vaciar_buffer()
+        escalar = np.ndim(qs) == 0
+        qs = np.atleast_1d(np.asarray(qs, dtype=np.float64))
+
+        pesos = self._pesos
+        total = pesos.sum(axis=1)
+        vacio = pesos == 0
+        centros = np.where(vacio, total[:, None], np.cumsum(pesos, axis=1) - pesos / 2)
+        medias = np.where(vacio, self._maximo[:, None], self._medias)
+
+        # Puntos (peso acumulado, valor): mínimo exacto, centroides y máximo exacto
+        x = np.hstack([np.zeros((self.n_columnas, 1)), centros, total[:, None]])
+        y = np.hstack([self._minimo[:, None], medias, self._maximo[:, None]])
+        filas = np.arange(self.n_columnas)
+
+        resultado = np.empty((qs.size, self.n_columnas))
+        for i, q in enumerate(qs):
+            objetivo = q * total
+            derecha = np.clip((x < objetivo[:, None]).sum(axis=1), 1, x.shape[1] - 1)
+            x0, x1 = x[filas, derecha - 1], x[filas, derecha]
+            y0, y1 = y[filas, derecha - 1], y[filas, derecha]
+            fraccion = np.divide(objetivo - x0, x1 - x0, out=np.ones_like(x0), where=x1 > x0)
+            resultado[i] = y0 + np.clip(fraccion, 0, 1) * (y1 - y0)
+        resultado[:, total == 0] = np.nan
+
+        return resultado[0] if escalar else resultado
+
+
+class CuantilesEnsamble:
+    """
+    Cuantiles en streaming de un ensamble de corridas: un t-digest por paso de
+    tiempo para la temperatura y uno por cada resultado escalar (tiempo hasta
+    100°C, temperatura máxima, etc.).
+    """
+
+    def __init__(self, dt: float = 1.0, compresion: float = 200):
+        """
+        Args:
+            dt: Paso de tiempo de las trayectorias (s)
+            compresion: Parámetro δ de los t-digest
+        """
+        self.dt = dt
+        self.compresion = compresion
+        self.n_corridas = 0
+        self.temperaturas = TDigestVectorial(compresion)
+        self.escalares = {}
+
+    def agregar(self, temperaturas=None, **escalares):
+        """
+        Agrega una corrida.
+
+        Args:
+            temperaturas: Trayectoria en la grilla uniforme de paso dt (opcional)
+            **escalares: Resultados escalares de la corrida, por ejemplo
+                tiempo_100c=1130.0 (None se ignora)
+        """
+        if temperaturas is not None:
+            self.temperaturas.agregar(temperaturas)
+        for nombre, valor in escalares.items():
+            if valor is None:
+                continue
+            if nombre not in self.escalares:
+                self.escalares[nombre] = TDigestVectorial(self.compresion, n_columnas=1)
+            self.escalares[nombre].agregar([valor])
+        self.n_corridas += 1
+
+    def combinar(self, otro: 'CuantilesEnsamble') -> 'CuantilesEnsamble':
+        """Incorpora las corridas de otro ensamble. Devuelve el propio ensamble."""
+        if otro.dt != self.dt:
+            raise ValueError("No se pueden combinar ensambles con distinto dt")
+        self.temperaturas.combinar(otro.temperaturas)
+        for nombre, digest in otro.escalares.items():
+            if nombre not in self.escalares:
+                self.escalares[nombre] = TDigestVectorial(self.compresion, n_columnas=1)
+            self.escalares[nombre].combinar(digest)
+        self.n_corridas += otro.n_corridas
+        return self
+
+    @property
+    def tiempos(self) -> np.ndarray:
+        """Tiempos de cada paso (s)."""
+        return np.arange(self.temperaturas.n_columnas) * self.dt
+
+    def cuantiles_temperatura(self, qs) -> np.ndarray:
+        """Cuantiles de temperatura por paso, forma (len(qs), pasos)."""
+        return self.temperaturas.cuantiles(qs)
+
+    def cuantiles_escalar(self, nombre: str, qs):
+        """Cuantiles de un resultado escalar (un valor o un array según qs)."""
+        return self.escalares[nombre].cuantiles(qs)[..., 0]
+
+
+class DensidadEnsamble:
+    """
+    Histograma 2D (tiempo, temperatura) de todas las muestras de un ensamble.
+
+    Cada punto de cada trayectoria suma uno a la celda que le corresponde, así
+    que la memoria es la de la grilla (n_temperatura x n_tiempo contadores) sin
+    importar cuántas corridas se agreguen. Las muestras fuera del rango de
+    temperatura se cuentan aparte en fuera_de_rango; los tiempos mayores a
+    t_max se descartan.
+    """
+
+    def __init__(self, t_max: float, T_min: float = 0.0, T_max: float = 110.0,
+                 n_tiempo: int = 600, n_temperatura: int = 300):
+        """
+        Args:
+            t_max: Tiempo final de la grilla (s)
+            T_min: Temperatura mínima de la grilla (°C)
+            T_max: Temperatura máxima de la grilla (°C)
+            n_tiempo: Columnas (intervalos de tiempo)
+            n_temperatura: Filas (intervalos de temperatura)
+        """
+        if t_max <= 0 or T_max <= T_min:
+            raise ValueError("La grilla debe tener rangos de tiempo y temperatura positivos")
+        self.t_max = t_max
+        self.T_min = T_min
+        self.T_max = T_max
+        self.n_tiempo = n_tiempo
+        self.n_temperatura = n_temperatura
+        self.n_corridas = 0
+        self.fuera_de_rango = 0
+        self._conteos = np.zeros(n_temperatura * n_tiempo, dtype=np.int64)
+
+    def _acumular(self, tiempos: np.ndarray, temperaturas: np.ndarray):
+        """Suma a la grilla las muestras (tiempo, temperatura) válidas."""
+        validos = (tiempos <= self.t_max) & ~np.isnan(temperaturas)
+        tiempos, temperaturas = tiempos[validos], temperaturas[validos]
+
+        fila = np.floor((temperaturas - self.T_min) * (self.n_temperatura / (self.T_max - self.T_min)))
+        dentro = (fila >= 0) & (fila < self.n_temperatura)
+        self.fuera_de_rango += int(dentro.size - np.count_nonzero(dentro))
+
+        columna = np.minimum((tiempos[dentro] * (self.n_tiempo / self.t_max)).astype(np.int64),
+                             self.n_tiempo - 1)
+        indice = fila[dentro].astype(np.int64) * self.n_tiempo + columna
+        if indice.size < self._conteos.size:
+            np.add.at(self._conteos, indice, 1)
+        else:
+            # Lotes grandes: un bincount sobre toda la grilla es más rápido
+            self._conteos += np.bincount(indice, minlength=self._conteos.size)
+
+    def agregar(self, tiempos, temperaturas):
+        """
+        Agrega una trayectoria.
+
+        Args:
+            tiempos: Tiempos de la corrida (s)
+            temperaturas: Temperaturas de la corrida
+        """
+        self._acumular(np.asarray(tiempos, dtype=np.float64), np.asarray(temperaturas, dtype=np.float64))
+        self.n_corridas += 1
+
+    def agregar_lote(self, tiempos, temperaturas):
+        """
+        Agrega un lote de trayectorias de una sola vez.
+
+        Args:
+            tiempos: Tiempos comunes (pasos,)
+            temperaturas: Matriz (corridas, pasos) rellenada con NaN después del
+                final de cada corrida, como la de BatchHeatSimulator.simular
+        """
+        matriz = np.atleast_2d(np.asarray(temperaturas, dtype=np.float64))
+        tiempos = np.broadcast_to(np.asarray(tiempos, dtype=np.float64), matriz.shape)
+        self._acumular(tiempos.ravel(), matriz.ravel())
+        self.n_corridas += matriz.shape[0]
+
+    def combinar(self, otro: 'DensidadEnsamble') -> 'DensidadEnsamble':
+        """
+        Incorpora las muestras de otro acumulador con la misma grilla.
+
+        Returns:
+            El propio acumulador, para encadenar llamadas
+        """
+        grilla = (self.t_max, self.T_min, self.T_max, self.n_tiempo, self.n_temperatura)
+        if grilla != (otro.t_max, otro.T_min, otro.T_max, otro.n_tiempo, otro.n_temperatura):
+            raise ValueError("No se pueden combinar densidades con distinta grilla")
+        self._conteos += otro._conteos
+        self.n_corridas += otro.n_corridas
+        self.fuera_de_rango += otro.fuera_de_rango
+        return self
+
+    @property
+    def conteos(self) -> np.ndarray:
+        """Matriz (n_temperatura, n_tiempo) de muestras por celda; la fila 0 es T_min."""
+        return self._conteos.reshape(self.n_temperatura, self.n_tiempo).copy()
+
+    @property
+    def densidad(self) -> np.ndarray:
+        """Fracción de las muestras de cada columna de tiempo que cae en cada celda."""
+        conteos = self.conteos.astype(np.float64)
+        total = conteos.sum(axis=0)
+        return np.divide(conteos, total, out=np.zeros_like(conteos), where=total > 0)
+
+    @property
+    def bordes_tiempo(self) -> np.ndarray:
+        """Bordes de los intervalos de tiempo (s)."""
+        return np.linspace(0.0, self.t_max, self.n_tiempo + 1)
+
+    @property
+    def bordes_temperatura(self) -> np.ndarray:
+        """Bordes de los intervalos de temperatura (°C)."""
+        return np.linspace(self.T_min, self.T_max, self.n_temperatura + 1)
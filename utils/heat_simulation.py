@@ -1,10 +1,32 @@
 import numpy as np
-import matplotlib.pyplot as plt
 from typing import Dict, List, Tuple, Optional, Any
 
+from utils.muestreo import sobol, latin_hypercube, normal_inversa
+from utils.perezoso import importar_perezoso
+from utils.submuestreo import lttb_lote, matriz_de_curvas
+
+# matplotlib se carga recién al graficar: los motores no lo necesitan
+plt = importar_perezoso('matplotlib.pyplot')
+
 
 class HeatSimulationParameters:
-    """Clase para almacenar todos los parámetros de la simulación térmica."""
+    """
+    Parámetros de la simulación térmica (inmutables).
+    
+    Los parámetros derivados (U y áreas) se calculan una sola vez al construir
+    el objeto. Para variar un parámetro se crea otro con replace, así que nunca
+    quedan desactualizados. Al ser inmutables se comparan y se hashean por
+    valor: sirven como claves de diccionario y se comparten entre hilos o
+    procesos sin copiarlos.
+    """
+    
+    # Parámetros básicos, en el orden del constructor
+    CAMPOS = ('masa', 'calor_especifico', 'potencia', 'T_amb', 'T_inicial', 'tiempo_total', 'dt',
+              'radio', 'altura', 'espesor_acero', 'espesor_poliuretano', 'k_acero', 'k_poliuretano',
+              'tension', 'resistencia')
+    DERIVADOS = ('U', 'area_lateral', 'area_superior', 'area_total')
+    
+    __slots__ = CAMPOS + DERIVADOS + ('_hash',)
     
     def __init__(self,
                  masa: float = 1.0,
@@ -23,47 +45,102 @@ class HeatSimulationParameters:
                  tension: float = 12.0,  # Voltios
                  resistencia: float = 0.4):  # Ohms, para calcular potencia = V²/R
         
-        self.masa = masa
-        self.calor_especifico = calor_especifico
-        self.potencia = potencia
-        self.T_amb = T_amb
-        self.T_inicial = T_inicial
-        self.tiempo_total = tiempo_total
-        self.dt = dt
-        self.radio = radio
-        self.altura = altura
-        self.espesor_acero = espesor_acero
-        self.espesor_poliuretano = espesor_poliuretano
-        self.k_acero = k_acero
-        self.k_poliuretano = k_poliuretano
-        self.tension = tension
-        self.resistencia = resistencia
-        
-        # Calcular parámetros derivados
-        self._calcular_parametros_derivados()
-    
-    def _calcular_parametros_derivados(self):
-        """Calcula parámetros derivados a partir de los básicos."""
-        # Coeficiente de transmisión térmica U
-        R_acero = self.espesor_acero / self.k_acero
-        R_poliuretano = self.espesor_poliuretano / self.k_poliuretano
-        R_total = R_acero + R_poliuretano
+        asignar = object.__setattr__
+        asignar(self, 'masa', masa)
+        asignar(self, 'calor_especifico', calor_especifico)
+        asignar(self, 'potencia', potencia)
+        asignar(self, 'T_amb', T_amb)
+        asignar(self, 'T_inicial', T_inicial)
+        asignar(self, 'tiempo_total', tiempo_total)
+        asignar(self, 'dt', dt)
+        asignar(self, 'radio', radio)
+        asignar(self, 'altura', altura)
+        asignar(self, 'espesor_acero', espesor_acero)
+        asignar(self, 'espesor_poliuretano', espesor_poliuretano)
+        asignar(self, 'k_acero', k_acero)
+        asignar(self, 'k_poliuretano', k_poliuretano)
+        asignar(self, 'tension', tension)
+        asignar(self, 'resistencia', resistencia)
+        asignar(self, '_hash', None)
         
+        # Coeficiente de transmisión térmica U
         # Para simulaciones sin pérdidas, U debe ser cero o muy pequeño
-        if self.k_acero >= 1e6 or self.k_poliuretano >= 1e6:
-            self.U = 0.0  # Sin pérdidas térmicas
+        if k_acero >= 1e6 or k_poliuretano >= 1e6:
+            asignar(self, 'U', 0.0)  # Sin pérdidas térmicas
         else:
-            self.U = 1 / R_total
+            asignar(self, 'U', 1 / (espesor_acero / k_acero + espesor_poliuretano / k_poliuretano))
         
         # Geometría del cilindro
-        self.area_lateral = 2 * np.pi * self.radio * self.altura
-        self.area_superior = np.pi * self.radio**2
-        self.area_total = self.area_lateral + self.area_superior
+        area_lateral = 2 * np.pi * radio * altura
+        area_superior = np.pi * radio**2
+        asignar(self, 'area_lateral', area_lateral)
+        asignar(self, 'area_superior', area_superior)
+        asignar(self, 'area_total', area_lateral + area_superior)
+    
+    def __setattr__(self, nombre, valor):
+        raise AttributeError(f"HeatSimulationParameters es inmutable; use replace({nombre}=...)")
+    
+    def __delattr__(self, nombre):
+        raise AttributeError("HeatSimulationParameters es inmutable")
+    
+    def valores(self) -> tuple:
+        """Valores de los parámetros básicos, en el orden de CAMPOS."""
+        return tuple(getattr(self, campo) for campo in self.CAMPOS)
+    
+    def como_dict(self) -> Dict[str, float]:
+        """Diccionario {parámetro: valor} de los parámetros básicos."""
+        return dict(zip(self.CAMPOS, self.valores()))
+    
+    def replace(self, **cambios) -> 'HeatSimulationParameters':
+        """
+        Crea una copia con algunos parámetros cambiados.
+        
+        Args:
+            **cambios: Parámetros básicos a reemplazar
+        
+        Returns:
+            Nuevos parámetros, con los derivados recalculados
+        """
+        desconocidos = set(cambios) - set(self.CAMPOS)
+        if desconocidos:
+            raise TypeError(f"Parámetros desconocidos: {', '.join(sorted(desconocidos))}")
+        argumentos = self.como_dict()
+        argumentos.update(cambios)
+        return HeatSimulationParameters(**argumentos)
+    
+    def con_potencia_desde_tension(self, tension: Optional[float] = None,
+                                   resistencia: Optional[float] = None) -> 'HeatSimulationParameters':
+        """
+        Crea una copia con la potencia calculada como tension² / resistencia.
+        
+        Args:
+            tension: Nueva tensión (por defecto, la actual)
+            resistencia: Nueva resistencia (por defecto, la actual)
+        
+        Returns:
+            Nuevos parámetros
+        """
+        tension = self.tension if tension is None else tension
+        resistencia = self.resistencia if resistencia is None else resistencia
+        return self.replace(tension=tension, resistencia=resistencia, potencia=tension**2 / resistencia)
+    
+    def __eq__(self, otro):
+        if otro.__class__ is not self.__class__:
+            return NotImplemented
+        return self.valores() == otro.valores()
     
-    def actualizar_potencia_desde_tension(self, tension: float):
-        """Actualiza la potencia basada en la tensión y resistencia."""
-        self.tension = tension
-        self.potencia = self.tension**2 / self.resistencia
+    def __hash__(self):
+        if self._hash is None:
+            object.__setattr__(self, '_hash', hash(self.valores()))
+        return self._hash
+    
+    def __reduce__(self):
+        # Con __slots__ e inmutabilidad, se reconstruye llamando al constructor
+        return (self.__class__, self.valores())
+    
+    def __repr__(self):
+        argumentos = ', '.join(f"{campo}={valor!r}" for campo, valor in self.como_dict().items())
+        return f"HeatSimulationParameters({argumentos})"
 
     def calcular_temp_equilibrio(self) -> float:
         """
@@ -78,55 +155,447 @@ class HeatSimulationParameters:
         return temp_equilibrio
 
 
+class ParameterTable:
+    """
+    Tabla columnar de parámetros: una columna de NumPy por parámetro básico.
+    
+    Sirve para barridos de millones de configuraciones sin crear un objeto
+    HeatSimulationParameters por fila. Las columnas que no varían se guardan
+    como un único escalar, así que 10⁷ configuraciones que varían en dos
+    parámetros ocupan lo que esas dos columnas. Los parámetros derivados (U,
+    áreas, coeficiente de pérdidas, temperatura de equilibrio) se calculan
+    vectorizados al pedirlos.
+    """
+    
+    CAMPOS = HeatSimulationParameters.CAMPOS
+    
+    def __init__(self, n: Optional[int] = None, dtype=np.float64, **columnas):
+        """
+        Args:
+            n: Cantidad de filas (por defecto, la longitud de las columnas)
+            dtype: Tipo de las columnas (float32 reduce la memoria a la mitad)
+            **columnas: Escalares o arrays 1-D de igual longitud, por parámetro
+                básico; los que faltan toman el valor por defecto
+        """
+        desconocidos = set(columnas) - set(self.CAMPOS)
+        if desconocidos:
+            raise TypeError(f"Parámetros desconocidos: {', '.join(sorted(desconocidos))}")
+        
+        por_defecto = HeatSimulationParameters().como_dict()
+        self.dtype = np.dtype(dtype)
+        self._columnas = {}
+        for campo in self.CAMPOS:
+            columna = np.asarray(columnas.get(campo, por_defecto[campo]), dtype=self.dtype)
+            if columna.ndim > 1:
+                raise ValueError(f"La columna {campo} debe ser un escalar o un array 1-D")
+            if columna.ndim == 1:
+                if n is None:
+                    n = len(columna)
+                elif len(columna) != n:
+                    raise ValueError(f"La columna {campo} tiene {len(columna)} filas; se esperaban {n}")
+            self._columnas[campo] = columna
+        self.n = 1 if n is None else n
+    
+    @classmethod
+    def _desde_columnas(cls, n: int, dtype, columnas: Dict[str, np.ndarray]) -> 'ParameterTable':
+        """Construye una tabla con columnas ya validadas, sin copiarlas."""
+        tabla = cls.__new__(cls)
+        tabla.n = n
+        tabla.dtype = np.dtype(dtype)
+        tabla._columnas = columnas
+        return tabla
+    
+    @classmethod
+    def desde_parametros(cls, lista_params: List[HeatSimulationParameters], dtype=np.float64) -> 'ParameterTable':
+        """Construye la tabla a partir de una lista de HeatSimulationParameters."""
+        if not lista_params:
+            raise ValueError("Se necesita al menos un conjunto de parámetros")
+        columnas = np.array([p.valores() for p in lista_params], dtype=dtype)
+        return cls(len(lista_params), dtype, **{
+            campo: (columna[0] if np.all(columna == columna[0]) else columna)
+            for campo, columna in zip(cls.CAMPOS, columnas.T)
+        })
+    
+    def __len__(self) -> int:
+        return self.n
+    
+    def __getattr__(self, nombre):
+        columnas = self.__dict__.get('_columnas')
+        if columnas is not None and nombre in columnas:
+            return np.broadcast_to(columnas[nombre], (self.n,))
+        raise AttributeError(nombre)
+    
+    def es_constante(self, nombre: str) -> bool:
+        """Indica si la columna se guarda como un único valor común a todas las filas."""
+        return self._columnas[nombre].ndim == 0
+    
+    @property
+    def nbytes(self) -> int:
+        """Memoria ocupada por las columnas, en bytes."""
+        return sum(columna.nbytes for columna in self._columnas.values())
+    
+    def fila(self, i: int) -> HeatSimulationParameters:
+        """Parámetros de la fila i como HeatSimulationParameters."""
+        if not -self.n <= i < self.n:
+            raise IndexError(f"Fila {i} fuera de rango para una tabla de {self.n} filas")
+        return HeatSimulationParameters(**{
+            campo: (columna if columna.ndim == 0 else columna[i]).item()
+            for campo, columna in self._columnas.items()
+        })
+    
+    def a_parametros(self) -> List[HeatSimulationParameters]:
+        """Convierte la tabla en una lista de HeatSimulationParameters."""
+        return [self.fila(i) for i in range(self.n)]
+    
+    def __getitem__(self, indice):
+        """
+        tabla[i] devuelve los parámetros de la fila i; un slice, una máscara
+        booleana o un array de índices devuelve una tabla con esas filas.
+        """
+        if isinstance(indice, (int, np.integer)):
+            return self.fila(int(indice))
+        
+        filas = np.arange(self.n)[indice]
+        columnas = {campo: (columna if columna.ndim == 0 else columna[indice])
+                    for campo, columna in self._columnas.items()}
+        return self._desde_columnas(len(filas), self.dtype, columnas)
+    
+    def filtrar(self, mascara) -> 'ParameterTable':
+        """Filas donde la máscara booleana es verdadera."""
+        mascara = np.asarray(mascara, dtype=bool)
+        if mascara.shape != (self.n,):
+            raise ValueError("La máscara debe tener una entrada por fila")
+        return self[mascara]
+    
+    def replace(self, **columnas) -> 'ParameterTable':
+        """Copia de la tabla con algunas columnas reemplazadas."""
+        actuales = {campo: columna for campo, columna in self._columnas.items()}
+        actuales.update(columnas)
+        return ParameterTable(self.n, self.dtype, **actuales)
+    
+    def con_potencia_desde_tension(self) -> 'ParameterTable':
+        """Copia de la tabla con la potencia calculada como tension² / resistencia."""
+        potencia = self._columnas['tension'] ** 2 / self._columnas['resistencia']
+        return self.replace(potencia=potencia)
+    
+    @staticmethod
+    def concatenar(tablas: List['ParameterTable']) -> 'ParameterTable':
+        """
+        Une varias tablas, una a continuación de otra.
+        
+        Una columna sigue siendo escalar si es constante con el mismo valor en
+        todas las tablas.
+        """
+        if not tablas:
+            raise ValueError("Se necesita al menos una tabla")
+        dtype = np.result_type(*(t.dtype for t in tablas))
+        columnas = {}
+        for campo in ParameterTable.CAMPOS:
+            partes = [t._columnas[campo] for t in tablas]
+            if all(p.ndim == 0 and p == partes[0] for p in partes):
+                columnas[campo] = partes[0].astype(dtype)
+            else:
+                columnas[campo] = np.concatenate([np.broadcast_to(p, (t.n,)) for p, t in zip(partes, tablas)]).astype(dtype, copy=False)
+        return ParameterTable._desde_columnas(sum(t.n for t in tablas), dtype, columnas)
+    
+    # Parámetros derivados (mismas fórmulas que HeatSimulationParameters). Se
+    # calculan sobre las columnas guardadas, así que un derivado de columnas
+    # constantes también es un escalar hasta el broadcast final.
+    
+    def _U(self) -> np.ndarray:
+        c = self._columnas
+        sin_perdidas = (c['k_acero'] >= 1e6) | (c['k_poliuretano'] >= 1e6)
+        with np.errstate(divide='ignore'):
+            U = 1 / (c['espesor_acero'] / c['k_acero'] + c['espesor_poliuretano'] / c['k_poliuretano'])
+        return np.where(sin_perdidas, 0.0, U).astype(self.dtype, copy=False)
+    
+    def _area_lateral(self) -> np.ndarray:
+        return 2 * np.pi * self._columnas['radio'] * self._columnas['altura']
+    
+    def _area_superior(self) -> np.ndarray:
+        return np.pi * self._columnas['radio']**2
+    
+    def _coef_perdidas(self) -> np.ndarray:
+        return self._U() * (self._area_lateral() + self._area_superior())
+    
+    def _filas(self, valor: np.ndarray) -> np.ndarray:
+        return np.broadcast_to(valor, (self.n,))
+    
+    @property
+    def U(self) -> np.ndarray:
+        return self._filas(self._U())
+    
+    @property
+    def area_lateral(self) -> np.ndarray:
+        return self._filas(self._area_lateral())
+    
+    @property
+    def area_superior(self) -> np.ndarray:
+        return self._filas(self._area_superior())
+    
+    @property
+    def area_total(self) -> np.ndarray:
+        return self._filas(self._area_lateral() + self._area_superior())
+    
+    @property
+    def coef_perdidas(self) -> np.ndarray:
+        """Coeficiente de pérdidas U·A (W/K)."""
+        return self._filas(self._coef_perdidas())
+    
+    @property
+    def potencia_desde_tension(self) -> np.ndarray:
+        """Potencia que corresponde a tension² / resistencia."""
+        return self._filas(self._columnas['tension'] ** 2 / self._columnas['resistencia'])
+    
+    @property
+    def temp_equilibrio(self) -> np.ndarray:
+        """Temperatura de equilibrio T_amb + P / (U·A) (100°C sin pérdidas)."""
+        coef_perdidas = self._coef_perdidas()
+        with np.errstate(divide='ignore'):
+            equilibrio = self._columnas['T_amb'] + self._columnas['potencia'] / coef_perdidas
+        return self._filas(np.where(coef_perdidas == 0, 100.0, equilibrio))
+    
+    def __repr__(self):
+        variables = [campo for campo in self.CAMPOS if not self.es_constante(campo)]
+        return f"ParameterTable(n={self.n}, variables={variables})"
+
+
+def pasos_de_simulacion(tiempo_total, dt: float):
+    """Cantidad de pasos de tamaño dt necesarios para cubrir tiempo_total segundos."""
+    return np.ceil(np.asarray(tiempo_total, dtype=np.float64) / dt - 1e-9).astype(np.int64)
+
+
+def obtener_generador(rng=None) -> np.random.Generator:
+    """
+    Normaliza la fuente de aleatoriedad de simuladores y distribuciones.
+    
+    Args:
+        rng: Un np.random.Generator, una semilla (int o SeedSequence) o None.
+            Con None se deriva un generador nuevo del estado global de np.random,
+            así que np.random.seed sigue haciendo reproducible la corrida.
+    
+    Returns:
+        Generador a usar
+    """
+    if isinstance(rng, np.random.Generator):
+        return rng
+    if rng is None:
+        rng = np.random.randint(2**31)
+    return np.random.default_rng(rng)
+
+
+def semillas_por_corrida(semilla, n: int) -> List[np.random.SeedSequence]:
+    """
+    Deriva n semillas hijas independientes de la semilla de una campaña.
+    
+    La corrida i siempre recibe la hija i, sin importar cuántos procesos se usen
+    ni en qué orden se ejecuten, así que los resultados son idénticos con 1 o con
+    64 workers.
+    
+    Args:
+        semilla: Semilla de la campaña (int, SeedSequence o None para entropía del sistema)
+        n: Cantidad de corridas
+    
+    Returns:
+        Lista de SeedSequence, una por corrida
+    """
+    if not isinstance(semilla, np.random.SeedSequence):
+        semilla = np.random.SeedSequence(semilla)
+    return semilla.spawn(n)
+
+
+def generadores_por_corrida(semilla, n: int) -> List[np.random.Generator]:
+    """Igual que semillas_por_corrida pero devuelve los generadores ya creados."""
+    return [np.random.default_rng(hija) for hija in semillas_por_corrida(semilla, n)]
+
+
+class PoliticaRegistro:
+    """
+    Política de registro decimado de la trayectoria para HeatSimulator.
+    
+    Siempre se conservan el punto inicial, el final y los bordes de los eventos
+    estocásticos. El resto de los pasos se registra si cumple algún criterio:
+        - cada: un punto cada k pasos
+        - max_puntos: a lo sumo ~N puntos (se traduce en un intervalo de pasos)
+        - epsilon: la temperatura cambió más de ε °C desde el último punto
+    """
+    
+    def __init__(self, cada: Optional[int] = None, max_puntos: Optional[int] = None,
+                 epsilon: Optional[float] = None):
+        if cada is None and max_puntos is None and epsilon is None:
+            raise ValueError("Se debe indicar cada, max_puntos o epsilon")
+        if cada is not None and cada < 1:
+            raise ValueError("cada debe ser un entero positivo")
+        if max_puntos is not None and max_puntos < 2:
+            raise ValueError("max_puntos debe ser al menos 2 (inicio y fin)")
+        if epsilon is not None and epsilon <= 0:
+            raise ValueError("epsilon debe ser positivo")
+        
+        self.cada = cada
+        self.max_puntos = max_puntos
+        self.epsilon = epsilon
+    
+    def intervalo(self, n_pasos: int) -> int:
+        """Intervalo de pasos entre registros periódicos (0 si no hay registro periódico)."""
+        intervalo = self.cada or 0
+        if self.max_puntos is not None:
+            intervalo = max(intervalo, -(-n_pasos // (self.max_puntos - 1)))
+        return intervalo
+    
+    def __repr__(self) -> str:
+        return f"PoliticaRegistro(cada={self.cada}, max_puntos={self.max_puntos}, epsilon={self.epsilon})"
+
+
 class HeatSimulator:
     """Simulador de calentamiento de agua con pérdidas térmicas."""
     
-    def __init__(self, params: HeatSimulationParameters):
+    def __init__(self, params: HeatSimulationParameters, dtype=np.float64, rng=None):
+        """
+        Args:
+            params: Parámetros de la simulación
+            dtype: Tipo de los arrays de trayectoria (np.float64 o np.float32).
+                La integración siempre se hace en doble precisión.
+            rng: Generador (o semilla) para los eventos estocásticos. Si es None
+                cada corrida deriva uno del estado global de np.random.
+        """
         self.params = params
+        self.dtype = np.dtype(dtype)
+        self.rng = rng
         self.reset()
     
-    def reset(self):
-        """Reinicia la simulación."""
-        self.tiempos = [0.0]
-        self.temperaturas = [self.params.T_inicial]
+    def reset(self, registrar='completo'):
+        """
+        Reinicia la simulación y preasigna los buffers de la trayectoria.
+        
+        Args:
+            registrar: 'completo' preasigna la trayectoria; 'resumen' no guarda
+                ninguna muestra (tiempos y temperaturas quedan en None); una
+                PoliticaRegistro preasigna solo los puntos que se esperan registrar
+        """
+        if not isinstance(registrar, PoliticaRegistro) and registrar not in ('completo', 'resumen'):
+            raise ValueError(f"Modo de registro desconocido: {registrar!r}")
+        
+        if registrar != 'resumen':
+            n_muestras = int(pasos_de_simulacion(self.params.tiempo_total, self.params.dt)) + 1
+            if isinstance(registrar, PoliticaRegistro):
+                intervalo = registrar.intervalo(n_muestras - 1)
+                n_muestras = n_muestras // intervalo + 2 if intervalo else 64
+            self.tiempos = np.empty(n_muestras, dtype=self.dtype)
+            self.temperaturas = np.empty(n_muestras, dtype=self.dtype)
+            self.tiempos[0] = 0.0
+            self.temperaturas[0] = self.params.T_inicial
+        else:
+            self.tiempos = None
+            self.temperaturas = None
+        self.n_muestras = 1
         self.T_actual = self.params.T_inicial
         self.tiempo_actual = 0
         self.eventos_estocasticos = []  # Para TP5
+        self.resumen = None
+    
+    def _agregar_muestra(self, t: float, T: float):
+        """Agrega una muestra al final de la trayectoria, duplicando el buffer si está lleno."""
+        if self.n_muestras == self.temperaturas.size:
+            self.tiempos = np.concatenate([self.tiempos, np.empty_like(self.tiempos)])
+            self.temperaturas = np.concatenate([self.temperaturas, np.empty_like(self.temperaturas)])
+        self.tiempos[self.n_muestras] = t
+        self.temperaturas[self.n_muestras] = T
+        self.n_muestras += 1
+    
+    def _recortar_trayectoria(self):
+        """Recorta los buffers a las muestras efectivamente registradas."""
+        if self.n_muestras < self.temperaturas.size:
+            self.tiempos = self.tiempos[:self.n_muestras].copy()
+            self.temperaturas = self.temperaturas[:self.n_muestras].copy()
     
-    def simular(self, evento_estocastico: Optional[Dict] = None, parar_en_100c: bool = True) -> Tuple[List[float], List[float]]:
+    def simular_listas(self, *args, **kwargs) -> Tuple[List[float], List[float]]:
+        """Compatibilidad: igual que simular pero devuelve listas de Python."""
+        tiempos, temperaturas = self.simular(*args, **kwargs)
+        return tiempos.tolist(), temperaturas.tolist()
+    
+    def simular(self, evento_estocastico: Optional[Dict] = None, parar_en_100c: bool = True,
+                registrar='completo'):
         """
-        Ejecuta la simulación completa.
+        Ejecuta la simulación completa con paso fijo params.dt.
+        
+        Además de la trayectoria, deja en self.resumen las métricas escalares de
+        la corrida (ver registrar='resumen').
         
         Args:
             evento_estocastico: Diccionario con parámetros para eventos estocásticos (TP5)
-                - probabilidad: float (ej: 1/300)
+                - probabilidad: float (ej: 1/300) - probabilidad por segundo
                 - descenso_max: float (ej: 5) - máximo descenso en grados
                 - duracion_min: int (segundos mínimos)
                 - duracion_max: int (segundos máximos)
             parar_en_100c: Si True, para la simulación al alcanzar 100°C
+            registrar: 'completo' (por defecto), 'resumen' o una PoliticaRegistro.
+                En modo resumen no se guarda la trayectoria: solo se mantienen
+                escalares, con memoria constante sin importar tiempo_total. Con una
+                PoliticaRegistro se guarda una trayectoria decimada (no uniforme)
         
         Returns:
-            Tupla (tiempos, temperaturas)
+            Tupla de arrays (tiempos, temperaturas), con tiempos en segundos
+            (múltiplos de dt); en modo 'resumen', un diccionario con:
+                - tiempo_100c: tiempo en alcanzar 100°C (None si no llegó)
+                - tiempo_final, T_final, T_max
+                - energia_entregada: energía del calefactor (J)
+                - energia_perdida: energía perdida al ambiente (J)
+                - n_eventos: cantidad de eventos estocásticos
+                - pasos: pasos integrados
         """
-        self.reset()
+        self.reset(registrar)
         
+        dt = self.params.dt
+        completo = registrar == 'completo'
+        decimado = isinstance(registrar, PoliticaRegistro)
+        solo_resumen = registrar == 'resumen'
+        temperaturas = self.temperaturas
+        paso = 0
+        T_max = self.T_actual
+        energia_perdida = 0.0
+        n_eventos = 0
+        tiempo_100c = None
         evento_activo = False
         evento_descenso_total = 0
         evento_tiempo_restante = 0
         
         # Tiempo de simulación hasta alcanzar 100°C o tiempo máximo
-        tiempo_limite = self.params.tiempo_total
+        n_pasos = int(pasos_de_simulacion(self.params.tiempo_total, dt))
         
-        for t in range(1, tiempo_limite + 1):
+        # TP5: los eventos se sortean de antemano; el bucle no llama al generador
+        proximo_evento = n_pasos + 1
+        if evento_estocastico:
+            inicios, descensos, duraciones = self._sortear_eventos(evento_estocastico, n_pasos, dt)
+            inicios, descensos, duraciones = inicios.tolist(), descensos.tolist(), duraciones.tolist()
+            i_evento = 0
+            if inicios:
+                proximo_evento = inicios[0]
+        
+        if decimado:
+            intervalo = registrar.intervalo(n_pasos)
+            epsilon = registrar.epsilon
+            T_registrada = self.T_actual
+            paso_registrado = 0
+        
+        for paso in range(1, n_pasos + 1):
+            borde_evento = False
+            t = paso * dt
             self.tiempo_actual = t
             
-            # TP5: Verificar eventos estocásticos
-            if evento_estocastico and not evento_activo:
-                if np.random.random() < evento_estocastico['probabilidad']:
-                    evento_activo = True
-                    # Descenso más realista (1-3 grados máximo para ser más suave)
-                    evento_descenso_total = np.random.uniform(1.0, 3.0)
-                    evento_tiempo_restante = np.random.randint(60, 180)  # 1-3 minutos de duración
+            # TP5: Iniciar el próximo evento estocástico sorteado
+            if paso == proximo_evento:
+                evento_activo = True
+                # Descenso más realista (1-3 grados máximo para ser más suave)
+                evento_descenso_total = descensos[i_evento]
+                evento_tiempo_restante = duraciones[i_evento]  # 1-3 minutos de duración
+                i_evento += 1
+                proximo_evento = inicios[i_evento] if i_evento < len(inicios) else n_pasos + 1
+                n_eventos += 1
+                borde_evento = True
+                if decimado and paso_registrado != paso - 1:
+                    # Conservar el punto previo al inicio del evento
+                    self._agregar_muestra((paso - 1) * dt, self.T_actual)
+                if not solo_resumen:
                     self.eventos_estocasticos.append({
                         'tiempo': t,
                         'descenso': evento_descenso_total,
@@ -136,19 +605,20 @@ class HeatSimulator:
             # Calcular pérdidas y energía neta
             perdida = self.params.U * self.params.area_total * (self.T_actual - self.params.T_amb)
             energia_neta = self.params.potencia - perdida
+            energia_perdida += perdida * dt
             
             # La energía neta siempre debe ser positiva para calentar
             if energia_neta < 0:
                 energia_neta = 0
             
             # Aplicar cambio de temperatura normal
-            dT = (energia_neta * self.params.dt) / (self.params.masa * self.params.calor_especifico)
+            dT = (energia_neta * dt) / (self.params.masa * self.params.calor_especifico)
             self.T_actual += dT
             
             # TP5: Aplicar evento estocástico si está activo
             if evento_activo and evento_tiempo_restante > 0:
                 # Aplicar descenso gradual durante la duración del evento
-                descenso_instantaneo = evento_descenso_total / evento_tiempo_restante
+                descenso_instantaneo = evento_descenso_total * dt / evento_tiempo_restante
                 
                 # Evitar que la temperatura baje de 10°C para ser realista
                 nueva_temperatura = self.T_actual - descenso_instantaneo
@@ -157,24 +627,866 @@ class HeatSimulator:
                 else:
                     self.T_actual = 10.0
                     
-                evento_tiempo_restante -= 1
+                evento_tiempo_restante -= dt
                 
                 if evento_tiempo_restante <= 0:
                     evento_activo = False
+                    borde_evento = True
             
-            self.tiempos.append(float(t))
-            self.temperaturas.append(self.T_actual)
+            if completo:
+                temperaturas[paso] = self.T_actual
+            elif decimado:
+                if (borde_evento or (intervalo and paso % intervalo == 0) or
+                        (epsilon is not None and abs(self.T_actual - T_registrada) > epsilon)):
+                    self._agregar_muestra(t, self.T_actual)
+                    T_registrada = self.T_actual
+                    paso_registrado = paso
+            if self.T_actual > T_max:
+                T_max = self.T_actual
             
             # Parar al alcanzar 100°C si está habilitado
-            if parar_en_100c and self.T_actual >= 100.0:
+            if self.T_actual >= 100.0 and tiempo_100c is None:
+                tiempo_100c = t
+                if parar_en_100c:
+                    break
+        
+        self.resumen = {
+            'tiempo_100c': tiempo_100c,
+            'tiempo_final': paso * dt,
+            'T_final': self.T_actual,
+            'T_max': T_max,
+            'energia_entregada': self.params.potencia * paso * dt,
+            'energia_perdida': energia_perdida,
+            'n_eventos': n_eventos,
+            'pasos': paso
+        }
+        
+        if solo_resumen:
+            return self.resumen
+        
+        if decimado:
+            if paso_registrado != paso:
+                self._agregar_muestra(paso * dt, self.T_actual)  # Siempre conservar el final
+            self._recortar_trayectoria()
+            return self.tiempos, self.temperaturas
+        
+        self.n_muestras = paso + 1
+        self._recortar_trayectoria()
+        self.tiempos = (np.arange(self.n_muestras) * dt).astype(self.dtype)
+        
+        return self.tiempos, self.temperaturas
+    
+    def _sortear_eventos(self, evento_estocastico: Dict, n_pasos: int,
+                         dt: float = 1.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Sortea de antemano, en bloque, los eventos estocásticos de una corrida.
+        
+        Mientras no hay un evento activo cada paso tiene probabilidad p de iniciar
+        uno (proceso de Bernoulli), así que la espera hasta el próximo es
+        geométrica: se sortean juntas todas las esperas, magnitudes y duraciones
+        con la misma distribución que el sorteo paso a paso.
+        
+        Returns:
+            Tupla (pasos de inicio, descensos en °C, duraciones en segundos)
+        """
+        rng = obtener_generador(self.rng)
+        probabilidad = evento_estocastico['probabilidad']
+        if dt != 1.0:
+            probabilidad = 1 - (1 - probabilidad) ** dt
+        if probabilidad <= 0:
+            vacio = np.empty(0, dtype=np.int64)
+            return vacio, np.empty(0), vacio
+        
+        inicios, descensos, duraciones = [], [], []
+        ultimo_paso_ocupado = 0
+        # Cota holgada de la cantidad de eventos; si no alcanza se sortea otro bloque
+        n_bloque = int(n_pasos * probabilidad * 1.5) + 8
+        
+        while True:
+            esperas = rng.geometric(probabilidad, n_bloque)
+            descenso = rng.uniform(1.0, 3.0, n_bloque)  # 1-3 grados
+            duracion = rng.integers(60, 180, n_bloque)  # 1-3 minutos
+            
+            # Cada evento ocupa ceil(duración / dt) pasos; la espera corre desde su último paso
+            ocupados = np.ceil(duracion / dt).astype(np.int64)
+            inicio = ultimo_paso_ocupado + np.cumsum(esperas) + np.concatenate(([0], np.cumsum(ocupados[:-1] - 1)))
+            
+            k = int(np.searchsorted(inicio, n_pasos, side='right'))
+            inicios.append(inicio[:k])
+            descensos.append(descenso[:k])
+            duraciones.append(duracion[:k])
+            
+            if k < n_bloque:
+                break
+            ultimo_paso_ocupado = inicio[-1] + ocupados[-1] - 1
+        
+        return np.concatenate(inicios), np.concatenate(descensos), np.concatenate(duraciones)
+    
+    def simular_adaptativo(self, evento_estocastico: Optional[Dict] = None,
+                           parar_en_100c: bool = True,
+                           tolerancia: float = 1e-3,
+                           dt_min: float = 1e-3,
+                           dt_max: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Integra con paso adaptativo (Runge-Kutta embebido de Bogacki-Shampine 3(2)).
+        
+        El paso crece durante la aproximación suave al equilibrio y se achica cerca
+        de los eventos estocásticos (cuyos bordes nunca se saltean) y del cruce de
+        100°C, que se alcanza con error menor a la tolerancia. Los eventos se
+        modelan como un descenso a tasa constante durante su duración.
+        
+        Args:
+            evento_estocastico: Parámetros de eventos (igual que en simular)
+            parar_en_100c: Si True, para la simulación al alcanzar 100°C
+            tolerancia: Error local máximo admitido por paso (°C)
+            dt_min: Paso mínimo (s)
+            dt_max: Paso máximo (s), por defecto todo el horizonte
+        
+        Returns:
+            Tupla de arrays (tiempos, temperaturas) con tiempos no uniformes
+        """
+        self.reset()
+        self.pasos_aceptados = 0
+        self.pasos_rechazados = 0
+        
+        p = self.params
+        tiempo_limite = float(p.tiempo_total)
+        dt_max = tiempo_limite if dt_max is None else dt_max
+        coef_perdidas = p.U * p.area_total
+        capacidad = p.masa * p.calor_especifico
+        
+        if evento_estocastico:
+            inicios, descensos, duraciones = self._sortear_eventos(evento_estocastico, int(tiempo_limite))
+            self.eventos_estocasticos = [
+                {'tiempo': float(inicio), 'descenso': descenso, 'duracion': duracion}
+                for inicio, descenso, duracion in zip(inicios.tolist(), descensos.tolist(), duraciones.tolist())
+            ]
+        
+        # Bordes de eventos: el integrador nunca da un paso que los atraviese
+        bordes = sorted({e['tiempo'] for e in self.eventos_estocasticos} |
+                        {e['tiempo'] + e['duracion'] for e in self.eventos_estocasticos})
+        bordes = [b for b in bordes if b < tiempo_limite] + [tiempo_limite]
+        
+        def tasa_evento(t: float) -> float:
+            for e in self.eventos_estocasticos:
+                if e['tiempo'] <= t < e['tiempo'] + e['duracion']:
+                    return e['descenso'] / e['duracion']
+            return 0.0
+        
+        def derivada(T: float, descenso: float) -> float:
+            energia_neta = p.potencia - coef_perdidas * (T - p.T_amb)
+            return max(energia_neta, 0.0) / capacidad - descenso
+        
+        t = 0.0
+        T = p.T_inicial
+        h = min(max(p.dt, dt_min), dt_max)
+        i_borde = 0
+        k1 = None
+        
+        while t < tiempo_limite:
+            while bordes[i_borde] <= t:
+                i_borde += 1
+                k1 = None  # La derivada cambia en el borde del evento
+            
+            descenso = tasa_evento(t)
+            if k1 is None:
+                k1 = derivada(T, descenso)
+            
+            hasta_borde = bordes[i_borde] - t
+            h = min(h, hasta_borde)
+            
+            # Paso de Bogacki-Shampine con estimación embebida de error
+            k2 = derivada(T + 0.5 * h * k1, descenso)
+            k3 = derivada(T + 0.75 * h * k2, descenso)
+            T_nueva = T + h * (2 * k1 + 3 * k2 + 4 * k3) / 9
+            k4 = derivada(T_nueva, descenso)
+            error = abs(h * (-5 * k1 / 72 + k2 / 12 + k3 / 9 - k4 / 8))
+            
+            if error > tolerancia and h > dt_min:
+                self.pasos_rechazados += 1
+                h = max(dt_min, h * max(0.2, 0.9 * (tolerancia / error) ** (1 / 3)))
+                continue
+            
+            # Cruce de 100°C: acortar el paso hasta caer dentro de la tolerancia
+            if parar_en_100c and T_nueva > 100.0 + tolerancia and h > dt_min:
+                self.pasos_rechazados += 1
+                h = max(dt_min, h * (100.0 + tolerancia / 2 - T) / (T_nueva - T))
+                continue
+            
+            t = bordes[i_borde] if h == hasta_borde else t + h
+            T = T_nueva
+            if descenso > 0 and T < 10.0:
+                T = 10.0  # Igual que en simular: el evento no enfría por debajo de 10°C
+            k1 = k4 if T == T_nueva else None
+            self.pasos_aceptados += 1
+            
+            self._agregar_muestra(t, T)
+            
+            if parar_en_100c and T >= 100.0:
                 break
+            
+            factor = 5.0 if error == 0 else min(5.0, max(0.2, 0.9 * (tolerancia / error) ** (1 / 3)))
+            h = min(dt_max, max(dt_min, h * factor))
         
+        # Descartar los eventos sorteados que quedaron después del final
+        self.eventos_estocasticos = [e for e in self.eventos_estocasticos if e['tiempo'] < t]
+        self.T_actual = T
+        self.tiempo_actual = t
+        self._recortar_trayectoria()
+        return self.tiempos, self.temperaturas
+
+
+class BatchHeatSimulator:
+    """
+    Simulador vectorizado: integra muchos calentadores a la vez en una sola
+    pasada de NumPy. Cada fila reproduce exactamente el resultado de
+    HeatSimulator.simular (sin eventos estocásticos).
+    """
+
+    def __init__(self,
+                 masa,
+                 potencia,
+                 coef_perdidas,
+                 T_amb,
+                 T_inicial,
+                 calor_especifico=4186,
+                 tiempo_total=2500,
+                 dt: float = 1.0):
+        """
+        Args:
+            masa, potencia, coef_perdidas (U·A), T_amb, T_inicial, calor_especifico, tiempo_total:
+                escalares o arrays de igual longitud (se aplica broadcasting)
+            dt: paso de tiempo en segundos (común a todo el lote)
+        """
+        columnas = np.broadcast_arrays(*[np.atleast_1d(np.asarray(v, dtype=np.float64))
+                                         for v in (masa, potencia, coef_perdidas, T_amb, T_inicial, calor_especifico)])
+        self.masa, self.potencia, self.coef_perdidas, self.T_amb, self.T_inicial, self.calor_especifico = \
+            [c.copy() for c in columnas]
+        self.n = self.masa.size
+        self.tiempo_total = np.broadcast_to(np.asarray(tiempo_total, dtype=np.float64), (self.n,)).copy()
+        self.dt = dt
+        self.reset()
+
+    @classmethod
+    def desde_parametros(cls, lista_params: List[HeatSimulationParameters], **opciones) -> 'BatchHeatSimulator':
+        """Construye el lote a partir de una lista de HeatSimulationParameters."""
+        return cls.desde_tabla(ParameterTable.desde_parametros(lista_params), **opciones)
+
+    @classmethod
+    def desde_tabla(cls, tabla: ParameterTable, **opciones) -> 'BatchHeatSimulator':
+        """
+        Construye el lote a partir de una ParameterTable (dt debe ser común).
+        Las opciones extra se pasan al constructor (por ejemplo, los parámetros
+        del hielo en BatchIceHeatSimulator).
+        """
+        if not tabla.es_constante('dt'):
+            raise ValueError("Todas las filas del lote deben usar el mismo dt")
+
+        return cls(
+            masa=tabla.masa,
+            potencia=tabla.potencia,
+            coef_perdidas=tabla.coef_perdidas,
+            T_amb=tabla.T_amb,
+            T_inicial=tabla.T_inicial,
+            calor_especifico=tabla.calor_especifico,
+            tiempo_total=tabla.tiempo_total,
+            dt=float(tabla.dt[0]),
+            **opciones
+        )
+
+    def reset(self):
+        """Reinicia los resultados del lote."""
+        self.tiempos = None
+        self.temperaturas = None
+        self.pasos = np.zeros(self.n, dtype=np.int64)
+        self.paso_100c = np.full(self.n, -1, dtype=np.int64)
+        self.T_final = self.T_inicial.copy()
+
+    def simular(self, parar_en_100c: bool = True,
+                registrar_trayectorias: bool = True) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """
+        Ejecuta la simulación de todas las filas a la vez.
+
+        Args:
+            parar_en_100c: Si True, cada fila deja de integrarse al alcanzar 100°C
+            registrar_trayectorias: Si False no se guarda la matriz de temperaturas
+                (útil para ensambles muy grandes, solo quedan T_final y pasos)
+
+        Returns:
+            Tupla (tiempos, temperaturas) con tiempos de forma (pasos+1,) y
+            temperaturas de forma (n, pasos+1), rellenas con NaN tras detenerse
+        """
+        self.reset()
+        pasos_por_fila = pasos_de_simulacion(self.tiempo_total, self.dt)
+        n_pasos = int(pasos_por_fila.max()) if self.n > 0 else 0
+
+        self.tiempos = np.arange(n_pasos + 1, dtype=np.float64) * self.dt
+        if registrar_trayectorias:
+            self.temperaturas = np.full((self.n, n_pasos + 1), np.nan)
+            self.temperaturas[:, 0] = self.T_inicial
+
+        # Columnas compactadas de las filas que siguen activas
+        indices = np.arange(self.n)
+        T = self.T_inicial.copy()
+        potencia = self.potencia
+        coef_perdidas = self.coef_perdidas
+        T_amb = self.T_amb
+        capacidad = self.masa * self.calor_especifico
+        limite = pasos_por_fila
+        paso_100c = self.paso_100c.copy()
+        proximo_limite = limite.min() if self.n > 0 else 0
+
+        for t in range(1, n_pasos + 1):
+            # Mismas operaciones (y en el mismo orden) que HeatSimulator.simular
+            perdida = coef_perdidas * (T - T_amb)
+            energia_neta = potencia - perdida
+            np.maximum(energia_neta, 0, out=energia_neta)
+            T += (energia_neta * self.dt) / capacidad
+
+            if registrar_trayectorias:
+                self.temperaturas[indices, t] = T
+
+            llegaron = T >= 100.0
+            if parar_en_100c:
+                terminaron = llegaron
+            else:
+                # Sin parar, cada fila recuerda el primer paso en que llegó a 100°C
+                np.copyto(paso_100c, t, where=llegaron & (paso_100c < 0))
+                terminaron = np.zeros(T.shape, dtype=bool)
+            if t >= proximo_limite:
+                terminaron |= limite <= t
+
+            if terminaron.any():
+                self.T_final[indices[terminaron]] = T[terminaron]
+                self.pasos[indices[terminaron]] = t
+                self.paso_100c[indices[terminaron]] = (np.where(T[terminaron] >= 100.0, t, -1) if parar_en_100c
+                                                       else paso_100c[terminaron])
+
+                # Quitar del lote las filas que ya terminaron
+                siguen = ~terminaron
+                indices = indices[siguen]
+                T = T[siguen]
+                potencia = potencia[siguen]
+                coef_perdidas = coef_perdidas[siguen]
+                T_amb = T_amb[siguen]
+                capacidad = capacidad[siguen]
+                limite = limite[siguen]
+                paso_100c = paso_100c[siguen]
+
+                if indices.size == 0:
+                    break
+                proximo_limite = limite.min()
+
+        return self.tiempos, self.temperaturas
+
+    @property
+    def tiempo_100c(self) -> np.ndarray:
+        """
+        Tiempo en que cada fila alcanzó 100°C por primera vez (NaN si no llegó),
+        también si se simuló con parar_en_100c=False.
+        """
+        llegaron = self.paso_100c >= 0
+        tiempos = np.full(self.n, np.nan)
+        tiempos[llegaron] = self.tiempos[self.paso_100c[llegaron]]
+        return tiempos
+
+    def trayectoria(self, i: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Devuelve (tiempos, temperaturas) de la fila i, igual que HeatSimulator.simular."""
+        if self.temperaturas is None:
+            raise ValueError("La simulación se ejecutó sin registrar trayectorias")
+
+        n = self.pasos[i] + 1
+        return self.tiempos[:n], self.temperaturas[i, :n]
+
+
+# Escenario de hielo del TP2: dos cubitos de 50 g a -5°C agregados a los 2 minutos
+PARAMETROS_HIELO = {
+    'n_cubos': 2,
+    'masa_cubo': 0.05,                 # kg por cubito
+    'lado_cubo': 0.03,                 # m
+    'T_hielo': -5,                     # °C, temperatura inicial del hielo
+    'tiempo_adicion': 120,             # s, momento en que se agrega el hielo
+    'calor_fusion': 334000,            # J/kg
+    'calor_especifico_hielo': 2100,    # J/(kg·°C)
+    'h_agua_hielo': 500,               # W/(m²·K), coeficiente de película agua-hielo
+}
+
+
+def _calentar_hielo(energia: np.ndarray, T_hielo: np.ndarray, masa_hielo: np.ndarray,
+                    calor_especifico_hielo: np.ndarray, mascara: np.ndarray) -> np.ndarray:
+    """
+    Usa energía para llevar el hielo hacia 0°C (actualiza T_hielo en el lugar).
+
+    Returns:
+        Energía usada por fila
+    """
+    necesario = masa_hielo * calor_especifico_hielo * np.maximum(-T_hielo, 0.0)
+    usada = np.where(mascara & (T_hielo < 0), np.minimum(energia, necesario), 0.0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Si alcanza, el hielo queda exactamente a 0°C (sin residuos de redondeo)
+        nueva = np.where(usada >= necesario, 0.0, T_hielo + usada / (masa_hielo * calor_especifico_hielo))
+    T_hielo[:] = np.where(usada > 0, nueva, T_hielo)
+    return usada
+
+
+def _fundir_hielo(energia: np.ndarray, T_hielo: np.ndarray, masa_hielo: np.ndarray,
+                  calor_fusion: np.ndarray, mascara: np.ndarray) -> np.ndarray:
+    """Masa de hielo a 0°C que funde la energía disponible en cada fila."""
+    puede = mascara & (T_hielo >= 0) & (masa_hielo > 0) & (energia > 0)
+    return np.where(puede, np.minimum(energia / calor_fusion, masa_hielo), 0.0)
+
+
+class BatchIceHeatSimulator(BatchHeatSimulator):
+    """
+    Simulador vectorizado del calentador con cubitos de hielo (TP2 extra).
+
+    A partir de tiempo_adicion el agua cede calor al hielo por convección
+    (h·S·ΔT, sin bajar de la temperatura del hielo) y la energía neta del
+    calefactor se usa primero para llevar el hielo a 0°C y fundirlo; lo que
+    sobra calienta el agua. La superficie de intercambio es proporcional a la
+    masa de hielo que queda. Los parámetros del hielo (ver PARAMETROS_HIELO)
+    pueden ser escalares o arrays por fila, así que muchos escenarios se
+    simulan en una sola pasada.
+    """
+
+    def __init__(self,
+                 masa,
+                 potencia,
+                 coef_perdidas,
+                 T_amb,
+                 T_inicial,
+                 calor_especifico=4186,
+                 tiempo_total=2500,
+                 dt: float = 1.0,
+                 **hielo):
+        """
+        Args:
+            masa, potencia, coef_perdidas, T_amb, T_inicial, calor_especifico, tiempo_total, dt:
+                igual que en BatchHeatSimulator
+            **hielo: Parámetros del hielo (claves de PARAMETROS_HIELO); los que
+                faltan toman el valor por defecto
+        """
+        desconocidos = set(hielo) - set(PARAMETROS_HIELO)
+        if desconocidos:
+            raise TypeError(f"Parámetros de hielo desconocidos: {', '.join(sorted(desconocidos))}")
+
+        valores_hielo = dict(PARAMETROS_HIELO)
+        valores_hielo.update(hielo)
+        calentador = (masa, potencia, coef_perdidas, T_amb, T_inicial, calor_especifico, tiempo_total)
+        forma = np.broadcast_shapes(*(np.shape(np.atleast_1d(v)) for v in
+                                      calentador + tuple(valores_hielo.values())))
+
+        super().__init__(*(np.broadcast_to(v, forma) for v in calentador), dt=dt)
+        self.hielo = {nombre: np.broadcast_to(np.asarray(v, dtype=np.float64), forma).copy()
+                      for nombre, v in valores_hielo.items()}
+
+    def reset(self):
+        """Reinicia los resultados del lote."""
+        super().reset()
+        self.masa_hielo_final = None
+        self.masa_agua_final = None
+
+    def _filas_iniciales(self, pasos_por_fila: np.ndarray) -> Dict[str, np.ndarray]:
+        """Columnas de estado y de parámetros de todas las filas, al inicio."""
+        h = self.hielo
+        masa_hielo = h['n_cubos'] * h['masa_cubo']
+        superficie = 6 * h['lado_cubo']**2 * h['n_cubos']
+        return {
+            'indice': np.arange(self.n),
+            'k': np.zeros(self.n, dtype=np.int64),
+            'limite': pasos_por_fila,
+            'paso_100c': np.full(self.n, -1, dtype=np.int64),
+            'T': self.T_inicial.copy(),
+            'T_hielo': h['T_hielo'].copy(),
+            'masa_agua': self.masa.copy(),
+            'masa_hielo': masa_hielo.copy(),
+            'masa_hielo_inicial': masa_hielo,
+            'superficie': superficie.copy(),
+            'superficie_inicial': superficie,
+            'potencia': self.potencia,
+            'coef_perdidas': self.coef_perdidas,
+            'T_amb': self.T_amb,
+            'calor_especifico': self.calor_especifico,
+            'tiempo_adicion': h['tiempo_adicion'],
+            'calor_fusion': h['calor_fusion'],
+            'calor_especifico_hielo': h['calor_especifico_hielo'],
+            'h_agua_hielo': h['h_agua_hielo'],
+        }
+
+    @staticmethod
+    def _paso(f: Dict[str, np.ndarray], con_hielo: np.ndarray, dt: float):
+        """Avanza un paso todas las filas de f (en el lugar)."""
+        T, T_hielo, masa_agua, masa_hielo = f['T'], f['T_hielo'], f['masa_agua'], f['masa_hielo']
+        c_agua = f['calor_especifico']
+
+        # Energía neta del calefactor en este paso (nunca negativa)
+        energia = (f['potencia'] - f['coef_perdidas'] * (T - f['T_amb'])) * dt
+        np.maximum(energia, 0, out=energia)
+
+        if con_hielo.any():
+            c_hielo, L = f['calor_especifico_hielo'], f['calor_fusion']
+
+            # 1. Convección agua → hielo, sin enfriar el agua por debajo del hielo
+            conv = con_hielo & (T > T_hielo)
+            energia_conv = np.where(conv, np.minimum(f['h_agua_hielo'] * f['superficie'] * (T - T_hielo) * dt,
+                                                     masa_agua * c_agua * (T - T_hielo)), 0.0)
+            cedida = _calentar_hielo(energia_conv, T_hielo, masa_hielo, c_hielo, conv)
+            derretida = _fundir_hielo(energia_conv - cedida, T_hielo, masa_hielo, L, conv)
+            masa_agua += derretida
+            masa_hielo -= derretida
+            cedida += derretida * L
+            T -= np.where(cedida > 0, cedida / (masa_agua * c_agua), 0.0)
+
+            # 2. El calefactor calienta y funde el hielo que queda
+            energia -= _calentar_hielo(energia, T_hielo, masa_hielo, c_hielo, con_hielo & (masa_hielo > 0))
+            derretida = _fundir_hielo(energia, T_hielo, masa_hielo, L, con_hielo)
+            masa_agua += derretida
+            masa_hielo -= derretida
+            energia -= derretida * L
+
+            np.maximum(masa_hielo, 0, out=masa_hielo)
+            f['superficie'] = np.divide(f['superficie_inicial'] * masa_hielo, f['masa_hielo_inicial'],
+                                        out=np.zeros_like(masa_hielo), where=masa_hielo > 0)
+
+        # 3. La energía restante calienta el agua
+        T += np.where(energia > 0, energia / (masa_agua * c_agua), 0.0)
+
+        # El agua no baja de la temperatura del hielo que queda (ni de 0°C)
+        np.maximum(T, np.where((masa_hielo > 0) & (T_hielo < 0), T_hielo, 0.0), out=T)
+        f['k'] += 1
+
+    def _terminar(self, f: Dict[str, np.ndarray], terminaron: np.ndarray):
+        """Guarda los resultados finales de las filas de f indicadas por la máscara."""
+        indices = f['indice'][terminaron]
+        self.T_final[indices] = f['T'][terminaron]
+        self.pasos[indices] = f['k'][terminaron]
+        paso_100c = f['paso_100c'][terminaron]
+        self.paso_100c[indices] = np.where((paso_100c < 0) & (f['T'][terminaron] >= 100.0),
+                                           f['k'][terminaron], paso_100c)
+        self.masa_hielo_final[indices] = f['masa_hielo'][terminaron]
+        self.masa_agua_final[indices] = f['masa_agua'][terminaron]
+
+    def _terminaron(self, f: Dict[str, np.ndarray], parar_en_100c: bool) -> np.ndarray:
+        terminaron = f['k'] >= f['limite']
+        if parar_en_100c:
+            terminaron |= f['T'] >= 100.0
+        return terminaron
+
+    def simular(self, parar_en_100c: bool = True,
+                registrar_trayectorias: bool = True,
+                modo: str = 'numerico') -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """
+        Ejecuta la simulación con hielo de todas las filas a la vez.
+
+        Args:
+            parar_en_100c: Si True, cada fila deja de integrarse al alcanzar 100°C
+            registrar_trayectorias: Si False no se guarda la matriz de temperaturas
+            modo: 'numerico' integra todos los pasos; 'por_tramos' salta con la
+                solución cerrada los tramos sin hielo (antes de agregarlo y
+                después de derretirse) e integra paso a paso solo mientras hay
+                hielo en el agua. Ambos dan la misma trayectoria salvo redondeo.
+
+        Returns:
+            Tupla (tiempos, temperaturas) como en BatchHeatSimulator.simular.
+            Además quedan masa_hielo_final y masa_agua_final por fila.
+        """
+        if modo not in ('numerico', 'por_tramos'):
+            raise ValueError(f"Modo desconocido: {modo!r}")
+
+        self.reset()
+        pasos_por_fila = pasos_de_simulacion(self.tiempo_total, self.dt)
+        n_pasos = int(pasos_por_fila.max()) if self.n > 0 else 0
+
+        self.tiempos = np.arange(n_pasos + 1, dtype=np.float64) * self.dt
+        if registrar_trayectorias:
+            self.temperaturas = np.full((self.n, n_pasos + 1), np.nan)
+            self.temperaturas[:, 0] = self.T_inicial
+        self.masa_hielo_final = np.zeros(self.n)
+        self.masa_agua_final = self.masa.copy()
+
+        filas = self._filas_iniciales(pasos_por_fila)
+        if self.n > 0:
+            terminaron = self._terminaron(filas, parar_en_100c)
+            self._terminar(filas, terminaron)
+            filas = {nombre: columna[~terminaron] for nombre, columna in filas.items()}
+
+        if modo == 'numerico':
+            self._integrar(filas, parar_en_100c, registrar_trayectorias, solo_con_hielo=False)
+        else:
+            self._simular_por_tramos(filas, parar_en_100c, registrar_trayectorias)
         return self.tiempos, self.temperaturas
 
+    def _integrar(self, filas: Dict[str, np.ndarray], parar_en_100c: bool, registrar_trayectorias: bool,
+                  solo_con_hielo: bool) -> Dict[str, np.ndarray]:
+        """
+        Integra paso a paso hasta que terminan todas las filas. Con
+        solo_con_hielo=True (filas con el hielo ya agregado) también salen las
+        filas que se quedan sin hielo, y se devuelven para seguir por otro camino.
+        """
+        salieron = []
+        while filas['indice'].size > 0:
+            f = filas
+            if solo_con_hielo:
+                con_hielo = f['masa_hielo'] > 0
+            else:
+                con_hielo = (f['masa_hielo'] > 0) & (f['k'] * self.dt >= f['tiempo_adicion'] - 1e-9 - self.dt)
+            self._paso(f, con_hielo, self.dt)
+
+            if registrar_trayectorias:
+                self.temperaturas[f['indice'], f['k']] = f['T']
+            if not parar_en_100c:
+                # Sin parar, cada fila recuerda el primer paso en que llegó a 100°C
+                np.copyto(f['paso_100c'], f['k'], where=(f['T'] >= 100.0) & (f['paso_100c'] < 0))
+
+            terminaron = self._terminaron(f, parar_en_100c)
+            salen = terminaron | (f['masa_hielo'] <= 0) if solo_con_hielo else terminaron
+            if salen.any():
+                self._terminar(f, terminaron)
+                if solo_con_hielo and (salen & ~terminaron).any():
+                    sin_hielo = salen & ~terminaron
+                    salieron.append({nombre: columna[sin_hielo] for nombre, columna in f.items()})
+                # Quitar del lote las filas que ya terminaron
+                siguen = ~salen
+                filas = {nombre: columna[siguen] for nombre, columna in f.items()}
+
+        if not salieron:
+            return filas
+        return {nombre: np.concatenate([s[nombre] for s in salieron]) for nombre in filas}
+
+    def _simular_por_tramos(self, filas: Dict[str, np.ndarray], parar_en_100c: bool, registrar_trayectorias: bool):
+        """Salta analíticamente los tramos sin hielo e integra solo la fase con hielo."""
+        dt = self.dt
+        # Primer paso en que el hielo interactúa con el agua
+        paso_adicion = np.maximum(np.ceil((filas['tiempo_adicion'] - 1e-9) / dt), 1).astype(np.int64)
+
+        # Tramo 1: calentamiento antes de agregar el hielo (el piso es la temperatura del hielo)
+        con_hielo = filas['masa_hielo'] > 0
+        piso = np.where(con_hielo & (filas['T_hielo'] < 0), filas['T_hielo'], 0.0)
+        hasta = np.where(con_hielo, np.minimum(paso_adicion - 1, filas['limite']), filas['limite'])
+        filas = self._saltar(filas, hasta, piso, parar_en_100c, registrar_trayectorias)
+
+        # Tramo 2: con hielo en el agua, paso a paso
+        en_hielo = filas['masa_hielo'] > 0
+        derretidas = self._integrar({nombre: columna[en_hielo] for nombre, columna in filas.items()},
+                                    parar_en_100c, registrar_trayectorias, solo_con_hielo=True)
+
+        # Tramo 3: calentamiento después de derretirse el hielo (y filas sin hielo)
+        filas = {nombre: np.concatenate([columna[~en_hielo], derretidas[nombre]]) for nombre, columna in filas.items()}
+        self._saltar(filas, filas['limite'], np.zeros(filas['indice'].size), parar_en_100c, registrar_trayectorias)
+
+    def _saltar(self, f: Dict[str, np.ndarray], hasta: np.ndarray, piso: np.ndarray,
+                parar_en_100c: bool, registrar_trayectorias: bool) -> Dict[str, np.ndarray]:
+        """
+        Avanza sin hielo en el agua hasta el paso `hasta` de cada fila (o hasta
+        los 100°C) con la solución cerrada de la recurrencia de Euler:
+        T_{k+1} = T_eq + (T_k - T_eq)·r con r = 1 - U·A·dt/(m·c), es decir
+        T_k = T_eq + (T_1 - T_eq)·r^(k-1). El primer paso se da explícito para
+        aplicar el piso de temperatura; desde ahí T no decrece y el piso ya no
+        actúa. Devuelve las filas que no terminaron.
+        """
+        dt = self.dt
+        n_saltos = np.maximum(hasta - f['k'], 0)
+        if f['indice'].size == 0 or not n_saltos.any():
+            return f
+
+        P, UA, T_amb = f['potencia'], f['coef_perdidas'], f['T_amb']
+        capacidad = f['masa_agua'] * f['calor_especifico']
+
+        # Primer paso explícito (mismas operaciones que _paso)
+        energia = np.maximum((P - UA * (f['T'] - T_amb)) * dt, 0)
+        T_1 = np.maximum(f['T'] + np.where(energia > 0, energia / capacidad, 0.0), piso)
+
+        sube = (P - UA * (T_1 - T_amb)) > 0
+        r = np.maximum(1 - UA * dt / capacidad, 0.0)
+        con_perdidas = (UA > 0) & (r < 1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            T_eq = np.where(con_perdidas, T_amb + P / UA, np.inf)
+            pendiente = P * dt / capacidad
+
+            def temperatura(j, filas=slice(None)):
+                """
+                Temperatura j pasos después del primero. j es un array por fila
+                o una matriz (filas, pasos) y filas selecciona las filas.
+                """
+                columna = (lambda a: a[filas, None]) if np.ndim(j) == 2 else (lambda a: a[filas])
+                exponencial = columna(T_eq) + columna(T_1 - T_eq) * columna(r) ** j
+                lineal = columna(T_1) + j * columna(pendiente)
+                return np.where(columna(sube), np.where(columna(con_perdidas), exponencial, lineal), columna(T_1))
+
+            # Pasos hasta 100°C: raíz de la solución cerrada, corregida ±1 paso por redondeo
+            j = np.where(con_perdidas,
+                         np.log((T_eq - 100.0) / (T_eq - T_1)) / np.log(r),
+                         (100.0 - T_1) / pendiente)
+            alcanza = sube & (T_eq > 100.0)
+            j = np.where(T_1 >= 100.0, 0, np.where(alcanza, np.ceil(np.nan_to_num(j, posinf=0.0)), np.inf))
+            j = np.minimum(j, n_saltos)
+            finito = np.isfinite(j) & (j > 0)
+            j = np.where(finito & (temperatura(np.where(finito, j - 1, 0)) >= 100.0), j - 1, j)
+            j = np.where(np.isfinite(j) & (temperatura(np.where(np.isfinite(j), j, 0)) < 100.0), j + 1, j)
+            if parar_en_100c:
+                n_saltos = np.minimum(n_saltos, j + 1).astype(np.int64)
+            else:
+                # Sin parar, se anota el primer paso del salto que llega a 100°C
+                cruza = (j < n_saltos) & (f['paso_100c'] < 0)
+                f['paso_100c'] = np.where(cruza, f['k'] + 1 + np.where(cruza, j, 0).astype(np.int64),
+                                          f['paso_100c'])
+
+        if registrar_trayectorias:
+            maximo = int(n_saltos.max())
+            columnas = np.arange(maximo)
+            # Por bloques de filas, para no duplicar la matriz de trayectorias en memoria
+            tam_bloque = max(1, 2**22 // max(maximo, 1))
+            for inicio in range(0, n_saltos.size, tam_bloque):
+                bloque = slice(inicio, inicio + tam_bloque)
+                filas_validas, columnas_validas = np.nonzero(columnas[None, :] < n_saltos[bloque, None])
+                valores = temperatura(columnas[None, :].astype(np.float64), bloque)
+                valores[:, 0] = T_1[bloque]
+                filas_validas_lote = filas_validas + inicio
+                self.temperaturas[f['indice'][filas_validas_lote], f['k'][filas_validas_lote] + 1 + columnas_validas] = \
+                    valores[filas_validas, columnas_validas]
+
+        avanzan = n_saltos > 0
+        f['T'] = np.where(avanzan, temperatura(np.maximum(n_saltos - 1, 0).astype(np.float64)), f['T'])
+        f['k'] = f['k'] + n_saltos
+
+        terminaron = self._terminaron(f, parar_en_100c)
+        self._terminar(f, terminaron)
+        return {nombre: columna[~terminaron] for nombre, columna in f.items()}
+
+
+class IceHeatSimulator:
+    """Simulador del calentador con cubitos de hielo para un único escenario."""
+
+    def __init__(self, params: HeatSimulationParameters, **hielo):
+        """
+        Args:
+            params: Parámetros del calentador
+            **hielo: Parámetros del hielo (claves de PARAMETROS_HIELO)
+        """
+        self.params = params
+        self.hielo = hielo
+        self.masa_hielo_final = None
+        self.masa_agua_final = None
+
+    def simular(self, parar_en_100c: bool = True, modo: str = 'numerico') -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Ejecuta la simulación con hielo.
+
+        Args:
+            parar_en_100c: Si True, para al alcanzar 100°C
+            modo: 'numerico' o 'por_tramos' (ver BatchIceHeatSimulator.simular)
+
+        Returns:
+            Tupla (tiempos, temperaturas); además quedan masa_hielo_final y
+            masa_agua_final en kg
+        """
+        lote = BatchIceHeatSimulator.desde_parametros([self.params], **self.hielo)
+        lote.simular(parar_en_100c=parar_en_100c, modo=modo)
+        self.masa_hielo_final = float(lote.masa_hielo_final[0])
+        self.masa_agua_final = float(lote.masa_agua_final[0])
+        return lote.trayectoria(0)
+
+
+def temperatura_analitica(t, masa, calor_especifico, potencia, coef_perdidas, T_amb, T_inicial):
+    """
+    Temperatura exacta del modelo sin eventos: m·c·dT/dt = P − U·A·(T − T_amb).
+
+    Con pérdidas: T(t) = T_eq + (T_inicial − T_eq)·exp(−U·A·t / (m·c)).
+    Sin pérdidas (U·A = 0): T(t) = T_inicial + P·t / (m·c).
+    Igual que en HeatSimulator, la energía neta nunca es negativa: si el agua
+    arranca por encima del equilibrio la temperatura se mantiene constante.
+    Todos los argumentos aceptan escalares o arrays (broadcasting de NumPy).
+    """
+    t = np.asarray(t, dtype=np.float64)
+    capacidad = np.asarray(masa, dtype=np.float64) * calor_especifico
+    potencia = np.asarray(potencia, dtype=np.float64)
+    coef_perdidas = np.asarray(coef_perdidas, dtype=np.float64)
+    T_inicial = np.asarray(T_inicial, dtype=np.float64)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        T_eq = T_amb + potencia / coef_perdidas
+        con_perdidas = T_eq + (T_inicial - T_eq) * np.exp(-coef_perdidas * t / capacidad)
+        con_perdidas = np.where(T_inicial < T_eq, con_perdidas, T_inicial)
+
+    sin_perdidas = T_inicial + np.maximum(potencia, 0) * t / capacidad
+    return np.where(coef_perdidas > 0, con_perdidas, sin_perdidas)
+
+
+def tiempo_analitico_hasta(T_objetivo, masa, calor_especifico, potencia, coef_perdidas, T_amb, T_inicial):
+    """
+    Tiempo exacto (en segundos) para alcanzar T_objetivo con el modelo sin eventos.
+
+    Devuelve 0 si ya se parte de T_objetivo o más, e inf si la temperatura de
+    equilibrio no supera el objetivo. Acepta escalares o arrays.
+    """
+    capacidad = np.asarray(masa, dtype=np.float64) * calor_especifico
+    potencia = np.asarray(potencia, dtype=np.float64)
+    coef_perdidas = np.asarray(coef_perdidas, dtype=np.float64)
+    T_inicial = np.asarray(T_inicial, dtype=np.float64)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        T_eq = T_amb + potencia / coef_perdidas
+        con_perdidas = np.where(
+            T_eq > T_objetivo,
+            np.log((T_eq - T_inicial) / (T_eq - T_objetivo)) * capacidad / coef_perdidas,
+            np.inf
+        )
+        sin_perdidas = np.where(potencia > 0, (T_objetivo - T_inicial) * capacidad / potencia, np.inf)
+
+    tiempo = np.where(coef_perdidas > 0, con_perdidas, sin_perdidas)
+    return np.where(T_inicial >= T_objetivo, 0.0, tiempo)
+
+
+class AnalyticHeatSolver:
+    """
+    Motor analítico: resuelve en O(1) el modelo sin eventos estocásticos
+    (con o sin pérdidas) usando la solución exacta de la EDO lineal.
+    """
+
+    def __init__(self, params: HeatSimulationParameters):
+        self.params = params
+        self.coef_perdidas = params.U * params.area_total
+
+    def _argumentos(self) -> Tuple[float, ...]:
+        p = self.params
+        return (p.masa, p.calor_especifico, p.potencia, self.coef_perdidas, p.T_amb, p.T_inicial)
+
+    def temperatura(self, t):
+        """Temperatura en el/los instante(s) t (segundos)."""
+        T = temperatura_analitica(t, *self._argumentos())
+        return float(T) if T.ndim == 0 else T
+
+    def tiempo_hasta(self, T_objetivo: float = 100.0) -> float:
+        """Tiempo exacto para alcanzar T_objetivo (inf si nunca se alcanza)."""
+        return float(tiempo_analitico_hasta(T_objetivo, *self._argumentos()))
+
+    def simular(self, parar_en_100c: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Evalúa la solución exacta en la misma grilla que HeatSimulator.simular,
+        sin iterar paso a paso.
+
+        Returns:
+            Tupla de arrays (tiempos, temperaturas)
+        """
+        dt = self.params.dt
+        n_pasos = int(pasos_de_simulacion(self.params.tiempo_total, dt))
+
+        if parar_en_100c:
+            tiempo_100c = self.tiempo_hasta(100.0)
+            if np.isfinite(tiempo_100c):
+                n_pasos = min(n_pasos, int(np.ceil(tiempo_100c / dt)))
+
+        tiempos = np.arange(n_pasos + 1, dtype=np.float64) * dt
+        temperaturas = temperatura_analitica(tiempos, *self._argumentos())
+        return tiempos, temperaturas
+
 
 class HeatPlotter:
     """Clase para generar gráficos de las simulaciones térmicas."""
     
+    # Por encima de esta cantidad, las familias se dibujan como una sola LineCollection
+    MAX_CURVAS_INDIVIDUALES = 50
+    
     @staticmethod
     def plot_single_simulation(tiempos: List[float], temperaturas: List[float], 
                              titulo: str = "Curva de Temperatura", 
@@ -184,7 +1496,7 @@ class HeatPlotter:
         """Grafica una única simulación."""
         fig = plt.figure(figsize=(10, 6))
         
-        tiempos_min = np.array(tiempos) / 60.0
+        tiempos_min = np.asarray(tiempos) / 60.0
         
         plt.plot(tiempos_min, temperaturas, label=etiqueta, color=color, linestyle=linestyle)
         plt.axhline(100, color='r', linestyle='--', label="100 °C")
@@ -201,8 +1513,23 @@ class HeatPlotter:
     @staticmethod
     def plot_family_curves(simulaciones: List[Tuple[List[float], List[float], str]], 
                           titulo: str = "Familia de Curvas de Temperatura",
-                          colores: Optional[List[str]] = None):
-        """Grafica múltiples simulaciones en el mismo gráfico."""
+                          colores: Optional[List[str]] = None,
+                          valores: Optional[np.ndarray] = None,
+                          nombre_valor: str = "Curva"):
+        """
+        Grafica múltiples simulaciones en el mismo gráfico.
+        
+        Con más de MAX_CURVAS_INDIVIDUALES curvas (o si se pasan valores) se usa
+        plot_familia_coleccion: colores según valores (por defecto, el número
+        de curva) en lugar de leyenda.
+        """
+        if valores is not None or len(simulaciones) > HeatPlotter.MAX_CURVAS_INDIVIDUALES:
+            tiempos, temperaturas, longitudes = matriz_de_curvas([(t, T) for t, T, _ in simulaciones])
+            if valores is None:
+                valores = np.arange(1, len(simulaciones) + 1)
+            return HeatPlotter.plot_familia_coleccion(tiempos, temperaturas, valores, nombre_valor,
+                                                      titulo, longitudes=longitudes)
+        
         fig = plt.figure(figsize=(12, 8))
         
         if colores is None:
@@ -212,7 +1539,7 @@ class HeatPlotter:
         max_tiempo_min = 0
         
         for i, (tiempos, temperaturas, etiqueta) in enumerate(simulaciones):
-            tiempos_min = np.array(tiempos) / 60.0
+            tiempos_min = np.asarray(tiempos) / 60.0
             color = colores[i % len(colores)]
             plt.plot(tiempos_min, temperaturas, label=etiqueta, color=color)
             max_tiempo_min = max(max_tiempo_min, max(tiempos_min) if len(tiempos_min) > 0 else 0)
@@ -228,6 +1555,254 @@ class HeatPlotter:
         
         return fig
     
+    @staticmethod
+    def dibujar_coleccion(ax, tiempos: np.ndarray, temperaturas: np.ndarray,
+                          valores: Optional[np.ndarray] = None,
+                          longitudes: Optional[np.ndarray] = None,
+                          cmap: str = 'viridis', n_puntos: Optional[int] = None,
+                          **estilo) -> 'LineCollection':
+        """
+        Dibuja muchas curvas en un eje como una sola LineCollection.
+        
+        Cada curva se submuestrea con LTTB a tantos puntos como píxeles de
+        ancho tiene el eje: se conservan los picos y matplotlib dibuja un único
+        artista en lugar de uno por curva.
+        
+        Args:
+            ax: Eje de matplotlib
+            tiempos: Tiempos en segundos, comunes (n,) o por curva (curvas, n)
+            temperaturas: Matriz (curvas, n), por ejemplo la de BatchHeatSimulator
+            valores: Valor de cada curva para el mapa de colores (None = color fijo)
+            longitudes: Puntos válidos de cada curva (por defecto, n)
+            cmap: Mapa de colores
+            n_puntos: Puntos por curva (por defecto, el ancho del eje en píxeles)
+            **estilo: Argumentos extra de LineCollection (linewidths, alpha, colors...)
+            
+        Returns:
+            La LineCollection agregada al eje
+        """
+        from matplotlib.collections import LineCollection
+        
+        if n_puntos is None:
+            n_puntos = max(3, int(ax.get_window_extent().width))
+        x, y = lttb_lote(np.asarray(tiempos) / 60.0, temperaturas, n_puntos, longitudes)
+        
+        estilo.setdefault('linewidths', 0.8)
+        coleccion = LineCollection(np.stack([x, y], axis=-1), **estilo)
+        if valores is not None:
+            coleccion.set_array(np.asarray(valores, dtype=np.float64))
+            coleccion.set_cmap(cmap)
+        # Los límites salen de los puntos submuestreados (más rápido que recorrer los segmentos)
+        ax.add_collection(coleccion, autolim=False)
+        ax.update_datalim([(x.min(), y.min()), (x.max(), y.max())])
+        ax.autoscale_view()
+        return coleccion
+    
+    @staticmethod
+    def plot_familia_coleccion(tiempos: np.ndarray, temperaturas: np.ndarray, valores: np.ndarray,
+                               nombre_valor: str, titulo: str = "Familia de Curvas de Temperatura",
+                               longitudes: Optional[np.ndarray] = None, cmap: str = 'viridis'):
+        """
+        Grafica una familia grande de curvas coloreadas según el parámetro que varía.
+        
+        Pensado para miles de curvas (por ejemplo, las filas de un
+        BatchHeatSimulator): usa dibujar_coleccion y una barra de colores en
+        lugar de leyenda.
+        
+        Args:
+            tiempos: Tiempos en segundos, comunes (n,) o por curva (curvas, n)
+            temperaturas: Matriz (curvas, n)
+            valores: Valor del parámetro en cada curva
+            nombre_valor: Nombre del parámetro (etiqueta de la barra de colores)
+            titulo: Título del gráfico
+            longitudes: Puntos válidos de cada curva (por defecto, n)
+            cmap: Mapa de colores
+        """
+        fig, ax = plt.subplots(figsize=(12, 8))
+        
+        coleccion = HeatPlotter.dibujar_coleccion(ax, tiempos, temperaturas, valores, longitudes, cmap)
+        fig.colorbar(coleccion, ax=ax, label=nombre_valor)
+        
+        ax.axhline(100, color='r', linestyle='--', label="100 °C", alpha=0.7)
+        ax.set_title(f"{titulo} ({len(valores)} curvas)")
+        ax.set_xlabel('Tiempo (min)')
+        ax.set_ylabel('Temperatura (°C)')
+        ax.grid(True)
+        ax.legend(loc='lower right')  # loc='best' recorrería todos los vértices
+        
+        plt.sca(ax)
+        HeatPlotter._ajustar_ticks_x_max(np.nanmax(np.asarray(tiempos)) / 60.0)
+        
+        return fig
+    
+    @staticmethod
+    def plot_banda_ensamble(estadisticas, titulo: str = "Ensamble de simulaciones",
+                            referencia: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+                            color: str = 'blue'):
+        """
+        Grafica la media ± σ (y el rango mínimo-máximo) de un ensamble de corridas.
+        
+        Args:
+            estadisticas: EstadisticasEnsamble con las corridas acumuladas
+            titulo: Título del gráfico
+            referencia: Tupla (tiempos, temperaturas) opcional, por ejemplo la
+                corrida sin eventos, que se dibuja en negro
+            color: Color de la media y de las bandas
+        """
+        fig = plt.figure(figsize=(12, 8))
+        
+        tiempos_min = estadisticas.tiempos / 60.0
+        media = estadisticas.media
+        desviacion = np.nan_to_num(estadisticas.desviacion)
+        
+        plt.fill_between(tiempos_min, estadisticas.minimo, estadisticas.maximo,
+                         color=color, alpha=0.1, label="Mínimo - máximo")
+        plt.fill_between(tiempos_min, media - desviacion, media + desviacion,
+                         color=color, alpha=0.3, label="Media ± σ")
+        plt.plot(tiempos_min, media, color=color, linewidth=2,
+                 label=f"Media ({estadisticas.n_corridas} corridas)")
+        
+        max_tiempo_min = tiempos_min[-1] if tiempos_min.size > 0 else 0
+        if referencia is not None:
+            tiempos_ref_min = np.asarray(referencia[0]) / 60.0
+            plt.plot(tiempos_ref_min, referencia[1], color='black', linewidth=2, label="Referencia")
+            max_tiempo_min = max(max_tiempo_min, tiempos_ref_min[-1])
+        
+        plt.axhline(100, color='r', linestyle='--', label="100 °C", alpha=0.7)
+        plt.title(titulo)
+        plt.xlabel('Tiempo (min)')
+        plt.ylabel('Temperatura (°C)')
+        plt.grid(True)
+        plt.legend()
+        
+        HeatPlotter._ajustar_ticks_x_max(max_tiempo_min)
+        
+        return fig
+    
+    @staticmethod
+    def plot_abanico_cuantiles(cuantiles, titulo: str = "Cuantiles del ensamble",
+                               percentiles: Tuple[float, ...] = (5, 25, 50, 75, 95),
+                               referencia: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+                               color: str = 'blue'):
+        """
+        Grafica un abanico de percentiles de temperatura a partir de un CuantilesEnsamble.
+        
+        Los percentiles se toman de a pares simétricos (p, 100 - p) como bandas
+        anidadas, más opacas hacia el centro; el percentil 50 se dibuja como línea.
+        
+        Args:
+            cuantiles: CuantilesEnsamble con las corridas acumuladas
+            titulo: Título del gráfico
+            percentiles: Percentiles a dibujar (0-100)
+            referencia: Tupla (tiempos, temperaturas) opcional que se dibuja en negro
+            color: Color de las bandas y la mediana
+        """
+        fig = plt.figure(figsize=(12, 8))
+        
+        tiempos_min = cuantiles.tiempos / 60.0
+        percentiles = sorted(percentiles)
+        valores = dict(zip(percentiles, cuantiles.cuantiles_temperatura(np.asarray(percentiles) / 100.0)))
+        
+        bajos = [p for p in percentiles if p < 50 and 100 - p in valores]
+        for i, p in enumerate(bajos):
+            alpha = 0.15 + 0.35 * (i + 1) / len(bajos)
+            plt.fill_between(tiempos_min, valores[p], valores[100 - p], color=color, alpha=alpha,
+                             linewidth=0, label=f"P{p:g} - P{100 - p:g}")
+        if 50 in valores:
+            plt.plot(tiempos_min, valores[50], color=color, linewidth=2,
+                     label=f"Mediana ({cuantiles.n_corridas} corridas)")
+        
+        max_tiempo_min = tiempos_min[-1] if tiempos_min.size > 0 else 0
+        if referencia is not None:
+            tiempos_ref_min = np.asarray(referencia[0]) / 60.0
+            plt.plot(tiempos_ref_min, referencia[1], color='black', linewidth=2, label="Referencia")
+            max_tiempo_min = max(max_tiempo_min, tiempos_ref_min[-1])
+        
+        plt.axhline(100, color='r', linestyle='--', label="100 °C", alpha=0.7)
+        plt.title(titulo)
+        plt.xlabel('Tiempo (min)')
+        plt.ylabel('Temperatura (°C)')
+        plt.grid(True)
+        plt.legend()
+        
+        HeatPlotter._ajustar_ticks_x_max(max_tiempo_min)
+        
+        return fig
+    
+    @staticmethod
+    def plot_densidad_ensamble(densidad, titulo: str = "Densidad del ensamble",
+                               referencia: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+                               cmap: str = 'magma'):
+        """
+        Grafica un DensidadEnsamble como imagen con escala de colores logarítmica.
+        
+        Cada columna muestra cómo se reparten las temperaturas de todas las
+        corridas en ese intervalo de tiempo; las celdas sin muestras quedan en
+        blanco. Sirve para cientos de miles de corridas, donde las curvas
+        individuales se tapan entre sí.
+        
+        Args:
+            densidad: DensidadEnsamble con las corridas acumuladas
+            titulo: Título del gráfico
+            referencia: Tupla (tiempos, temperaturas) opcional, por ejemplo la
+                corrida sin eventos, que se dibuja encima en cian
+            cmap: Mapa de colores
+        """
+        from matplotlib.colors import LogNorm
+        
+        fig, ax = plt.subplots(figsize=(12, 8))
+        
+        fraccion = np.ma.masked_equal(densidad.densidad, 0.0)
+        extension = (0.0, densidad.t_max / 60.0, densidad.T_min, densidad.T_max)
+        imagen = ax.imshow(fraccion, origin='lower', aspect='auto', extent=extension,
+                           cmap=cmap, norm=LogNorm(), interpolation='nearest')
+        fig.colorbar(imagen, ax=ax, label="Fracción de corridas en cada intervalo")
+        
+        if referencia is not None:
+            ax.plot(np.asarray(referencia[0]) / 60.0, referencia[1], color='cyan', linewidth=2,
+                    label="Sin eventos estocásticos")
+        
+        ax.axhline(100, color='r', linestyle='--', label="100 °C", alpha=0.7)
+        ax.set_title(f"{titulo} ({densidad.n_corridas} corridas)")
+        ax.set_xlabel('Tiempo (min)')
+        ax.set_ylabel('Temperatura (°C)')
+        ax.legend(loc='lower right')
+        
+        plt.sca(ax)
+        HeatPlotter._ajustar_ticks_x_max(densidad.t_max / 60.0)
+        
+        return fig
+    
+    @staticmethod
+    def plot_indices_sensibilidad(resultado: Dict, salida: str, titulo: Optional[str] = None):
+        """
+        Grafica en barras los índices de Sobol de primer orden y totales de una salida.
+        
+        Args:
+            resultado: Diccionario devuelto por utils.sensibilidad.indices_sobol
+            salida: Salida del modelo a graficar (por ejemplo 'tiempo_100c')
+            titulo: Título del gráfico
+        """
+        fig = plt.figure(figsize=(10, 6))
+        
+        indices = resultado[salida]
+        posiciones = np.arange(len(resultado['parametros']))
+        ancho = 0.4
+        
+        plt.bar(posiciones - ancho / 2, indices['S1'], ancho, yerr=np.nan_to_num(indices['S1_ic']),
+                capsize=3, color='blue', alpha=0.7, label="Primer orden (S1)")
+        plt.bar(posiciones + ancho / 2, indices['ST'], ancho, yerr=np.nan_to_num(indices['ST_ic']),
+                capsize=3, color='orange', alpha=0.7, label="Total (ST)")
+        
+        plt.xticks(posiciones, resultado['parametros'], rotation=20)
+        plt.ylim(0, 1.05)
+        plt.title(titulo or f"Índices de Sobol: {salida}")
+        plt.ylabel('Fracción de la varianza')
+        plt.grid(True, axis='y', alpha=0.3)
+        plt.legend()
+        
+        return fig
+    
     @staticmethod
     def _ajustar_ticks_x(tiempos_min: np.ndarray):
         """Ajusta los ticks del eje X para mejor legibilidad."""
@@ -246,31 +1821,141 @@ class HeatPlotter:
 
 
 class ParameterDistribution:
-    """Generador de distribuciones de parámetros para TP4."""
+    """
+    Generador de distribuciones de parámetros para TP4.
+    
+    Todas las distribuciones aceptan rng: un np.random.Generator o una semilla
+    (ver obtener_generador). Sin rng se usa el estado global de np.random.
+    """
+    
+    # Distribución de cada parámetro: ('uniforme', mínimo, máximo) o ('normal', media, std)
+    DISTRIBUCIONES = {
+        'resistencia': ('uniforme', 0.35, 0.45),
+        'T_inicial': ('normal', 10.0, 5.0),
+        'T_amb': ('uniforme', -20.0, 50.0),
+        'tension': ('normal', 12.0, 4.0),
+    }
+    
+    @staticmethod
+    def muestreo_conjunto(n: int, metodo: str = 'sobol', parametros: Optional[List[str]] = None,
+                          distribuciones: Optional[Dict[str, Tuple]] = None,
+                          rng=None) -> Dict[str, np.ndarray]:
+        """
+        Muestrea conjuntamente varios parámetros.
+        
+        Con 'lhs' (hipercubo latino) o 'sobol' (secuencia de Sobol desordenada)
+        los puntos cubren el espacio de parámetros de forma pareja y las medias
+        convergen mucho más rápido que con 'mc' (muestreo independiente). Los
+        valores se obtienen con la inversa de la distribución acumulada de cada
+        parámetro.
+        
+        Args:
+            n: Cantidad de muestras (para Sobol conviene una potencia de 2)
+            metodo: 'sobol', 'lhs' o 'mc'
+            parametros: Parámetros a muestrear (por defecto, todos los de DISTRIBUCIONES)
+            distribuciones: Reemplazos de DISTRIBUCIONES para algunos parámetros
+            rng: Generador o semilla
+        
+        Returns:
+            Diccionario {parámetro: array de n valores}
+        """
+        tabla = dict(ParameterDistribution.DISTRIBUCIONES)
+        tabla.update(distribuciones or {})
+        parametros = list(parametros or tabla)
+        d = len(parametros)
+        rng = obtener_generador(rng)
+        
+        if metodo == 'sobol':
+            unitarios = sobol(n, d, rng=rng)
+        elif metodo == 'lhs':
+            unitarios = latin_hypercube(n, d, rng=rng)
+        elif metodo == 'mc':
+            unitarios = rng.random((n, d))
+        else:
+            raise ValueError(f"Método de muestreo desconocido: {metodo}")
+        
+        return ParameterDistribution.transformar(unitarios, parametros, tabla)
+    
+    @staticmethod
+    def transformar(unitarios: np.ndarray, parametros: List[str],
+                    distribuciones: Optional[Dict[str, Tuple]] = None) -> Dict[str, np.ndarray]:
+        """
+        Lleva puntos del hipercubo unitario a las distribuciones de los parámetros
+        (inversa de la distribución acumulada de cada uno).
+        
+        Args:
+            unitarios: Matriz (n, len(parametros)) con valores en (0, 1)
+            parametros: Nombre del parámetro de cada columna
+            distribuciones: Tabla de distribuciones (por defecto, DISTRIBUCIONES)
+        
+        Returns:
+            Diccionario {parámetro: array de n valores}
+        """
+        tabla = ParameterDistribution.DISTRIBUCIONES if distribuciones is None else distribuciones
+        muestra = {}
+        for j, nombre in enumerate(parametros):
+            tipo, a, b = tabla[nombre]
+            if tipo == 'uniforme':
+                muestra[nombre] = a + (b - a) * unitarios[:, j]
+            elif tipo == 'normal':
+                muestra[nombre] = normal_inversa(unitarios[:, j], a, b)
+            else:
+                raise ValueError(f"Distribución desconocida para {nombre}: {tipo}")
+        return muestra
+    
+    @staticmethod
+    def parametros_desde_muestra(muestra: Dict[str, np.ndarray], **fijos) -> List[HeatSimulationParameters]:
+        """
+        Convierte una muestra conjunta en parámetros de simulación.
+        
+        La potencia se recalcula como tension² / resistencia cuando la muestra
+        incluye alguno de los dos.
+        
+        Args:
+            muestra: Diccionario devuelto por muestreo_conjunto
+            **fijos: Parámetros comunes a todas las simulaciones
+        
+        Returns:
+            Lista de HeatSimulationParameters, uno por muestra
+        """
+        nombres = list(muestra)
+        lista_params = []
+        for valores in zip(*(muestra[nombre] for nombre in nombres)):
+            argumentos = dict(fijos)
+            argumentos.update(zip(nombres, (float(v) for v in valores)))
+            params = HeatSimulationParameters(**argumentos)
+            if 'tension' in muestra or 'resistencia' in muestra:
+                params = params.con_potencia_desde_tension()
+            lista_params.append(params)
+        return lista_params
     
     @staticmethod
-    def distribucion_uniforme_resistencias(n: int = 5, base: float = 0.4, variacion: float = 0.05) -> List[float]:
+    def distribucion_uniforme_resistencias(n: int = 5, base: float = 0.4, variacion: float = 0.05,
+                                           rng=None) -> List[float]:
         """4.A: Distribución uniforme de resistencias."""
-        return np.random.uniform(base - variacion, base + variacion, n).tolist()
+        return obtener_generador(rng).uniform(base - variacion, base + variacion, n).tolist()
     
     @staticmethod
-    def distribucion_normal_temperatura_inicial(n: int = 5, media: float = 10, std: float = 5) -> List[float]:
+    def distribucion_normal_temperatura_inicial(n: int = 5, media: float = 10, std: float = 5,
+                                                rng=None) -> List[float]:
         """4.B: Distribución normal de temperaturas iniciales."""
-        return np.random.normal(media, std, n).tolist()
+        return obtener_generador(rng).normal(media, std, n).tolist()
     
     @staticmethod
-    def distribucion_uniforme_temperatura_ambiente(n: int = 8, min_temp: float = -20, max_temp: float = 50) -> List[float]:
+    def distribucion_uniforme_temperatura_ambiente(n: int = 8, min_temp: float = -20, max_temp: float = 50,
+                                                   rng=None) -> List[float]:
         """4.C: Distribución uniforme de temperaturas ambiente."""
-        return np.random.uniform(min_temp, max_temp, n).tolist()
+        return obtener_generador(rng).uniform(min_temp, max_temp, n).tolist()
     
     @staticmethod
-    def distribucion_normal_tension(n: int = 5, media: float = 12, std: float = 4) -> List[float]:
+    def distribucion_normal_tension(n: int = 5, media: float = 12, std: float = 4,
+                                    rng=None) -> List[float]:
         """4.D: Distribución normal de tensiones."""
-        return np.random.normal(media, std, n).tolist()
+        return obtener_generador(rng).normal(media, std, n).tolist()
 
 
 # Funciones de conveniencia para uso directo
-def simular_calentamiento_basico(params: Optional[HeatSimulationParameters] = None) -> Tuple[List[float], List[float]]:
+def simular_calentamiento_basico(params: Optional[HeatSimulationParameters] = None) -> Tuple[np.ndarray, np.ndarray]:
     """Función de conveniencia para simulación básica."""
     if params is None:
         params = HeatSimulationParameters()
@@ -283,7 +1968,7 @@ def simular_con_evento_estocastico(params: Optional[HeatSimulationParameters] =
                                  probabilidad: float = 1/300,
                                  descenso_max: float = 50,
                                  duracion_min: int = 30,
-                                 duracion_max: int = 120) -> Tuple[List[float], List[float]]:
+                                 duracion_max: int = 120) -> Tuple[np.ndarray, np.ndarray]:
     """Función de conveniencia para simulación con eventos estocásticos (TP5)."""
     if params is None:
         params = HeatSimulationParameters()
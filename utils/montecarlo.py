@@ -0,0 +1,306 @@
+"""
+Ejecución Monte Carlo de simulaciones en paralelo (TP5).
+
+Las corridas se reparten en lotes sobre un ProcessPoolExecutor. Cada corrida
+recibe su propia semilla hija de la campaña (ver semillas_por_corrida), así que
+los resultados son idénticos sin importar la cantidad de procesos ni el tamaño
+de lote.
+"""
+import math
+import os
+import signal
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from utils.heat_simulation import HeatSimulationParameters, HeatSimulator, semillas_por_corrida
+
+
+def metrica_tiempo_100c(resumen: Dict) -> Optional[float]:
+    """Tiempo hasta 100°C de una corrida en modo resumen (None si no llegó)."""
+    return resumen['tiempo_100c']
+
+
+def metrica_supera_tiempo(limite: float = 2500) -> Callable[[Dict], float]:
+    """
+    Indicadora de que una corrida tarda más de limite segundos en llegar a 100°C.
+
+    Su media es la probabilidad de superar el límite. Las corridas que no llegan
+    a 100°C cuentan como que lo superan, así que tiempo_total debe ser al menos
+    limite.
+    """
+    def metrica(resumen: Dict) -> float:
+        tiempo = resumen['tiempo_100c']
+        return float(tiempo is None or tiempo > limite)
+    return metrica
+
+
+def _ignorar_sigint():
+    """Inicializador de los workers: Ctrl-C lo atiende solo el proceso principal."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def _ejecutar_lote(lista_params: List[HeatSimulationParameters], semillas: List[np.random.SeedSequence],
+                   evento_estocastico: Optional[Dict], parar_en_100c: bool, registrar) -> List[Any]:
+    """Ejecuta un lote de corridas en el proceso actual y devuelve sus resultados en orden."""
+    resultados = []
+    for params, semilla in zip(lista_params, semillas):
+        simulator = HeatSimulator(params, rng=np.random.default_rng(semilla))
+        resultados.append(simulator.simular(evento_estocastico=evento_estocastico,
+                                            parar_en_100c=parar_en_100c,
+                                            registrar=registrar))
+    return resultados
+
+
+class MonteCarloRunner:
+    """Ejecuta muchas corridas de HeatSimulator repartidas entre varios procesos."""
+
+    def __init__(self,
+                 params: Union[HeatSimulationParameters, Sequence[HeatSimulationParameters]],
+                 evento_estocastico: Optional[Dict] = None,
+                 parar_en_100c: bool = True,
+                 registrar='completo',
+                 workers: Optional[int] = None,
+                 tam_lote: Optional[int] = None):
+        """
+        Args:
+            params: Parámetros comunes a todas las corridas, o una lista con los
+                parámetros de cada corrida
+            evento_estocastico: Parámetros de eventos (igual que en HeatSimulator.simular)
+            parar_en_100c: Si True, cada corrida para al alcanzar 100°C
+            registrar: Modo de registro de cada corrida (ver HeatSimulator.simular)
+            workers: Cantidad de procesos (por defecto, uno por núcleo). Con 1 se
+                ejecuta todo en el proceso actual
+            tam_lote: Corridas por tarea enviada a cada proceso (por defecto se
+                reparten unos 4 lotes por proceso)
+        """
+        if workers is not None and workers < 1:
+            raise ValueError("workers debe ser al menos 1")
+        if tam_lote is not None and tam_lote < 1:
+            raise ValueError("tam_lote debe ser al menos 1")
+
+        self.params = params
+        self.evento_estocastico = evento_estocastico
+        self.parar_en_100c = parar_en_100c
+        self.registrar = registrar
+        self.workers = workers or os.cpu_count() or 1
+        self.tam_lote = tam_lote
+
+    def _lista_params(self, n_corridas: Optional[int]) -> List[HeatSimulationParameters]:
+        """Expande los parámetros a uno por corrida."""
+        if isinstance(self.params, HeatSimulationParameters):
+            if n_corridas is None:
+                raise ValueError("Con parámetros comunes hay que indicar n_corridas")
+            return [self.params] * n_corridas
+
+        lista = list(self.params)
+        if n_corridas is not None and n_corridas != len(lista):
+            raise ValueError("n_corridas no coincide con la cantidad de parámetros")
+        return lista
+
+    def iterar(self, n_corridas: Optional[int] = None, semilla=None) -> Iterator[Any]:
+        """
+        Ejecuta las corridas y entrega sus resultados en orden a medida que terminan.
+
+        Se mantienen a lo sumo dos lotes en curso por proceso, así que la memoria
+        no crece con la cantidad de corridas si el consumidor procesa y descarta
+        cada resultado. Ante Ctrl-C se cancelan los lotes pendientes y se cierra
+        el pool antes de propagar la interrupción.
+
+        Args:
+            n_corridas: Cantidad de corridas (por defecto, una por parámetro)
+            semilla: Semilla de la campaña (int, SeedSequence o None)
+
+        Yields:
+            El resultado de HeatSimulator.simular de cada corrida, en orden
+        """
+        lista_params = self._lista_params(n_corridas)
+        semillas = semillas_por_corrida(semilla, len(lista_params))
+        if self.workers == 1:
+            yield from self._iterar_en(None, lista_params, semillas)
+            return
+
+        ejecutor = self._crear_pool(len(lista_params))
+        try:
+            yield from self._iterar_en(ejecutor, lista_params, semillas)
+        except BaseException:
+            ejecutor.shutdown(wait=False, cancel_futures=True)
+            raise
+        ejecutor.shutdown()
+
+    def _crear_pool(self, n_corridas: int) -> ProcessPoolExecutor:
+        """Pool de procesos para n_corridas (no más procesos que lotes)."""
+        n_lotes = math.ceil(n_corridas / self.tam_lote) if self.tam_lote else self.workers
+        return ProcessPoolExecutor(max_workers=max(1, min(self.workers, n_lotes)), initializer=_ignorar_sigint)
+
+    def _iterar_en(self, ejecutor: Optional[ProcessPoolExecutor], lista_params: List[HeatSimulationParameters],
+                   semillas: List[np.random.SeedSequence]) -> Iterator[Any]:
+        """Ejecuta las corridas en un pool ya creado (o en este proceso si es None), en orden."""
+        n = len(lista_params)
+        tam_lote = self.tam_lote or max(1, math.ceil(n / (self.workers * 4)))
+        lotes = [(lista_params[i:i + tam_lote], semillas[i:i + tam_lote]) for i in range(0, n, tam_lote)]
+
+        if ejecutor is None:
+            for lista, semillas_lote in lotes:
+                yield from _ejecutar_lote(lista, semillas_lote, self.evento_estocastico,
+                                          self.parar_en_100c, self.registrar)
+            return
+
+        pendientes = deque()
+        siguiente = 0
+        try:
+            while siguiente < len(lotes) or pendientes:
+                # Mantener el pool ocupado sin encolar toda la campaña de una vez
+                while siguiente < len(lotes) and len(pendientes) < 2 * self.workers:
+                    lista, semillas_lote = lotes[siguiente]
+                    pendientes.append(ejecutor.submit(_ejecutar_lote, lista, semillas_lote,
+                                                      self.evento_estocastico,
+                                                      self.parar_en_100c, self.registrar))
+                    siguiente += 1
+                yield from pendientes.popleft().result()
+        finally:
+            # Si el consumidor corta antes, no quedan lotes de más ocupando el pool
+            for futuro in pendientes:
+                futuro.cancel()
+
+    def ejecutar(self, n_corridas: Optional[int] = None, semilla=None) -> List[Any]:
+        """Igual que iterar pero devuelve la lista completa de resultados."""
+        return list(self.iterar(n_corridas, semilla))
+
+    def ejecutar_hasta_convergencia(self,
+                                    metrica: Callable[[Any], Optional[float]] = metrica_tiempo_100c,
+                                    tolerancia: float = 5.0,
+                                    confianza: float = 0.95,
+                                    tam_tanda: int = 100,
+                                    min_corridas: int = 30,
+                                    max_corridas: Optional[int] = None,
+                                    tiempo_max: Optional[float] = None,
+                                    semilla=None) -> Dict[str, Any]:
+        """
+        Ejecuta tandas de corridas hasta que el intervalo de confianza de la media
+        de la métrica tenga semi-ancho menor a tolerancia, o se agote el presupuesto.
+
+        El intervalo es el normal asintótico, media ± z·s/√n. Si todos los
+        valores son 0 o 1 (una indicadora, como metrica_supera_tiempo) se usa
+        el intervalo de Wilson de la proporción: el de Wald tiene ancho cero
+        cuando no hubo eventos (o todos lo fueron) y la campaña pararía en la
+        primera evaluación. Todas las tandas se ejecutan en un mismo pool de
+        procesos. Las corridas en las que la
+        métrica vale None no entran en la media: con metrica_tiempo_100c la
+        estimación es la del tiempo hasta 100°C condicionado a llegar, y las
+        corridas que no llegan (las más lentas) se informan como censuradas.
+        Si hay censuradas, la media está sesgada hacia abajo y el intervalo no
+        refleja ese sesgo. Cada tanda usa una semilla
+        hija de la campaña, así que con la misma semilla y tam_tanda el
+        resultado no depende de la cantidad de procesos.
+
+        Args:
+            metrica: Función que extrae un valor de cada resultado (None lo
+                descarta). Con registrar='resumen' puede usarse
+                metrica_tiempo_100c o metrica_supera_tiempo(2500)
+            tolerancia: Semi-ancho del intervalo buscado, en unidades de la métrica
+            confianza: Nivel de confianza del intervalo
+            tam_tanda: Corridas por tanda; la convergencia se evalúa entre tandas
+            min_corridas: Valores válidos mínimos antes de evaluar la convergencia
+            max_corridas: Tope de corridas
+            tiempo_max: Tope de tiempo de reloj en segundos; se controla
+                después de cada corrida. Hay que indicar al menos uno de los
+                dos topes: si la métrica descarta todas las corridas, la
+                tolerancia nunca se alcanza
+            semilla: Semilla de la campaña
+
+        Returns:
+            Diccionario con:
+                - media, semi_ancho, intervalo: estimación y precisión alcanzada
+                  (con una indicadora, intervalo es el de Wilson, centrado en
+                  otro punto que la media)
+                - n_corridas, n_validas: corridas ejecutadas y con valor
+                - n_censuradas, fraccion_censurada: corridas descartadas por la
+                  métrica (None) y su fracción sobre n_corridas
+                - convergio: si se alcanzó la tolerancia
+                - motivo: 'tolerancia', 'tiempo' o 'max_corridas'
+                - tiempo: segundos de reloj empleados
+                - historial: lista de (n_validas, media, semi_ancho) por tanda
+        """
+        if not isinstance(self.params, HeatSimulationParameters):
+            raise ValueError("La campaña adaptativa requiere parámetros comunes a todas las corridas")
+        if tolerancia <= 0:
+            raise ValueError("tolerancia debe ser positiva")
+        if max_corridas is None and tiempo_max is None:
+            raise ValueError("Hay que indicar max_corridas o tiempo_max")
+
+        z = NormalDist().inv_cdf((1 + confianza) / 2)
+        raiz = semilla if isinstance(semilla, np.random.SeedSequence) else np.random.SeedSequence(semilla)
+        inicio = time.perf_counter()
+
+        n_corridas = n = 0
+        media = m2 = 0.0
+        semi_ancho = math.inf
+        historial = []
+        motivo = None
+
+        indicadora = True
+        centro = 0.0
+
+        def intervalo_actual() -> Tuple[float, float]:
+            """Centro y semi-ancho del intervalo de confianza con los valores hasta ahora."""
+            if n < 2:
+                return media, math.inf
+            if indicadora:
+                # Wilson: no colapsa a ancho cero con media 0 o 1
+                z2_n = z * z / n
+                centro_wilson = (media + z2_n / 2) / (1 + z2_n)
+                return centro_wilson, z / (1 + z2_n) * math.sqrt(media * (1 - media) / n + z2_n / (4 * n))
+            return media, z * math.sqrt(m2 / (n - 1) / n)
+
+        ejecutor = self._crear_pool(max_corridas or tam_tanda * self.workers) if self.workers > 1 else None
+        try:
+            while motivo is None:
+                tanda = tam_tanda if max_corridas is None else min(tam_tanda, max_corridas - n_corridas)
+                hijas = semillas_por_corrida(raiz.spawn(1)[0], tanda)
+                for resultado in self._iterar_en(ejecutor, [self.params] * tanda, hijas):
+                    n_corridas += 1
+                    valor = metrica(resultado)
+                    if valor is not None:
+                        # Welford para la media y la varianza de la métrica
+                        n += 1
+                        indicadora = indicadora and valor in (0, 1)
+                        delta = valor - media
+                        media += delta / n
+                        m2 += delta * (valor - media)
+                    if tiempo_max is not None and time.perf_counter() - inicio >= tiempo_max:
+                        motivo = 'tiempo'
+                        break
+
+                centro, semi_ancho = intervalo_actual()
+                historial.append((n, media, semi_ancho))
+                if n >= max(min_corridas, 2) and semi_ancho <= tolerancia:
+                    motivo = 'tolerancia'
+                elif max_corridas is not None and n_corridas >= max_corridas:
+                    motivo = motivo or 'max_corridas'
+        except BaseException:
+            if ejecutor is not None:
+                ejecutor.shutdown(wait=False, cancel_futures=True)
+            raise
+        if ejecutor is not None:
+            # Si paró por tiempo a mitad de tanda, los lotes que no empezaron se descartan
+            ejecutor.shutdown(cancel_futures=True)
+
+        return {
+            'media': media if n > 0 else math.nan,
+            'semi_ancho': semi_ancho,
+            'intervalo': (centro - semi_ancho, centro + semi_ancho),
+            'confianza': confianza,
+            'n_corridas': n_corridas,
+            'n_validas': n,
+            'n_censuradas': n_corridas - n,
+            'fraccion_censurada': (n_corridas - n) / n_corridas if n_corridas else 0.0,
+            'convergio': motivo == 'tolerancia',
+            'motivo': motivo,
+            'tiempo': time.perf_counter() - inicio,
+            'historial': historial,
+        }
@@ -0,0 +1,44 @@
+"""
+Importación perezosa de módulos pesados.
+
+matplotlib.pyplot tarda unas décimas de segundo en importarse y los TPs lo
+usan solo para graficar. importar_perezoso devuelve un sustituto del módulo que
+hace la importación real recién cuando se usa uno de sus atributos, así que el
+menú y las opciones de solo texto arrancan sin cargar matplotlib.
+"""
+import importlib
+import sys
+import types
+
+
+class ModuloPerezoso(types.ModuleType):
+    """Sustituto de un módulo que lo importa en el primer acceso a un atributo."""
+
+    def __init__(self, nombre: str):
+        super().__init__(nombre)
+
+    def __getattr__(self, atributo: str):
+        # Solo se llega acá con atributos que el sustituto no tiene
+        return getattr(importlib.import_module(self.__name__), atributo)
+
+    def __dir__(self):
+        return dir(importlib.import_module(self.__name__))
+
+    def __repr__(self) -> str:
+        estado = "cargado" if self.__name__ in sys.modules else "sin cargar"
+        return f"<módulo perezoso '{self.__name__}' ({estado})>"
+
+
+def importar_perezoso(nombre: str) -> types.ModuleType:
+    """
+    Devuelve el módulo si ya está importado o un sustituto perezoso si no.
+
+    Args:
+        nombre: Nombre completo del módulo (por ejemplo 'matplotlib.pyplot')
+
+    Returns:
+        El módulo o un ModuloPerezoso que lo importa al usarlo
+    """
+    if nombre in sys.modules:
+        return sys.modules[nombre]
+    return ModuloPerezoso(nombre)
@@ -0,0 +1,180 @@
+"""
+Renderizado de gráficos sin pantalla (modo headless).
+
+Por defecto los TPs muestran cada gráfico con plt.show() y esperan Enter. Con
+configurar_render(directorio) se pasa al backend Agg: mostrar_figuras guarda
+las figuras abiertas como PNG/SVG en el directorio y las cierra (la memoria no
+crece entre corridas) y pausar deja de esperar al usuario.
+renderizar_en_paralelo ejecuta muchas funciones de gráficos a la vez, cada una
+en su propio proceso.
+"""
+import builtins
+import contextlib
+import os
+import re
+import unicodedata
+from typing import Callable, Dict, List, Optional, Sequence
+
+from utils.perezoso import importar_perezoso
+
+matplotlib = importar_perezoso('matplotlib')
+plt = importar_perezoso('matplotlib.pyplot')
+
+FORMATOS = ('png', 'svg')
+
+# Configuración del modo headless del proceso actual (None = interactivo)
+_config: Optional[Dict] = None
+
+
+def configurar_render(directorio: str, formatos: Sequence[str] = ('png',), dpi: int = 100,
+                      prefijo: str = '') -> str:
+    """
+    Activa el modo headless en este proceso.
+
+    Args:
+        directorio: Carpeta de salida (se crea si no existe)
+        formatos: Formatos de archivo ('png' y/o 'svg')
+        dpi: Resolución de los PNG
+        prefijo: Prefijo de los nombres de archivo
+
+    Returns:
+        Ruta absoluta del directorio de salida
+    """
+    global _config
+    formatos = tuple(formatos)
+    desconocidos = set(formatos) - set(FORMATOS)
+    if not formatos or desconocidos:
+        raise ValueError(f"Formatos admitidos: {', '.join(FORMATOS)}")
+
+    directorio = os.path.abspath(directorio)
+    os.makedirs(directorio, exist_ok=True)
+    plt.switch_backend('Agg')
+    _config = {'directorio': directorio, 'formatos': formatos, 'dpi': dpi,
+               'prefijo': prefijo, 'contador': 0, 'archivos': []}
+    return directorio
+
+
+def desactivar_render():
+    """Vuelve al modo interactivo (el backend queda en Agg hasta reiniciar)."""
+    global _config
+    _config = None
+
+
+def render_activo() -> bool:
+    """Indica si el proceso está en modo headless."""
+    return _config is not None
+
+
+def _nombre_archivo(fig) -> str:
+    """Nombre de archivo (sin extensión) a partir del título de la figura."""
+    _config['contador'] += 1
+    titulo = fig.get_suptitle()
+    if not titulo and fig.axes:
+        titulo = fig.axes[0].get_title()
+    titulo = unicodedata.normalize('NFKD', titulo).encode('ascii', 'ignore').decode('ascii')
+    slug = re.sub(r'[^0-9a-zA-Z]+', '_', titulo).strip('_').lower()[:60]
+    partes = [_config['prefijo'], f"{_config['contador']:02d}", slug]
+    return '_'.join(parte for parte in partes if parte)
+
+
+def mostrar_figuras() -> List[str]:
+    """
+    Reemplazo de plt.show().
+
+    En modo interactivo muestra las figuras abiertas. En modo headless las
+    guarda en todos los formatos configurados y las cierra.
+
+    Returns:
+        Rutas de los archivos escritos (vacía en modo interactivo)
+    """
+    if _config is None:
+        plt.show()
+        return []
+
+    rutas = []
+    for numero in plt.get_fignums():
+        fig = plt.figure(numero)
+        base = os.path.join(_config['directorio'], _nombre_archivo(fig))
+        for formato in _config['formatos']:
+            ruta = f"{base}.{formato}"
+            fig.savefig(ruta, format=formato, dpi=_config['dpi'], bbox_inches='tight')
+            rutas.append(ruta)
+        plt.close(fig)
+    _config['archivos'].extend(rutas)
+    return rutas
+
+
+def pausar(mensaje: str = "Presiona Enter para continuar..."):
+    """Reemplazo de input() para pausas: en modo headless no espera."""
+    if _config is None:
+        input(mensaje)
+
+
+def _inicializar_worker(directorio: str, formatos: Sequence[str], dpi: int):
+    """Inicializador de los procesos: backend Agg y modo headless."""
+    matplotlib.use('Agg', force=True)
+    configurar_render(directorio, formatos, dpi)
+
+
+def _renderizar_tarea(nombre: str, funcion: Callable, silenciar: bool) -> List[str]:
+    """Ejecuta una función de gráficos y guarda todas las figuras que deja abiertas."""
+    _config.update(prefijo=nombre, contador=0, archivos=[])
+    salida = open(os.devnull, 'w') if silenciar else None
+    # Las funciones de los TPs no deben pedir datos en modo headless
+    input_original = builtins.input
+    builtins.input = lambda *args, **kwargs: ''
+    try:
+        with contextlib.redirect_stdout(salida) if silenciar else contextlib.nullcontext():
+            funcion()
+        mostrar_figuras()
+    finally:
+        builtins.input = input_original
+        plt.close('all')
+        if salida is not None:
+            salida.close()
+    return list(_config['archivos'])
+
+
+def renderizar_en_paralelo(tareas: Dict[str, Callable], directorio: str,
+                           formatos: Sequence[str] = ('png',), dpi: int = 100,
+                           workers: Optional[int] = None, silenciar: bool = True) -> Dict[str, List[str]]:
+    """
+    Ejecuta funciones de gráficos en paralelo y guarda sus figuras.
+
+    Cada función corre en un proceso con backend Agg; sus figuras se guardan
+    como <nombre>_<n>_<título>.<formato> y se cierran al terminar la tarea.
+
+    Args:
+        tareas: Diccionario {nombre: función sin argumentos}. Las funciones
+            deben poder enviarse a otro proceso (definidas a nivel de módulo o
+            functools.partial de ellas)
+        directorio: Carpeta de salida
+        formatos: Formatos de archivo ('png' y/o 'svg')
+        dpi: Resolución de los PNG
+        workers: Cantidad de procesos (por defecto, uno por núcleo). Con 1 se
+            ejecuta todo en el proceso actual
+        silenciar: Si True, descarta lo que las funciones imprimen
+
+    Returns:
+        Diccionario {nombre: lista de archivos escritos}, en el orden de tareas
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    
+    global _config
+    workers = workers or os.cpu_count() or 1
+    directorio = os.path.abspath(directorio)
+    os.makedirs(directorio, exist_ok=True)
+
+    if workers == 1:
+        anterior = _config
+        _inicializar_worker(directorio, formatos, dpi)
+        try:
+            return {nombre: _renderizar_tarea(nombre, funcion, silenciar) for nombre, funcion in tareas.items()}
+        finally:
+            _config = anterior
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(tareas) or 1), initializer=_inicializar_worker,
+                             initargs=(directorio, tuple(formatos), dpi)) as ejecutor:
+        futuros = {nombre: ejecutor.submit(_renderizar_tarea, nombre, funcion, silenciar)
+                   for nombre, funcion in tareas.items()}
+        return {nombre: futuro.result() for nombre, futuro in futuros.items()}
@@ -0,0 +1,311 @@
+"""
+Archivo columnar de resultados de simulación (trayectorias y parámetros).
+
+Un archivo de resultados es una carpeta con un .bin crudo por columna:
+
+    tiempos.bin         tiempos de todas las corridas, concatenados (float32 o float64)
+    temperaturas.bin    temperaturas de todas las corridas, concatenadas
+    desplazamientos.bin int64, n_corridas + 1: la corrida i ocupa [d[i], d[i+1])
+    semillas.bin        int64, semilla propia de cada corrida (-1 = corrida determinista)
+    parametro_<p>.bin   float64, una columna por parámetro
+    resultados.json     tipo de dato, nombres de las columnas y metadatos libres
+
+La semilla de una corrida es el índice de su SeedSequence hija (spawn_key)
+dentro de la campaña, cuya entropía va en metadatos['entropia']. Con las dos
+se reconstruye el generador de la corrida sin depender de su posición en el
+archivo (ver LectorResultados.generador).
+
+El escritor agrega corridas por bloques sin guardar nada en memoria, y escribe
+los desplazamientos al final de cada bloque: si el proceso se corta, el lector
+ve todas las corridas cuyo bloque terminó. El lector abre las columnas con
+np.memmap, así que una campaña de decenas de GB se analiza leyendo del disco
+solo las páginas que se usan.
+"""
+import json
+import os
+from typing import Dict, Iterator, Mapping, Optional, Tuple, Union
+
+import numpy as np
+
+from utils.heat_simulation import ParameterTable
+
+ARCHIVO_METADATOS = 'resultados.json'
+ARCHIVOS = ('tiempos.bin', 'temperaturas.bin', 'semillas.bin', 'desplazamientos.bin', ARCHIVO_METADATOS)
+VERSION = 1
+
+
+def _ruta_parametro(directorio: str, nombre: str) -> str:
+    return os.path.join(directorio, f"parametro_{nombre}.bin")
+
+
+def _memmap(ruta: str, dtype, n: int) -> np.ndarray:
+    """Primeros n valores de un .bin como memmap de solo lectura (np.memmap no admite archivos vacíos)."""
+    if n == 0:
+        return np.zeros(0, dtype=dtype)
+    return np.memmap(ruta, dtype=dtype, mode='r', shape=(n,))
+
+
+class EscritorResultados:
+    """Escribe un archivo de resultados corrida por corrida o por bloques."""
+
+    def __init__(self, directorio: str, dtype=np.float32, metadatos: Optional[Dict] = None,
+                 puntos_por_bloque: int = 2**18):
+        """
+        Args:
+            directorio: Carpeta del archivo (se crea; si ya tenía resultados, se reemplazan)
+            dtype: Tipo de tiempos y temperaturas (float32 ocupa la mitad que float64)
+            metadatos: Diccionario serializable a JSON con datos de la campaña
+            puntos_por_bloque: Las corridas sueltas (agregar) se juntan en memoria
+                hasta sumar esta cantidad de puntos y se escriben como un bloque
+        """
+        self.directorio = os.path.abspath(directorio)
+        self.dtype = np.dtype(dtype)
+        if self.dtype not in (np.float32, np.float64):
+            raise ValueError("dtype debe ser float32 o float64")
+        self.metadatos = dict(metadatos or {})
+        self.parametros = None
+        self.n_corridas = 0
+        self.n_puntos = 0
+        self.puntos_por_bloque = puntos_por_bloque
+        self._pendientes = []
+        self._puntos_pendientes = 0
+
+        os.makedirs(self.directorio, exist_ok=True)
+        for archivo in os.listdir(self.directorio):
+            if archivo in ARCHIVOS or archivo.startswith('parametro_') and archivo.endswith('.bin'):
+                os.remove(os.path.join(self.directorio, archivo))
+
+        self._archivos = {nombre: open(os.path.join(self.directorio, f"{nombre}.bin"), 'wb')
+                          for nombre in ('tiempos', 'temperaturas', 'semillas', 'desplazamientos')}
+        np.zeros(1, dtype=np.int64).tofile(self._archivos['desplazamientos'])
+        self._escribir_metadatos(completo=False)
+
+    def _escribir_metadatos(self, completo: bool):
+        contenido = {
+            'version': VERSION,
+            'dtype': self.dtype.name,
+            'parametros': self.parametros or [],
+            'n_corridas': self.n_corridas,
+            'n_puntos': self.n_puntos,
+            'completo': completo,
+            'metadatos': self.metadatos,
+        }
+        with open(os.path.join(self.directorio, ARCHIVO_METADATOS), 'w', encoding='utf-8') as f:
+            json.dump(contenido, f, ensure_ascii=False, indent=2)
+
+    def _columnas(self, parametros: Union[ParameterTable, Mapping, None], n: int) -> Dict[str, np.ndarray]:
+        """Valida los parámetros de un bloque y los lleva a columnas float64 de n filas."""
+        if isinstance(parametros, ParameterTable):
+            parametros = {campo: getattr(parametros, campo) for campo in ParameterTable.CAMPOS}
+        parametros = dict(parametros or {})
+
+        if self.parametros is None:
+            # Las columnas quedan fijas con el primer bloque
+            self.parametros = list(parametros)
+            for nombre in self.parametros:
+                self._archivos[f"parametro_{nombre}"] = open(_ruta_parametro(self.directorio, nombre), 'wb')
+            self._escribir_metadatos(completo=False)
+        elif set(parametros) != set(self.parametros):
+            raise ValueError(f"Los parámetros deben ser siempre {', '.join(self.parametros)}")
+
+        columnas = {}
+        for nombre in self.parametros:
+            columna = np.asarray(parametros[nombre], dtype=np.float64)
+            if columna.ndim > 1 or (columna.ndim == 1 and len(columna) != n):
+                raise ValueError(f"El parámetro {nombre} debe ser un escalar o tener {n} valores")
+            columnas[nombre] = np.broadcast_to(columna, (n,))
+        return columnas
+
+    def agregar(self, tiempos: np.ndarray, temperaturas: np.ndarray,
+                parametros: Union[ParameterTable, Mapping, None] = None, semilla: Optional[int] = None):
+        """
+        Agrega una corrida (se escribe junto con otras al completar un bloque).
+
+        Args:
+            tiempos: Tiempos de la corrida (s)
+            temperaturas: Temperaturas de la corrida (°C), de igual longitud
+            parametros: Diccionario {parámetro: valor} (o ParameterTable de una fila)
+            semilla: Índice de la semilla hija de la corrida (None = corrida determinista)
+        """
+        tiempos = np.asarray(tiempos)
+        temperaturas = np.asarray(temperaturas)
+        if tiempos.shape != temperaturas.shape or tiempos.ndim != 1:
+            raise ValueError("tiempos y temperaturas deben ser arrays 1-D de igual longitud")
+        # Los parámetros de una corrida se guardan como una fila, en el orden de las columnas
+        if self.parametros is None or isinstance(parametros, ParameterTable):
+            columnas = self._columnas(parametros, 1)
+            fila = [columnas[nombre][0] for nombre in self.parametros]
+        else:
+            parametros = parametros or {}
+            if parametros.keys() != set(self.parametros):
+                raise ValueError(f"Los parámetros deben ser siempre {', '.join(self.parametros)}")
+            fila = [float(parametros[nombre]) for nombre in self.parametros]
+        self._pendientes.append((tiempos.astype(self.dtype), temperaturas.astype(self.dtype), fila,
+                                 -1 if semilla is None else semilla))
+        self._puntos_pendientes += len(tiempos)
+        if self._puntos_pendientes >= self.puntos_por_bloque:
+            self._vaciar()
+
+    def _vaciar(self):
+        """Escribe como un bloque las corridas sueltas acumuladas."""
+        if not self._pendientes:
+            return
+        tiempos, temperaturas, filas, semillas = zip(*self._pendientes)
+        self._pendientes = []
+        self._puntos_pendientes = 0
+        tabla = np.array(filas, dtype=np.float64).reshape(len(filas), len(self.parametros))
+        self._escribir_bloque(np.concatenate(tiempos), np.concatenate(temperaturas),
+                              np.array([len(t) for t in tiempos]),
+                              dict(zip(self.parametros, tabla.T)), np.array(semillas))
+
+    def agregar_lote(self, tiempos: np.ndarray, temperaturas: np.ndarray, longitudes: Optional[np.ndarray] = None,
+                     parametros: Union[ParameterTable, Mapping, None] = None, semilla=None):
+        """
+        Agrega un bloque de corridas guardadas como matriz (como las de BatchHeatSimulator).
+
+        Args:
+            tiempos: Tiempos comunes (1-D) o uno por corrida (misma forma que temperaturas)
+            temperaturas: Matriz (corridas, pasos); cada fila vale hasta su longitud
+            longitudes: Puntos válidos de cada fila (por defecto, los que no son NaN)
+            parametros: Diccionario {parámetro: escalar o array por corrida} o ParameterTable
+            semilla: Índices de las semillas hijas, uno por corrida (None = corridas deterministas)
+        """
+        self._vaciar()
+        temperaturas = np.asarray(temperaturas)
+        if temperaturas.ndim != 2:
+            raise ValueError("temperaturas debe ser una matriz (corridas, pasos)")
+        n, n_pasos = temperaturas.shape
+        if longitudes is None:
+            longitudes = np.count_nonzero(~np.isnan(temperaturas), axis=1)
+        longitudes = np.asarray(longitudes, dtype=np.int64)
+
+        validos = np.arange(n_pasos) < longitudes[:, None]
+        tiempos = np.broadcast_to(np.asarray(tiempos)[..., :n_pasos], temperaturas.shape)
+        self._escribir_bloque(tiempos[validos], temperaturas[validos], longitudes,
+                              self._columnas(parametros, n), semilla)
+
+    def _escribir_bloque(self, tiempos: np.ndarray, temperaturas: np.ndarray, longitudes: np.ndarray,
+                         columnas: Dict[str, np.ndarray], semilla):
+        n = len(longitudes)
+        semillas = np.broadcast_to(np.asarray(-1 if semilla is None else semilla, dtype=np.int64), (n,))
+
+        tiempos.astype(self.dtype, copy=False).tofile(self._archivos['tiempos'])
+        temperaturas.astype(self.dtype, copy=False).tofile(self._archivos['temperaturas'])
+        semillas.tofile(self._archivos['semillas'])
+        for nombre, columna in columnas.items():
+            np.ascontiguousarray(columna).tofile(self._archivos[f"parametro_{nombre}"])
+        for nombre, archivo in self._archivos.items():
+            if nombre != 'desplazamientos':
+                archivo.flush()
+
+        # Los desplazamientos van últimos: confirman las corridas del bloque
+        (self.n_puntos + np.cumsum(longitudes)).astype(np.int64).tofile(self._archivos['desplazamientos'])
+        self._archivos['desplazamientos'].flush()
+        self.n_corridas += n
+        self.n_puntos += int(np.sum(longitudes))
+
+    def cerrar(self):
+        """Cierra los archivos y marca el archivo de resultados como completo."""
+        if self._archivos is None:
+            return
+        self._vaciar()
+        for archivo in self._archivos.values():
+            archivo.close()
+        self._archivos = None
+        self._escribir_metadatos(completo=True)
+
+    def __enter__(self) -> 'EscritorResultados':
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+
+class LectorResultados:
+    """
+    Lee un archivo de resultados sin cargarlo en memoria.
+
+    tiempos, temperaturas, desplazamientos, semillas y las columnas de
+    parametros son memmaps de solo lectura; lector[i] devuelve vistas de la
+    corrida i. Si el archivo quedó incompleto se leen las corridas confirmadas.
+    """
+
+    def __init__(self, directorio: str):
+        """
+        Args:
+            directorio: Carpeta escrita por EscritorResultados
+        """
+        self.directorio = os.path.abspath(directorio)
+        ruta = os.path.join(self.directorio, ARCHIVO_METADATOS)
+        if not os.path.exists(ruta):
+            raise FileNotFoundError(f"No hay un archivo de resultados en {self.directorio}")
+        with open(ruta, encoding='utf-8') as f:
+            contenido = json.load(f)
+        if contenido['version'] != VERSION:
+            raise ValueError(f"Versión de archivo de resultados no admitida: {contenido['version']}")
+
+        self.dtype = np.dtype(contenido['dtype'])
+        self.completo = contenido['completo']
+        self.metadatos = contenido['metadatos']
+
+        ruta_desplazamientos = os.path.join(self.directorio, 'desplazamientos.bin')
+        n_desplazamientos = os.path.getsize(ruta_desplazamientos) // 8
+        self.desplazamientos = _memmap(ruta_desplazamientos, np.int64, n_desplazamientos)
+        self.n_corridas = n_desplazamientos - 1
+        self.n_puntos = int(self.desplazamientos[-1])
+
+        self.tiempos = _memmap(os.path.join(self.directorio, 'tiempos.bin'), self.dtype, self.n_puntos)
+        self.temperaturas = _memmap(os.path.join(self.directorio, 'temperaturas.bin'), self.dtype, self.n_puntos)
+        self.semillas = _memmap(os.path.join(self.directorio, 'semillas.bin'), np.int64, self.n_corridas)
+        self.parametros = {nombre: _memmap(_ruta_parametro(self.directorio, nombre), np.float64, self.n_corridas)
+                           for nombre in contenido['parametros']}
+
+    def __len__(self) -> int:
+        return self.n_corridas
+
+    def __getitem__(self, i: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Tiempos y temperaturas de la corrida i (vistas, sin copia)."""
+        if not -self.n_corridas <= i < self.n_corridas:
+            raise IndexError(f"Corrida {i} fuera de rango (hay {self.n_corridas})")
+        i %= self.n_corridas
+        inicio, fin = self.desplazamientos[i], self.desplazamientos[i + 1]
+        return self.tiempos[inicio:fin], self.temperaturas[inicio:fin]
+
+    def __iter__(self) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        for i in range(self.n_corridas):
+            yield self[i]
+
+    @property
+    def longitudes(self) -> np.ndarray:
+        """Puntos de cada corrida."""
+        return np.diff(self.desplazamientos)
+
+    def generador(self, i: int) -> np.random.Generator:
+        """
+        Generador con el que se simuló la corrida i, para reproducirla por separado.
+
+        Raises:
+            ValueError: Si la corrida es determinista o falta la entropía de la campaña
+        """
+        if self.semillas[i] < 0 or 'entropia' not in self.metadatos:
+            raise ValueError(f"La corrida {i} no tiene una semilla reproducible")
+        hija = np.random.SeedSequence(self.metadatos['entropia'], spawn_key=(int(self.semillas[i]),))
+        return np.random.default_rng(hija)
+
+    def temperaturas_finales(self) -> np.ndarray:
+        """Última temperatura de cada corrida (lee solo esas posiciones del disco)."""
+        return np.asarray(self.temperaturas[self.desplazamientos[1:] - 1])
+
+    def bloques(self, corridas_por_bloque: int = 10_000) -> Iterator[Tuple[int, np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Recorre el archivo de a varias corridas, para análisis que no entran en memoria.
+
+        Yields:
+            Tuplas (primera corrida, tiempos, temperaturas, desplazamientos): las
+            columnas del bloque como vistas y sus desplazamientos relativos al bloque
+        """
+        for inicio in range(0, self.n_corridas, corridas_por_bloque):
+            fin = min(inicio + corridas_por_bloque, self.n_corridas)
+            desplazamientos = np.asarray(self.desplazamientos[inicio:fin + 1])
+            a, b = desplazamientos[0], desplazamientos[-1]
+            yield inicio, self.tiempos[a:b], self.temperaturas[a:b], desplazamientos - a
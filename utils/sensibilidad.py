@@ -0,0 +1,161 @@
+"""
+Análisis de sensibilidad global: índices de Sobol de primer orden y totales.
+
+Indica qué fracción de la varianza de una salida (tiempo hasta 100°C,
+temperatura final) se debe a cada parámetro del calentador, solo o en
+interacción con los demás. Usa el esquema de muestreo de Saltelli sobre una
+secuencia de Sobol y evalúa el modelo analítico en lotes vectorizados, así que
+cientos de miles de evaluaciones llevan pocos segundos.
+"""
+from statistics import NormalDist
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from utils.heat_simulation import (
+    HeatSimulationParameters,
+    ParameterDistribution,
+    ParameterTable,
+    temperatura_analitica,
+    tiempo_analitico_hasta,
+)
+from utils.muestreo import sobol, SOBOL_MAX_DIMENSIONES
+
+# Tolerancias de fabricación y de uso: las de TP4 más masa y aislación
+DISTRIBUCIONES_SENSIBILIDAD = dict(ParameterDistribution.DISTRIBUCIONES)
+DISTRIBUCIONES_SENSIBILIDAD.update({
+    'masa': ('uniforme', 0.9, 1.1),
+    'espesor_poliuretano': ('uniforme', 0.0008, 0.0012),
+})
+
+
+def modelo_calentador(muestra: Dict[str, np.ndarray], tiempo_total: float = 2500,
+                      base: Optional[HeatSimulationParameters] = None) -> Dict[str, np.ndarray]:
+    """
+    Evalúa el calentador sin eventos con la solución analítica, vectorizada.
+
+    Los parámetros que no están en la muestra se toman de base. La potencia se
+    calcula como tension² / resistencia si la muestra incluye alguno de los dos
+    y el coeficiente de pérdidas sale de la ParameterTable de la muestra.
+
+    Args:
+        muestra: Diccionario {parámetro: array de valores}
+        tiempo_total: Horizonte de la simulación (s)
+        base: Parámetros por defecto
+
+    Returns:
+        Diccionario con:
+            - tiempo_100c: tiempo hasta 100°C, acotado a tiempo_total si no llega
+            - T_final: temperatura al final del horizonte
+    """
+    base = HeatSimulationParameters() if base is None else base
+    columnas = base.como_dict()
+    columnas.update(muestra)
+    tabla = ParameterTable(**columnas)
+    if 'tension' in muestra or 'resistencia' in muestra:
+        tabla = tabla.con_potencia_desde_tension()
+
+    argumentos = (tabla.masa, tabla.calor_especifico, tabla.potencia, tabla.coef_perdidas,
+                  tabla.T_amb, tabla.T_inicial)
+    return {
+        'tiempo_100c': np.minimum(tiempo_analitico_hasta(100.0, *argumentos), tiempo_total),
+        'T_final': temperatura_analitica(tiempo_total, *argumentos),
+    }
+
+
+def _evaluar(modelo: Callable, unitarios: np.ndarray, parametros: List[str],
+             distribuciones: Dict[str, Tuple], tam_lote: int) -> Dict[str, np.ndarray]:
+    """Evalúa el modelo sobre puntos del hipercubo unitario, de a tam_lote filas."""
+    partes = []
+    for inicio in range(0, unitarios.shape[0], tam_lote):
+        muestra = ParameterDistribution.transformar(unitarios[inicio:inicio + tam_lote], parametros, distribuciones)
+        partes.append(modelo(muestra))
+    return {salida: np.concatenate([np.broadcast_to(p[salida], (len(p[salida]),)) for p in partes])
+            for salida in partes[0]}
+
+
+def _indices(f_A: np.ndarray, f_B: np.ndarray, f_AB: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Estimadores de Saltelli (2010) para primer orden y de Jansen para el total.
+
+    Los arrays pueden tener dimensiones iniciales extra (réplicas bootstrap);
+    la última es la de las muestras y f_AB tiene una fila por parámetro antes
+    de ella.
+    """
+    varianza = np.var(np.concatenate([f_A, f_B], axis=-1), axis=-1)[..., None]
+    f_A, f_B = f_A[..., None, :], f_B[..., None, :]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        primer_orden = np.mean(f_B * (f_AB - f_A), axis=-1) / varianza
+        total = 0.5 * np.mean((f_A - f_AB) ** 2, axis=-1) / varianza
+    return primer_orden, total
+
+
+def indices_sobol(modelo: Callable[[Dict[str, np.ndarray]], Dict[str, np.ndarray]] = modelo_calentador,
+                  parametros: Optional[List[str]] = None,
+                  n: int = 2**14,
+                  distribuciones: Optional[Dict[str, Tuple]] = None,
+                  n_bootstrap: int = 100,
+                  confianza: float = 0.95,
+                  tam_lote: int = 2**16,
+                  rng=None) -> Dict:
+    """
+    Calcula los índices de Sobol de primer orden (S1) y totales (ST).
+
+    Con el esquema de Saltelli se evalúan n·(d + 2) puntos: dos matrices base A
+    y B (las dos mitades de una secuencia de Sobol de 2d dimensiones) y, para
+    cada parámetro i, la matriz A con la columna i tomada de B. S1 mide el
+    efecto del parámetro solo y ST incluye sus interacciones; ST ≈ 0 indica que
+    su tolerancia no importa.
+
+    Args:
+        modelo: Función vectorizada {parámetro: array} -> {salida: array}
+        parametros: Parámetros a analizar (por defecto, todos los de distribuciones)
+        n: Muestras base (potencia de 2)
+        distribuciones: Distribución de cada parámetro (por defecto, DISTRIBUCIONES_SENSIBILIDAD)
+        n_bootstrap: Réplicas bootstrap para los intervalos de confianza (0 = sin intervalos)
+        confianza: Nivel de confianza de los intervalos
+        tam_lote: Evaluaciones del modelo por lote
+        rng: Generador o semilla
+
+    Returns:
+        Diccionario con 'parametros', 'n_evaluaciones' y, por cada salida del
+        modelo, un diccionario con los arrays 'S1', 'ST' y sus semi-anchos de
+        intervalo 'S1_ic', 'ST_ic' (NaN sin bootstrap)
+    """
+    tabla = DISTRIBUCIONES_SENSIBILIDAD if distribuciones is None else distribuciones
+    parametros = list(parametros or tabla)
+    d = len(parametros)
+    if 2 * d > SOBOL_MAX_DIMENSIONES:
+        raise ValueError(f"Se admiten hasta {SOBOL_MAX_DIMENSIONES // 2} parámetros")
+
+    rng = np.random.default_rng(rng)
+    puntos = sobol(n, 2 * d, rng=rng)
+    A, B = puntos[:, :d], puntos[:, d:]
+
+    # Filas: A, B y luego A con la columna i de B, para cada i
+    AB = np.repeat(A[None], d, axis=0)
+    AB[np.arange(d), :, np.arange(d)] = B.T
+    unitarios = np.concatenate([A, B, AB.reshape(d * n, d)])
+
+    salidas = _evaluar(modelo, unitarios, parametros, tabla, tam_lote)
+    z = NormalDist().inv_cdf((1 + confianza) / 2)
+
+    resultado = {'parametros': parametros, 'n_evaluaciones': unitarios.shape[0]}
+    for nombre, valores in salidas.items():
+        f_A, f_B, f_AB = valores[:n], valores[n:2 * n], valores[2 * n:].reshape(d, n)
+        primer_orden, total = _indices(f_A, f_B, f_AB)
+
+        primer_orden_ic = total_ic = np.full(d, np.nan)
+        if n_bootstrap > 0:
+            remuestreo = rng.integers(0, n, size=(n_bootstrap, n))
+            primer_orden_b, total_b = _indices(f_A[remuestreo], f_B[remuestreo], f_AB[:, remuestreo].transpose(1, 0, 2))
+            primer_orden_ic = z * np.std(primer_orden_b, axis=0)
+            total_ic = z * np.std(total_b, axis=0)
+
+        resultado[nombre] = {
+            'S1': primer_orden,
+            'ST': total,
+            'S1_ic': primer_orden_ic,
+            'ST_ic': total_ic,
+        }
+    return resultado
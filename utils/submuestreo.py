@@ -0,0 +1,198 @@
+"""
+Submuestreo de curvas para graficar: Largest-Triangle-Three-Buckets (LTTB).
+
+Una curva de miles de puntos se dibuja igual con tantos puntos como píxeles
+tiene el eje. LTTB divide la curva en baldes y de cada uno conserva el punto
+que forma el triángulo de mayor área con el punto elegido en el balde anterior
+y el promedio del siguiente, así que se preservan picos y caídas (por ejemplo,
+los eventos estocásticos del TP5). Se procesan muchas curvas a la vez: el bucle
+es sobre los baldes y cada operación es vectorizada sobre las curvas.
+"""
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+
+def matriz_de_curvas(curvas: Sequence[Tuple[Sequence[float], Sequence[float]]]
+                     ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Junta curvas de distinta longitud en una matriz rellena con NaN.
+
+    Si las abscisas de todas las curvas son prefijos de las de la más larga
+    (simulaciones con el mismo dt), se devuelven una sola vez, que es el caso
+    rápido de lttb_lote.
+
+    Args:
+        curvas: Secuencia de pares (x, y)
+
+    Returns:
+        Tupla (x, y, longitudes): x de forma (n,) si es común o (curvas, n) si
+        no, e y de forma (curvas, n), con n la longitud máxima
+    """
+    longitudes = np.array([len(y) for _, y in curvas], dtype=np.int64)
+    n = int(longitudes.max(initial=0))
+    x = np.full((len(curvas), n), np.nan)
+    y = np.full_like(x, np.nan)
+    for i, (xi, yi) in enumerate(curvas):
+        x[i, :longitudes[i]] = xi
+        y[i, :longitudes[i]] = yi
+
+    if len(curvas) > 0:
+        comun = x[int(np.argmax(longitudes))]
+        if all(np.array_equal(x[i, :L], comun[:L]) for i, L in enumerate(longitudes)):
+            return comun, y, longitudes
+    return x, y, longitudes
+
+
+def _baldes(n, i: int, cada) -> Tuple:
+    """Límites [inicio, fin) del balde i y fin del balde siguiente (escalares o arrays)."""
+    inicio = np.floor(i * cada).astype(np.int64) + 1
+    fin = np.floor((i + 1) * cada).astype(np.int64) + 1
+    fin_siguiente = np.minimum(np.floor((i + 2) * cada).astype(np.int64) + 1, n)
+    return inicio, fin, fin_siguiente
+
+
+def _lttb_abscisas_comunes(x: np.ndarray, y: np.ndarray, longitudes: np.ndarray, n_salida: int) -> np.ndarray:
+    """
+    LTTB con abscisas compartidas: los baldes son los mismos intervalos de x
+    (columnas de píxeles) para todas las curvas, así que cada balde es una
+    rebanada contigua de la matriz.
+
+    Las curvas más cortas se extienden repitiendo su último punto; en esa zona
+    todos los baldes eligen ese punto, que es donde la curva termina.
+    """
+    m, n = y.shape
+    filas = np.arange(m)
+    # Transpuesta contigua: cada balde son filas consecutivas en memoria
+    extendida = np.arange(n)[:, None] >= longitudes
+    yt = np.where(extendida, y[filas, longitudes - 1], y.T)
+
+    seleccion = np.empty((m, n_salida), dtype=np.int64)
+    seleccion[:, 0] = 0
+    seleccion[:, -1] = n - 1
+    anterior = np.zeros(m, dtype=np.int64)
+    cada = (n - 2) / (n_salida - 2)
+
+    for i in range(n_salida - 2):
+        inicio, fin, fin_siguiente = (int(v) for v in _baldes(n, i, cada))
+        promedio_x = x[fin:fin_siguiente].mean()
+        promedio_y = yt[fin:fin_siguiente].mean(axis=0)
+
+        ax, ay = x[anterior], yt[anterior, filas]
+        area = np.abs((ax - promedio_x) * (yt[inicio:fin] - ay) -
+                      (ax - x[inicio:fin, None]) * (promedio_y - ay))
+        anterior = inicio + np.argmax(area, axis=0)
+        seleccion[:, i + 1] = anterior
+
+    return np.minimum(seleccion, longitudes[:, None] - 1)
+
+
+def _lttb_por_curva(x: np.ndarray, y: np.ndarray, longitudes: np.ndarray, n_salida: int) -> np.ndarray:
+    """
+    LTTB clásico con abscisas propias de cada curva: los baldes reparten los
+    puntos válidos de cada una, así que sus límites varían por curva y los
+    candidatos se toman con índices (más lento que con abscisas comunes).
+    """
+    m, n = y.shape
+    seleccion = np.minimum(np.arange(n_salida), longitudes[:, None] - 1)
+
+    largas = np.flatnonzero(longitudes > n_salida)
+    if largas.size == 0:
+        return seleccion
+    xl, yl, L = x[largas], y[largas], longitudes[largas]
+    filas = np.arange(largas.size)
+    cada = (L - 2) / (n_salida - 2)
+
+    # Sumas acumuladas para promediar cualquier balde en O(1)
+    suma_x = np.zeros((largas.size, n + 1))
+    suma_y = np.zeros((largas.size, n + 1))
+    np.cumsum(np.nan_to_num(xl), axis=1, out=suma_x[:, 1:])
+    np.cumsum(np.nan_to_num(yl), axis=1, out=suma_y[:, 1:])
+
+    elegidos = np.empty((largas.size, n_salida), dtype=np.int64)
+    elegidos[:, 0] = 0
+    elegidos[:, -1] = L - 1
+    anterior = np.zeros(largas.size, dtype=np.int64)
+    ancho = int(np.ceil(cada.max())) + 1
+
+    for i in range(n_salida - 2):
+        inicio, fin, fin_siguiente = _baldes(L, i, cada)
+        cantidad = np.maximum(fin_siguiente - fin, 1)
+        promedio_x = (suma_x[filas, fin_siguiente] - suma_x[filas, fin]) / cantidad
+        promedio_y = (suma_y[filas, fin_siguiente] - suma_y[filas, fin]) / cantidad
+
+        # Candidatos del balde actual (ancho variable: se enmascaran los sobrantes)
+        columnas = inicio[:, None] + np.arange(ancho)
+        validas = columnas < fin[:, None]
+        columnas = np.minimum(columnas, L[:, None] - 1)
+        px = np.take_along_axis(xl, columnas, axis=1)
+        py = np.take_along_axis(yl, columnas, axis=1)
+
+        ax, ay = xl[filas, anterior], yl[filas, anterior]
+        area = np.abs((ax - promedio_x)[:, None] * (py - ay[:, None]) -
+                      (ax[:, None] - px) * (promedio_y - ay)[:, None])
+        area[~validas] = -1.0
+        anterior = columnas[filas, np.argmax(area, axis=1)]
+        elegidos[:, i + 1] = anterior
+
+    seleccion[largas] = elegidos
+    return seleccion
+
+
+def lttb_lote(x, y, n_salida: int, longitudes: Optional[Sequence[int]] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Submuestrea muchas curvas a n_salida puntos cada una con LTTB.
+
+    Con abscisas comunes (el caso de BatchHeatSimulator) los baldes son los
+    mismos intervalos de x para todas las curvas y el cálculo es mucho más
+    rápido; con abscisas por curva los baldes reparten los puntos de cada una.
+
+    Args:
+        x: Abscisas comunes (n,) o por curva (curvas, n)
+        y: Ordenadas (curvas, n)
+        n_salida: Puntos por curva (al menos 3)
+        longitudes: Puntos válidos de cada curva (por defecto, n); lo que sigue
+            se ignora, así que sirven las matrices rellenas con NaN de
+            BatchHeatSimulator
+
+    Returns:
+        Tupla (x, y) de forma (curvas, n_salida). Las curvas que terminan antes
+        se completan repitiendo su último punto.
+    """
+    if n_salida < 3:
+        raise ValueError("n_salida debe ser al menos 3")
+
+    y = np.atleast_2d(np.asarray(y, dtype=np.float64))
+    m, n = y.shape
+    x = np.asarray(x, dtype=np.float64)
+    longitudes = np.full(m, n, dtype=np.int64) if longitudes is None else np.asarray(longitudes, dtype=np.int64)
+    if np.any(longitudes < 1) or np.any(longitudes > n):
+        raise ValueError("Cada curva debe tener entre 1 y n puntos")
+
+    if x.ndim == 1 and n > n_salida:
+        seleccion = _lttb_abscisas_comunes(x, y, longitudes, n_salida)
+    else:
+        x = np.broadcast_to(x, (m, n))
+        seleccion = _lttb_por_curva(x, y, longitudes, n_salida)
+
+    x = np.broadcast_to(x, (m, n))
+    return np.take_along_axis(x, seleccion, axis=1), np.take_along_axis(y, seleccion, axis=1)
+
+
+def lttb(x, y, n_salida: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Submuestrea una curva a n_salida puntos con LTTB.
+
+    Args:
+        x: Abscisas (n,)
+        y: Ordenadas (n,)
+        n_salida: Puntos de salida (al menos 3)
+
+    Returns:
+        Tupla (x, y) con a lo sumo n_salida puntos (la curva entera si es más corta)
+    """
+    y = np.asarray(y, dtype=np.float64)
+    if len(y) <= n_salida:
+        return np.asarray(x, dtype=np.float64), y
+    xs, ys = lttb_lote(x, y[None, :], n_salida)
+    return xs[0], ys[0]